@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from v1indicators.trend import adx
+from v1indicators.trend import ADXStream, adx
 
 def test_adx_basic():
     """Test ADX with synthetic trend data."""
@@ -31,3 +32,18 @@ def test_adx_basic():
     last_row = result.iloc[-1]
     assert last_row['DMP_2'] > last_row['DMN_2']
     assert last_row['ADX_2'] > 50  # Strong trend
+
+
+def test_adx_stream_matches_batch():
+    rng = np.random.default_rng(9)
+    close = pd.Series(rng.normal(0.0, 1.0, 200).cumsum() + 100.0)
+    high = close + np.abs(rng.normal(0.5, 0.2, 200))
+    low = close - np.abs(rng.normal(0.5, 0.2, 200))
+    expected = adx(high, low, close, length=14)
+
+    stream = ADXStream(high.iloc[:60], low.iloc[:60], close.iloc[:60], length=14)
+    pushed = [stream.update(h, l, c) for h, l, c in zip(high.iloc[60:90], low.iloc[60:90], close.iloc[60:90])]
+    batch = stream.update_many(high.iloc[90:], low.iloc[90:], close.iloc[90:])
+
+    np.testing.assert_array_equal(np.asarray(pushed), expected.to_numpy()[60:90])
+    pd.testing.assert_frame_equal(batch, expected.iloc[90:])
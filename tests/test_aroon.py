@@ -43,6 +43,20 @@ def test_aroon_components_and_oscillator():
     pd.testing.assert_series_equal(primary, expected_osc)
 
 
+def test_aroon_ties_and_missing_windows():
+    rng = np.random.default_rng(9)
+    high = pd.Series(rng.integers(0, 5, 200).astype(float))
+    high.iloc[[40, 41, 150]] = np.nan
+
+    expected = _aroon_up_expected(high, 6)
+    expected.name = "AROON_UP_6"
+    pd.testing.assert_series_equal(aroon_up(high, length=6), expected)
+
+    expected = _aroon_down_expected(high, 6)
+    expected.name = "AROON_DOWN_6"
+    pd.testing.assert_series_equal(aroon_down(high, length=6), expected)
+
+
 def test_aroon_short_series_all_nan():
     high = pd.Series([1.0, 2.0])
     low = pd.Series([1.0, 0.5])
@@ -1,5 +1,9 @@
+import numpy as np
 import pandas as pd
-from v1indicators.volatility import atr
+import pytest
+
+from v1indicators.foundational.volatility.true_range import _true_range
+from v1indicators.volatility import ATRStream, atr, atr_panel, atr_sweep, true_range
 
 def test_atr_basic():
     """Test ATR with simple data."""
@@ -21,3 +25,87 @@ def test_atr_basic():
     # First value is just TR
     # Next is alpha * tr + (1-alpha) * prev_ema
     # For length 2, alpha = 1/2 = 0.5
+
+
+def test_atr_stream_matches_batch():
+    rng = np.random.default_rng(5)
+    close = pd.Series(rng.normal(0.0, 1.0, 300).cumsum() + 100.0)
+    high = close + np.abs(rng.normal(0.5, 0.2, 300))
+    low = close - np.abs(rng.normal(0.5, 0.2, 300))
+    high.iloc[[30, 31]] = np.nan
+    high.iloc[[40, 120, 200]] = np.inf
+    close.iloc[210] = -np.inf
+
+    for mamode, drift in (("ema", 1), ("sma", 1), ("ema", 3)):
+        expected = atr(high, low, close, length=14, mamode=mamode, drift=drift)
+        stream = ATRStream(
+            high.iloc[:100], low.iloc[:100], close.iloc[:100], length=14, mamode=mamode, drift=drift
+        )
+        pushed = [
+            stream.update(h, l, c)
+            for h, l, c in zip(high.iloc[100:150], low.iloc[100:150], close.iloc[100:150])
+        ]
+        batch = stream.update_many(high.iloc[150:], low.iloc[150:], close.iloc[150:])
+
+        np.testing.assert_array_equal(np.asarray(pushed), expected.to_numpy()[100:150])
+        pd.testing.assert_series_equal(batch, expected.iloc[150:])
+
+
+def test_atr_stream_requires_full_history():
+    with pytest.raises(ValueError):
+        ATRStream(pd.Series([1.0]), None, pd.Series([1.0]))
+
+
+def test_true_range_primitive_matches_row_max():
+    rng = np.random.default_rng(9)
+    close = pd.Series(rng.normal(0.0, 1.0, 200).cumsum() + 100.0)
+    high = close + np.abs(rng.normal(0.5, 0.2, 200))
+    low = close - np.abs(rng.normal(0.5, 0.2, 200))
+    high.iloc[[10, 11]] = np.nan
+    low.iloc[11] = np.nan
+    close.iloc[40] = np.nan
+
+    for drift in (1, 3):
+        prev_close = close.shift(drift)
+        expected = pd.concat(
+            [high - low, (high - prev_close).abs(), (low - prev_close).abs()],
+            axis=1,
+        ).max(axis=1)
+        pd.testing.assert_series_equal(_true_range(high, low, close, drift), expected)
+
+    assert true_range(high, low, close).name == "TRUERANGE_1"
+    assert np.isnan(_true_range(high, low, close).iloc[11])
+
+
+def test_atr_sweep_matches_single_lengths():
+    rng = np.random.default_rng(26)
+    close = pd.Series(rng.normal(0.0, 1.0, 400).cumsum() + 100.0)
+    high = close + np.abs(rng.normal(0.5, 0.2, 400))
+    low = close - np.abs(rng.normal(0.5, 0.2, 400))
+    close.iloc[[30, 31]] = np.nan
+    lengths = [1, 5, 14, 50]
+
+    for mamode in ("ema", "sma"):
+        for drift in (1, 2):
+            expected = pd.concat([atr(high, low, close, n, mamode=mamode, drift=drift) for n in lengths], axis=1)
+            result = atr_sweep(high, low, close, lengths, mamode=mamode, drift=drift)
+            pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("mamode", ["ema", "sma"])
+def test_atr_panel_matches_single_columns(mamode):
+    rng = np.random.default_rng(25)
+    close = 100.0 + rng.normal(0.0, 1.0, (150, 3)).cumsum(axis=0)
+    high = close + np.abs(rng.normal(0.5, 0.2, close.shape))
+    low = close - np.abs(rng.normal(0.5, 0.2, close.shape))
+    close[:25, 2] = np.nan
+    high[90, 0] = np.inf
+
+    result = atr_panel(high, low, close, 14, mamode)
+
+    for j in range(close.shape[1]):
+        expected = atr(pd.Series(high[:, j]), pd.Series(low[:, j]), pd.Series(close[:, j]), 14, mamode)
+        np.testing.assert_array_equal(result[:, j], expected.to_numpy())
+
+    with pytest.raises(ValueError):
+        atr_panel(high[:, :2], low, close)
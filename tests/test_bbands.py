@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from v1indicators.overlap import bbands, bbands_sweep
+
+
+def test_bbands_sweep_matches_single_lengths():
+    rng = np.random.default_rng(27)
+    data = pd.Series(rng.normal(0.0, 1.0, 600).cumsum() + 100.0)
+    data.iloc[[40, 41, 42]] = np.nan
+    data.iloc[100] = np.inf
+    data.iloc[200] = 1e9
+    data.iloc[300:330] = data.iloc[300]
+    lengths = [1, 2, 3, 20, 50]
+
+    result = bbands_sweep(data, lengths, mult=2.5)
+
+    expected = pd.concat({n: bbands(data, n, mult=2.5) for n in lengths}, axis=1, names=["length", None])
+    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(result[20], bbands(data, 20, mult=2.5))
+
+
+def test_bbands_sweep_input_validation():
+    with pytest.raises(ValueError):
+        bbands_sweep(pd.Series([1.0, 2.0]), [[2, 3]])
+
+    with pytest.raises(TypeError):
+        bbands_sweep([1.0, 2.0], [2])
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -47,3 +48,19 @@ def test_candlestick_patterns_extended_input_validation():
 
     with pytest.raises(TypeError):
         candlestick_patterns_extended([1.0, 2.0], s, s, s)
+
+
+def test_candlestick_patterns_extended_bitmask_matches_frame():
+    rng = np.random.default_rng(12)
+    open_ = pd.Series(rng.integers(95, 105, 400).astype(float))
+    close = pd.Series(rng.integers(95, 105, 400).astype(float))
+    high = np.maximum(open_, close) + rng.integers(0, 3, 400)
+    low = np.minimum(open_, close) - rng.integers(0, 3, 400)
+
+    frame = candlestick_patterns_extended(open_, high, low, close)
+    bits = candlestick_patterns_extended(open_, high, low, close, bitmask=True)
+
+    assert bits.name == "CDL_PATTERNS_EXT"
+    assert bits.dtype == np.int32
+    for k, column in enumerate(frame.columns):
+        pd.testing.assert_series_equal((bits & (1 << k)) != 0, frame[column], check_names=False)
@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+
+from v1indicators.momentum import cdl_doji, cdl_inside
+
+
+def test_cdl_doji_flags_small_bodies():
+    open_ = pd.Series([10.0, 10.0, 10.0, 10.0])
+    high = pd.Series([11.0, 11.0, 10.0, 12.0])
+    low = pd.Series([9.0, 9.0, 10.0, 8.0])
+    close = pd.Series([10.1, 10.8, 10.0, 11.0])
+
+    out = cdl_doji(open_, high, low, close, factor=0.1)
+
+    # A bar without range is not a doji.
+    assert out.tolist() == [1, 0, 0, 0]
+    assert out.name == "CDL_DOJI"
+
+
+def test_cdl_inside_flags_contained_bars():
+    high = pd.Series([12.0, 11.5, 11.8, 13.0])
+    low = pd.Series([9.0, 9.5, 9.2, 9.4])
+
+    assert cdl_inside(high, low).tolist() == [0, 1, 0, 0]
+    assert cdl_inside(high, low, asbool=True).tolist() == [False, True, False, False]
+
+
+def test_cdl_doji_input_validation():
+    s = pd.Series([1.0, 2.0])
+
+    with pytest.raises(ValueError):
+        cdl_doji(s, s, s, s, factor=0.0)
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from v1indicators import atr, compute, ema, keltner, precision_confluence, rsi, supertrend
+
+
+def _frame(n=300):
+    rng = np.random.default_rng(22)
+    close = 100.0 + rng.normal(0.0, 1.0, n).cumsum()
+    return pd.DataFrame(
+        {
+            "open": np.r_[close[0], close[:-1]],
+            "high": close + np.abs(rng.normal(0.5, 0.2, n)),
+            "low": close - np.abs(rng.normal(0.5, 0.2, n)),
+            "close": close,
+            "volume": rng.integers(100, 2000, n).astype(float),
+        }
+    )
+
+
+def test_compute_matches_direct_calls():
+    df = _frame()
+
+    result = compute(
+        df,
+        [
+            "rsi",
+            ("atr", {"length": 20}),
+            ("ema", {"length": 13, "close": "open"}),
+            "keltner",
+            "supertrend",
+            "precision_confluence",
+        ],
+    )
+
+    expected = pd.concat(
+        [
+            rsi(df["close"]),
+            atr(df["high"], df["low"], df["close"], length=20),
+            ema(df["open"], 13),
+            keltner(df["high"], df["low"], df["close"]),
+            supertrend(df["high"], df["low"], df["close"]),
+            precision_confluence(df["open"], df["high"], df["low"], df["close"], df["volume"]),
+        ],
+        axis=1,
+    )
+    for column, values in expected.items():
+        if pd.api.types.is_bool_dtype(values.dtype) or pd.api.types.is_numeric_dtype(values.dtype):
+            expected[column] = values.astype(np.float64)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert result["RSI_14"].dtype == np.float64
+    assert result["PC_PROFILE"].iloc[0] == "default"
+
+
+def test_compute_runs_identical_specs_once():
+    df = _frame()
+
+    result = compute(df, ["rsi", ("rsi", {"length": 14}), ("rsi", {"close": "close"})])
+
+    assert list(result.columns) == ["RSI_14"]
+
+
+def test_compute_input_validation():
+    df = _frame()
+
+    with pytest.raises(ValueError):
+        compute(df, ["not_an_indicator"])
+    with pytest.raises(ValueError):
+        compute(df, [("rsi", {"span": 3})])
+    with pytest.raises(ValueError):
+        compute(df, [("rsi", {"close": "missing"})])
+    with pytest.raises(ValueError):
+        compute(df[["close"]], ["atr"])
+    with pytest.raises(ValueError):
+        compute(df, ["rsi", ("rsi", {"close": "open"})])
+    with pytest.raises(ValueError, match="^ema: missing a required argument: 'length'"):
+        compute(df, ["ema"])
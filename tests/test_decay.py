@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from v1indicators.trend import decay
+
+
+def test_decay_linear_matches_weighted_window_max():
+    rng = np.random.default_rng(2)
+    signal = pd.Series(rng.choice([0.0, 0.0, 0.0, 1.0, np.nan], 400))
+
+    for length in (1, 5, 12):
+        w = np.linspace(1.0, 0.0, length, endpoint=False)
+        trigger = (signal.fillna(0.0) > 0.0).astype(float)
+        expected = trigger.rolling(length).apply(lambda x: np.max(x * w[::-1]), raw=True).fillna(0.0)
+        expected.name = f"DECAY_linear_{length}"
+
+        pd.testing.assert_series_equal(decay(signal, length), expected, rtol=0, atol=0)
+
+
+def test_decay_input_validation():
+    with pytest.raises(ValueError):
+        decay(pd.Series([1.0, 0.0]), length=0)
+
+    with pytest.raises(ValueError):
+        decay(pd.Series([1.0, 0.0]), mode="step")
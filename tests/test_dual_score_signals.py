@@ -1,9 +1,10 @@
+import pickle
 import numpy as np
 import pandas as pd
 import pytest
 from typing import Any, cast
 
-from v1indicators.trend import dual_score_signals
+from v1indicators.trend import DualScoreSignalsStream, dual_score_signals
 
 
 def _ohlcv(n: int = 240) -> pd.DataFrame:
@@ -50,3 +51,20 @@ def test_dual_score_signals_validation():
         dual_score_signals(s, s, s, s, s, atr_multiplier=0)
     with pytest.raises(TypeError):
         dual_score_signals(cast(Any, [1.0, 2.0]), s, s, s, s)
+
+
+@pytest.mark.parametrize("mtf_step", [1, 5])
+def test_dual_score_signals_stream_matches_batch_prefix(mtf_step):
+    df = _ohlcv(200)
+    cols = ["open", "high", "low", "close", "volume"]
+    stream = DualScoreSignalsStream(*(df[c].iloc[:121] for c in cols), mtf_step=mtf_step)
+    stream = pickle.loads(pickle.dumps(stream))
+    out = stream.update_many(*(df[c].iloc[121:180] for c in cols))
+
+    for t in range(121, 180):
+        expected = dual_score_signals(*(df[c].iloc[: t + 1] for c in cols), mtf_step=mtf_step)
+        pd.testing.assert_series_equal(out.loc[t], expected.iloc[-1], check_names=False)
+
+    row = stream.update(*(df[c].iloc[180] for c in cols))
+    expected = dual_score_signals(*(df[c].iloc[:181] for c in cols), mtf_step=mtf_step)
+    assert row == pytest.approx(expected.iloc[-1].to_dict(), nan_ok=True)
@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from v1indicators.momentum import ebsw
+
+
+@pytest.mark.parametrize("length", [2, 3, 40, 300])
+def test_ebsw_matches_rolling_apply(length):
+    rng = np.random.default_rng(8)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, 800).cumsum())
+    close.iloc[[400, 401]] = np.nan
+    close.iloc[600] = np.inf
+
+    hp = close - close.rolling(length).mean()
+    phase = hp.rolling(length // 2 if length > 2 else 2).apply(
+        lambda x: np.arctan2(x.iloc[-1], np.sqrt((x * x).sum() + 1e-12)), raw=False
+    )
+    expected = np.sin(phase)
+    expected.name = f"EBSW_{length}"
+
+    pd.testing.assert_series_equal(ebsw(close, length), expected, rtol=0, atol=0)
+
+
+def test_ebsw_input_validation():
+    with pytest.raises(ValueError):
+        ebsw(pd.Series([1.0, 2.0]), length=1)
+
+    with pytest.raises(TypeError):
+        ebsw([1.0, 2.0])
@@ -1,5 +1,10 @@
+import pickle
+
+import numpy as np
 import pandas as pd
-from v1indicators.overlap import ema
+import pytest
+
+from v1indicators.overlap import EMAStream, ema, ema_panel, ema_sweep
 
 def test_ema_basic():
     """Test EMA with simple data."""
@@ -28,3 +33,88 @@ def test_ema_length_1():
     data = pd.Series([1.0, 2.0, 3.0])
     result = ema(data, length=1)
     pd.testing.assert_series_equal(result, data, check_names=False)
+
+
+def test_ema_stream_matches_batch():
+    rng = np.random.default_rng(7)
+    values = rng.normal(0.0, 1.0, 300).cumsum() + 100.0
+    values[[0, 40, 41, 150]] = np.nan
+    close = pd.Series(values)
+
+    for length in (1, 3, 14):
+        for adjust in (False, True):
+            expected = ema(close, length, adjust=adjust).to_numpy()
+            stream = EMAStream(close.iloc[:120], length, adjust=adjust)
+            pushed = [stream.update(v) for v in values[120:200]]
+            batch = stream.update_many(values[200:])
+
+            np.testing.assert_array_equal(np.asarray(pushed), expected[120:200])
+            np.testing.assert_array_equal(batch, expected[200:])
+            assert stream.value == expected[-1]
+
+
+def test_ema_stream_reads_infinities_as_missing():
+    rng = np.random.default_rng(7)
+    values = rng.normal(0.0, 1.0, 300).cumsum() + 100.0
+    values[[60, 150]] = [np.inf, -np.inf]
+    close = pd.Series(values)
+
+    expected = ema(close, 10).to_numpy()
+    stream = EMAStream(close.iloc[:120], 10)
+    pushed = [stream.update(v) for v in values[120:200]]
+    batch = stream.update_many(values[200:])
+
+    np.testing.assert_array_equal(np.asarray(pushed), expected[120:200])
+    np.testing.assert_array_equal(batch, expected[200:])
+    assert stream.value == expected[-1]
+
+
+def test_ema_stream_series_and_pickle():
+    close = pd.Series([10.0, 11.0, 12.0, 13.0, 12.5, 14.0])
+    stream = EMAStream(None, 3)
+    head = stream.update_many(close.iloc[:3])
+    assert isinstance(head, pd.Series)
+    assert head.name == "EMA_3"
+
+    resumed = pickle.loads(pickle.dumps(stream))
+    tail = resumed.update_many(close.iloc[3:])
+    pd.testing.assert_series_equal(tail, ema(close, 3).iloc[3:])
+
+    with pytest.raises(ValueError):
+        EMAStream(None, 0)
+
+
+def test_ema_sweep_matches_single_lengths():
+    rng = np.random.default_rng(23)
+    data = pd.Series(rng.normal(0.0, 1.0, 400).cumsum() + 100.0)
+    data.iloc[[50, 51, 120]] = [np.nan, np.nan, np.inf]
+    lengths = [1, 2, 9, 21, 50]
+
+    for adjust in (False, True):
+        expected = pd.concat([ema(data, n, adjust=adjust) for n in lengths], axis=1)
+        pd.testing.assert_frame_equal(ema_sweep(data, lengths, adjust=adjust), expected)
+
+    with pytest.raises(ValueError):
+        ema_sweep(data, [5, 0])
+    with pytest.raises(TypeError):
+        ema_sweep(data, [5.5])
+
+
+def test_ema_panel_matches_single_columns():
+    rng = np.random.default_rng(25)
+    values = 100.0 + rng.normal(0.0, 1.0, (120, 4)).cumsum(axis=0)
+    values[:30, 1] = np.nan
+    values[60, 2] = np.inf
+    panel = pd.DataFrame(values, columns=["A", "B", "C", "D"])
+
+    result = ema_panel(panel, 10)
+
+    assert list(result.columns) == ["A", "B", "C", "D"]
+    for column in panel.columns:
+        pd.testing.assert_series_equal(result[column], ema(panel[column], 10), check_names=False)
+    np.testing.assert_array_equal(ema_panel(values, 10, adjust=True)[:, 3], ema(panel["D"], 10, adjust=True).to_numpy())
+
+    with pytest.raises(ValueError):
+        ema_panel(values[:, 0], 10)
+    with pytest.raises(TypeError):
+        ema_panel(values.tolist(), 10)
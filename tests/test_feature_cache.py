@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from v1indicators.foundational._features import _FEATURE_CACHE
+from v1indicators.foundational.volatility.true_range import _true_range
+from v1indicators.trend import dual_score_signals, feature_cache, precision_confluence, range_filter_confluence
+
+
+def _bars(n=400):
+    rng = np.random.default_rng(21)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, n).cumsum())
+    high = close + np.abs(rng.normal(0.5, 0.2, n))
+    low = close - np.abs(rng.normal(0.5, 0.2, n))
+    open_ = close.shift(1).fillna(close.iloc[0])
+    volume = pd.Series(rng.integers(100, 2000, n).astype(float))
+    return open_, high, low, close, volume
+
+
+def test_feature_cache_shares_building_blocks_between_engines():
+    open_, high, low, close, volume = _bars()
+
+    expected = (
+        precision_confluence(open_, high, low, close, volume),
+        dual_score_signals(open_, high, low, close, volume),
+        range_filter_confluence(high, low, close),
+    )
+    with feature_cache():
+        result = (
+            precision_confluence(open_, high, low, close, volume),
+            dual_score_signals(open_, high, low, close, volume),
+            range_filter_confluence(high, low, close),
+        )
+        cache = _FEATURE_CACHE.get()
+        assert sum(key[0] is _true_range for key in cache) == 1
+        size = len(cache)
+        precision_confluence(open_, high, low, close, volume)
+        assert len(cache) == size
+
+    assert _FEATURE_CACHE.get() is None
+    for got, want in zip(result, expected):
+        pd.testing.assert_frame_equal(got, want)
+
+
+def test_feature_cache_keys_on_parameters():
+    open_, high, low, close, volume = _bars()
+
+    with feature_cache():
+        a = range_filter_confluence(high, low, close, atr_length=14)
+        b = range_filter_confluence(high, low, close, atr_length=20)
+
+    pd.testing.assert_frame_equal(b, range_filter_confluence(high, low, close, atr_length=20))
+    assert not a.equals(b)
@@ -2,6 +2,10 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from v1indicators.derived.trend.htf_reversal_divergence import (
+    _rsi_divergence_kernel,
+    _rsi_divergence_parallel_kernel,
+)
 from v1indicators.trend import htf_reversal_divergence
 
 
@@ -41,3 +45,19 @@ def test_htf_reversal_divergence_validation():
         htf_reversal_divergence(s, s, s, s, pivot_left=0)
     with pytest.raises(TypeError):
         htf_reversal_divergence([1.0, 2.0], s, s, s)
+
+
+def test_htf_reversal_divergence_parallel_matches_serial():
+    df = _ohlc()
+
+    serial = htf_reversal_divergence(df["open"], df["high"], df["low"], df["close"], htf_step=1, pivot_left=3, pivot_right=3)
+    parallel = htf_reversal_divergence(
+        df["open"], df["high"], df["low"], df["close"], htf_step=1, pivot_left=3, pivot_right=3, parallel=True
+    )
+    pd.testing.assert_frame_equal(serial, parallel)
+
+    args = (serial["HRD_RSI"].to_numpy(), df["low"].to_numpy(), df["high"].to_numpy(), 3, 3)
+    expected = _rsi_divergence_kernel(*args)
+    for blocks in (1, 7, len(df)):
+        for want, got in zip(expected, _rsi_divergence_parallel_kernel(*args, blocks)):
+            np.testing.assert_array_equal(want, got)
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from v1indicators.momentum import cfo
+from v1indicators.overlap import linreg
+from v1indicators.foundational.overlap.linreg import _rolling_linreg
+
+
+def _close(n: int = 400) -> pd.Series:
+    rng = np.random.default_rng(23)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, n).cumsum())
+    close.iloc[[50, 51, 200]] = np.nan
+    close.iloc[300] = np.inf
+    return close
+
+
+def _fit_window(window: np.ndarray):
+    x = np.arange(window.size, dtype=np.float64)
+    slope, intercept = np.polyfit(x, window, 1)
+    resid = window - (intercept + slope * x)
+    r2 = 1.0 - (resid @ resid) / ((window - window.mean()) @ (window - window.mean()))
+    stderr = np.sqrt((resid @ resid) / (window.size - 2))
+    return intercept, slope, r2, stderr
+
+
+def test_linreg_matches_per_window_fit():
+    close = _close()
+    result = linreg(close, length=14, offset=2)
+
+    def _fit(y):
+        intercept, slope, _, _ = _fit_window(y)
+        return intercept + slope * 15.0
+
+    expected = close.rolling(14).apply(_fit, raw=True)
+    np.testing.assert_array_equal(result.isna().to_numpy(), expected.isna().to_numpy())
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-10, equal_nan=True)
+    assert result.name == "LINREG_14"
+
+
+def test_rolling_linreg_stats():
+    close = _close()
+    values = close.to_numpy()
+    intercept, slope, forecast, r2, stderr = _rolling_linreg(values, 20, with_stats=True)
+
+    for end in (19, 49, 120, 250, 399):
+        window = values[end - 19 : end + 1]
+        exp_intercept, exp_slope, exp_r2, exp_stderr = _fit_window(window)
+        assert intercept[end] == pytest.approx(exp_intercept, rel=1e-9)
+        assert slope[end] == pytest.approx(exp_slope, rel=1e-9, abs=1e-12)
+        assert forecast[end] == pytest.approx(exp_intercept + exp_slope * 19.0, rel=1e-9)
+        assert r2[end] == pytest.approx(exp_r2, rel=1e-9, abs=1e-12)
+        assert stderr[end] == pytest.approx(exp_stderr, rel=1e-9)
+
+    assert np.isnan(r2[50:70]).all()
+    assert np.isnan(forecast[300:320]).all()
+
+    # High price level, small moves: the sums of squares must not cancel.
+    rng = np.random.default_rng(9)
+    for level in (1e5, 1e7):
+        values = level + 0.01 * rng.normal(0.0, 1.0, 400).cumsum()
+        _, _, _, r2, stderr = _rolling_linreg(values, 20, with_stats=True)
+        for end in (19, 49, 120, 250, 399):
+            _, _, exp_r2, exp_stderr = _fit_window(values[end - 19 : end + 1])
+            assert r2[end] == pytest.approx(exp_r2, abs=1e-6)
+            assert stderr[end] == pytest.approx(exp_stderr, rel=1e-5)
+
+
+def test_rolling_linreg_does_not_drift():
+    values = 1e6 + np.sin(np.arange(200_000) / 50.0)
+    _, slope, _ = _rolling_linreg(values, 30)
+    exp_slope = _fit_window(values[-30:])[1]
+    assert slope[-1] == pytest.approx(exp_slope, rel=1e-6)
+
+
+def test_cfo_uses_linreg_forecast():
+    close = _close()
+    reg = linreg(close, length=9)
+    expected = 100.0 * (close - reg) / close
+    pd.testing.assert_series_equal(cfo(close, length=9), expected, check_names=False)
@@ -1,6 +1,12 @@
+import numpy as np
 import pandas as pd
 import pytest
 
+from v1indicators.foundational.trend.lorentzian_knn import (
+    _knn_scan,
+    _lorentzian_knn_kernel,
+    _lorentzian_knn_parallel_kernel,
+)
 from v1indicators.trend import lorentzian_knn
 
 
@@ -35,3 +41,41 @@ def test_lorentzian_knn_input_validation():
 
     with pytest.raises(TypeError):
         lorentzian_knn([1.0, 2.0, 3.0])
+
+
+@pytest.mark.parametrize("decimals", [None, 0])
+def test_lorentzian_knn_matches_window_scan(decimals):
+    rng = np.random.default_rng(5)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, 600).cumsum())
+    if decimals is not None:
+        # Rounded prices repeat feature values, so neighbor distances tie.
+        close = close.round(decimals)
+    horizon, stride, max_bars_back = 3, 2, 120
+
+    result = lorentzian_knn(
+        close, neighbors_count=5, max_bars_back=max_bars_back, horizon=horizon, stride=stride
+    )
+
+    f1 = result["LKNN_F1"].to_numpy()
+    f2 = result["LKNN_F2"].to_numpy()
+    close_v = close.to_numpy()
+    for i in range(horizon, len(close) - horizon):
+        start = max(i - max_bars_back, horizon)
+        score, cnt = _knn_scan(f1, f2, close_v, i, start, 5, horizon, stride)
+        expected = score if cnt > 0 else np.nan
+        np.testing.assert_equal(result["LKNN_PRED"].iloc[i], expected)
+
+
+def test_lorentzian_knn_parallel_matches_serial():
+    rng = np.random.default_rng(8)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, 900).cumsum()).round(0)
+
+    serial = lorentzian_knn(close, max_bars_back=150, stride=3)
+    parallel = lorentzian_knn(close, max_bars_back=150, stride=3, parallel=True)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+    args = (serial["LKNN_F1"].to_numpy(), serial["LKNN_F2"].to_numpy(), close.to_numpy(), 8, 150, 4, 3)
+    expected = _lorentzian_knn_kernel(*args)
+    for blocks in (1, 7, len(close)):
+        for want, got in zip(expected, _lorentzian_knn_parallel_kernel(*args, blocks)):
+            np.testing.assert_array_equal(want, got)
@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 import pytest
-from v1indicators.momentum import macd
+from v1indicators.momentum import MACDStream, macd
 
 def test_macd_basic():
     """Test MACD with simple data."""
@@ -30,3 +30,15 @@ def test_macd_basic():
 def test_macd_input_validation():
     with pytest.raises(ValueError):
         macd(pd.Series([1,2]), fast=0)
+
+
+def test_macd_stream_matches_batch():
+    data = pd.Series(np.random.default_rng(2).normal(0.0, 1.0, 200).cumsum() + 100.0)
+    expected = macd(data)
+
+    stream = MACDStream(data.iloc[:50])
+    pushed = [stream.update(x) for x in data.iloc[50:80]]
+    batch = stream.update_many(data.iloc[80:])
+
+    np.testing.assert_array_equal(np.asarray(pushed), expected.to_numpy()[50:80])
+    pd.testing.assert_frame_equal(batch, expected.iloc[80:])
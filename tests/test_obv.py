@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from v1indicators.volume import obv, obv_panel
+
+
+def test_obv_panel_matches_single_columns():
+    rng = np.random.default_rng(25)
+    close = 100.0 + rng.normal(0.0, 1.0, (100, 3)).cumsum(axis=0)
+    volume = rng.integers(100, 2000, close.shape).astype(float)
+    close[:10, 1] = np.nan
+    volume[40, 2] = np.nan
+    panel_close = pd.DataFrame(close, columns=["A", "B", "C"])
+    panel_volume = pd.DataFrame(volume, columns=["A", "B", "C"])
+
+    result = obv_panel(panel_close, panel_volume)
+
+    for column in panel_close.columns:
+        expected = obv(panel_close[column], panel_volume[column])
+        pd.testing.assert_series_equal(result[column], expected, check_names=False)
+
+    with pytest.raises(ValueError):
+        obv_panel(close, volume[:50])
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from v1indicators.foundational._pivots import _PIVOT_CACHE, _pivot_mask, _swing_pivots
+from v1indicators.levels import pivot_cache, support_resistance
+from v1indicators.trend import market_structure
+
+
+@pytest.mark.parametrize("find_high", [True, False])
+def test_swing_pivots_match_centered_rolling_extreme(find_high):
+    rng = np.random.default_rng(4)
+    values = pd.Series(rng.integers(0, 6, 400).astype(float))
+    values.iloc[[30, 31, 200]] = np.nan
+    values.iloc[120] = np.inf
+
+    for left, right in [(1, 1), (2, 5), (4, 3)]:
+        rolling = values.rolling(left + right + 1)
+        extreme = rolling.max() if find_high else rolling.min()
+        expected = values.where(values == extreme.shift(-right))
+
+        pd.testing.assert_series_equal(_swing_pivots(values, left, right, find_high), expected)
+
+
+def test_pivot_mask_skips_missing_values_when_not_strict():
+    values = np.array([1.0, 3.0, np.nan, 2.0, 1.0, 5.0, 4.0])
+    valid = ~np.isnan(values)
+
+    lenient = _pivot_mask(values, valid, 1, 1, True, False)
+    strict = _pivot_mask(values, valid, 1, 1, True, True)
+
+    assert lenient.tolist() == [False, True, False, True, False, True, False]
+    assert strict.tolist() == [False, False, False, False, False, True, False]
+
+
+def test_pivot_cache_shares_pivots_between_calls():
+    rng = np.random.default_rng(6)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, 300).cumsum())
+    high = close + 0.5
+    low = close - 0.5
+
+    expected = market_structure(high, low, close, left=3, right=3)
+    with pivot_cache():
+        support_resistance(high, low, close, left=3, right=3)
+        cached = len(_PIVOT_CACHE.get())
+        result = market_structure(high, low, close, left=3, right=3)
+        assert len(_PIVOT_CACHE.get()) == cached == 2
+
+    assert _PIVOT_CACHE.get() is None
+    pd.testing.assert_frame_equal(result, expected)
@@ -1,9 +1,10 @@
+import pickle
 import numpy as np
 import pandas as pd
 import pytest
 from typing import Any, cast
 
-from v1indicators.trend import precision_confluence
+from v1indicators.trend import PrecisionConfluenceStream, precision_confluence
 
 
 def _ohlcv(n: int = 260) -> pd.DataFrame:
@@ -49,3 +50,28 @@ def test_precision_confluence_validation():
         precision_confluence(s, s, s, s, s, preset="unknown")
     with pytest.raises(TypeError):
         precision_confluence(cast(Any, [1.0, 2.0]), s, s, s, s)
+
+
+@pytest.mark.parametrize("htf_step", [1, 5])
+def test_precision_confluence_stream_matches_batch_prefix(htf_step):
+    df = _ohlcv(200)
+    cols = ["open", "high", "low", "close", "volume"]
+    stream = PrecisionConfluenceStream(*(df[c].iloc[:123] for c in cols), preset="scalping", htf_step=htf_step)
+    stream = pickle.loads(pickle.dumps(stream))
+    out = stream.update_many(*(df[c].iloc[123:180] for c in cols))
+
+    for t in range(123, 180):
+        expected = precision_confluence(*(df[c].iloc[: t + 1] for c in cols), preset="scalping", htf_step=htf_step)
+        pd.testing.assert_series_equal(out.loc[t], expected.iloc[-1], check_names=False)
+
+    row = stream.update(*(df[c].iloc[180] for c in cols))
+    expected = precision_confluence(*(df[c].iloc[:181] for c in cols), preset="scalping", htf_step=htf_step)
+    assert row == pytest.approx(expected.iloc[-1].to_dict(), nan_ok=True)
+
+
+def test_precision_confluence_stream_validation():
+    s = pd.Series([1.0, 2.0, 3.0, 4.0])
+    with pytest.raises(ValueError):
+        PrecisionConfluenceStream(htf_step=0)
+    with pytest.raises(ValueError):
+        PrecisionConfluenceStream(s, s, s, None, s)
@@ -1,4 +1,7 @@
+import numpy as np
 import pandas as pd
+import pytest
+
 from v1indicators.trend import psar
 
 def test_psar_basic():
@@ -26,3 +29,25 @@ def test_psar_no_data():
     low = pd.Series([8])
     result = psar(high, low)
     assert result["PSAR"].isna().all()
+
+
+def test_psar_resumes_from_state():
+    rng = np.random.default_rng(2)
+    close = pd.Series(rng.normal(0.0, 1.0, 300).cumsum() + 100.0)
+    high = close + 0.5
+    low = close - 0.5
+
+    expected = psar(high, low)
+
+    # Split right after the first bar to cover the initialization step.
+    head, state = psar(high.iloc[:1], low.iloc[:1], return_state=True)
+    parts = [head]
+    for start, stop in ((1, 150), (150, 151), (151, 300)):
+        part, state = psar(high.iloc[start:stop], low.iloc[start:stop], state=state, return_state=True)
+        parts.append(part)
+
+    pd.testing.assert_frame_equal(pd.concat(parts), expected)
+    assert state.seen == 300
+
+    with pytest.raises(ValueError):
+        psar(high.iloc[:5], low.iloc[:5], acceleration=0.03, state=state)
@@ -43,3 +43,13 @@ def test_range_filter_confluence_validation():
         range_filter_confluence(s, s, s, cooldown_bars=0)
     with pytest.raises(TypeError):
         range_filter_confluence([1.0, 2.0], s, s)
+
+
+def test_range_filter_confluence_cooldown_spacing():
+    df = _ohlc(600)
+    out = range_filter_confluence(df["high"], df["low"], df["close"], cooldown_bars=7, use_adx=False, use_chop=False)
+
+    fired = np.flatnonzero((out["RFC_LONG"] | out["RFC_SHORT"]).to_numpy())
+    assert fired.size > 1
+    assert np.diff(fired).min() >= 7
+    assert (out["RFC_BARS_SINCE_SIGNAL"].to_numpy()[fired] == 0).all()
@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from v1indicators.momentum import rsi
+from v1indicators.momentum import RSIStream, rsi, rsi_panel, rsi_sweep
 
 def test_rsi_basic():
     """Test RSI with a known sequence."""
@@ -33,3 +33,44 @@ def test_rsi_zero_loss():
     # First index is NaN (diff)
     # Subsequent should approach 100
     assert result.iloc[-1] == 100.0
+
+
+def test_rsi_stream_matches_batch():
+    rng = np.random.default_rng(3)
+    values = rng.normal(0.0, 1.0, 400).cumsum() + 50.0
+    values[[60, 61, 250]] = np.nan
+    values[[5, 120, 300]] = [np.inf, -np.inf, np.inf]
+    close = pd.Series(values)
+
+    for length in (2, 14):
+        expected = rsi(close, length=length).to_numpy()
+        # Seed inside the warmup so the adjust=True weighting is resumed mid-way.
+        stream = RSIStream(close.iloc[: length - 1], length=length)
+        pushed = [stream.update(v) for v in values[length - 1 : 200]]
+        batch = stream.update_many(values[200:])
+
+        np.testing.assert_array_equal(np.asarray(pushed), expected[length - 1 : 200])
+        np.testing.assert_array_equal(batch, expected[200:])
+
+
+def test_rsi_sweep_matches_single_lengths():
+    rng = np.random.default_rng(25)
+    data = pd.Series(rng.normal(0.0, 1.0, 400).cumsum() + 100.0)
+    data.iloc[[60, 61, 150]] = [np.nan, np.nan, np.inf]
+    data.iloc[200:220] = 90.0
+    lengths = [1, 2, 14, 30]
+
+    expected = pd.concat([rsi(data, n) for n in lengths], axis=1)
+    pd.testing.assert_frame_equal(rsi_sweep(data, lengths), expected)
+
+
+def test_rsi_panel_matches_single_columns():
+    rng = np.random.default_rng(25)
+    values = 100.0 + rng.normal(0.0, 1.0, (150, 3)).cumsum(axis=0)
+    values[:40, 1] = np.nan
+    values[:, 2] = 50.0
+
+    result = rsi_panel(values, 14)
+
+    for j in range(values.shape[1]):
+        np.testing.assert_array_equal(result[:, j], rsi(pd.Series(values[:, j]), 14).to_numpy())
@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 import pytest
-from v1indicators.overlap import sma
+from v1indicators.overlap import SMAStream, sma, sma_panel, sma_sweep
 
 def test_sma_basic():
     """Test SMA with a simple linear series."""
@@ -20,3 +20,47 @@ def test_sma_input_validation():
     
     with pytest.raises(TypeError):
         sma([1, 2, 3], length=3)
+
+
+def test_sma_stream_matches_batch():
+    rng = np.random.default_rng(11)
+    data = pd.Series(rng.normal(0.0, 1.0, 200).cumsum() + 50.0)
+    data.iloc[[40, 41]] = np.nan
+    expected = sma(data, length=7)
+
+    stream = SMAStream(data.iloc[:3], length=7)
+    pushed = [stream.update(x) for x in data.iloc[3:60]]
+    batch = stream.update_many(data.iloc[60:])
+
+    np.testing.assert_array_equal(np.asarray(pushed), expected.to_numpy()[3:60])
+    pd.testing.assert_series_equal(batch, expected.iloc[60:])
+
+
+def test_sma_sweep_matches_single_lengths():
+    rng = np.random.default_rng(24)
+    data = pd.Series(rng.normal(0.0, 1.0, 3000).cumsum() + 1000.0)
+    data.iloc[[40, 41, 900]] = [np.nan, np.nan, np.inf]
+    lengths = [1, 3, 20, 200, 5000]
+
+    result = sma_sweep(data, lengths)
+
+    expected = pd.concat([sma(data, n) for n in lengths], axis=1)
+    pd.testing.assert_frame_equal(result, expected, rtol=1e-13, atol=0.0)
+    assert result["SMA_5000"].isna().all()
+
+    with pytest.raises(ValueError):
+        sma_sweep(data, [])
+
+
+def test_sma_panel_matches_single_columns():
+    rng = np.random.default_rng(25)
+    values = 100.0 + rng.normal(0.0, 1.0, (120, 3)).cumsum(axis=0)
+    values[:15, 0] = np.nan
+    values[70, 1] = np.nan
+
+    result = sma_panel(values, 20)
+
+    assert result.shape == values.shape
+    for j in range(values.shape[1]):
+        expected = sma(pd.Series(values[:, j]), 20).to_numpy()
+        np.testing.assert_allclose(result[:, j], expected, rtol=1e-13, atol=0)
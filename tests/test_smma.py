@@ -1,7 +1,8 @@
+import numpy as np
 import pandas as pd
 import pytest
 
-from v1indicators.overlap import smma
+from v1indicators.overlap import RMAStream, SMMAStream, rma, smma
 
 
 def test_smma_basic():
@@ -17,3 +18,21 @@ def test_smma_input_validation():
         smma(pd.Series([1.0, 2.0]), length=0)
     with pytest.raises(TypeError):
         smma([1.0, 2.0], length=2)
+
+
+def test_smma_and_rma_streams_match_batch():
+    rng = np.random.default_rng(11)
+    values = rng.normal(0.0, 1.0, 200).cumsum()
+    values[[5, 6, 90]] = np.nan
+    close = pd.Series(values)
+
+    for length in (2, 14):
+        smma_stream = SMMAStream(close.iloc[:50], length)
+        rma_stream = RMAStream(close.iloc[:50], length)
+
+        np.testing.assert_array_equal(
+            smma_stream.update_many(values[50:]), smma(close, length).to_numpy()[50:]
+        )
+        np.testing.assert_array_equal(
+            [rma_stream.update(v) for v in values[50:]], rma(close, length).to_numpy()[50:]
+        )
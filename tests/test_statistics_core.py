@@ -2,6 +2,9 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from v1indicators.momentum import cci
+from v1indicators.statistics import entropy
+from v1indicators.statistics import mean_deviation
 from v1indicators.statistics import stdev
 from v1indicators.statistics import variance
 from v1indicators.statistics import zscore
@@ -33,3 +36,40 @@ def test_statistics_input_validation():
         zscore(s, length=0)
     with pytest.raises(TypeError):
         stdev([1.0, 2.0])
+
+
+def test_mean_deviation_matches_window_mad():
+    rng = np.random.default_rng(4)
+    close = pd.Series(50.0 + rng.normal(0.0, 1.0, 300).cumsum())
+    close.iloc[[40, 41, 150]] = np.nan
+
+    result = mean_deviation(close, length=20)
+    expected = close.rolling(20).apply(lambda x: np.abs(x - x.mean()).mean(), raw=True)
+    pd.testing.assert_series_equal(result, expected.rename("MEANDEV_20"))
+
+    high = close + 1.0
+    low = close - 1.0
+    tp = (high + low + close) / 3.0
+    expected_cci = (tp - tp.rolling(20).mean()) / (0.015 * mean_deviation(tp, length=20))
+    pd.testing.assert_series_equal(cci(high, low, close, length=20), expected_cci.rename("CCI_20"))
+
+
+def test_entropy_matches_window_bernoulli_entropy():
+    rng = np.random.default_rng(12)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, 300).cumsum())
+    close.iloc[100:103] = np.nan
+
+    def _ent(x):
+        p = min(max(x.mean(), 1e-12), 1.0 - 1e-12)
+        q = 1.0 - p
+        return -(p * (np.log(p) / np.log(3.0)) + q * (np.log(q) / np.log(3.0)))
+
+    for length in (1, 10, 25):
+        sign = (close.diff() > 0.0).astype(int)
+        expected = sign.rolling(length).apply(_ent, raw=True)
+        expected.name = f"ENTROPY_{length}"
+
+        pd.testing.assert_series_equal(entropy(close, length, base=3.0), expected, rtol=0, atol=0)
+
+    assert entropy(close.iloc[:4], 10).isna().all()
+
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from v1indicators.trend import supertrend, supertrend_grid
+
+
+def _ohlc(n: int = 300, seed: int = 4):
+    rng = np.random.default_rng(seed)
+    close = pd.Series(rng.normal(0.0, 1.0, n).cumsum() + 100.0)
+    high = close + np.abs(rng.normal(0.6, 0.2, n))
+    low = close - np.abs(rng.normal(0.6, 0.2, n))
+    return high, low, close
+
+
+def test_supertrend_basic_shape():
+    high, low, close = _ohlc()
+    result = supertrend(high, low, close, length=10, mult=3.0)
+
+    assert list(result.columns) == ["SUPERTREND", "SUPERTREND_DIR"]
+    assert result["SUPERTREND"].iloc[:9].isna().all()
+    assert set(result["SUPERTREND_DIR"].unique()).issubset({-1, 1})
+
+
+def test_supertrend_resumes_from_state():
+    high, low, close = _ohlc()
+    expected = supertrend(high, low, close, length=10, mult=2.0)
+
+    # First chunk ends inside the ATR warmup, before the kernel has started.
+    head, state = supertrend(high.iloc[:5], low.iloc[:5], close.iloc[:5], length=10, mult=2.0, return_state=True)
+    assert not state.started
+
+    parts = [head]
+    for start, stop in ((5, 200), (200, 201), (201, 300)):
+        part, state = supertrend(
+            high.iloc[start:stop],
+            low.iloc[start:stop],
+            close.iloc[start:stop],
+            length=10,
+            mult=2.0,
+            state=state,
+            return_state=True,
+        )
+        parts.append(part)
+
+    pd.testing.assert_frame_equal(pd.concat(parts), expected)
+
+    with pytest.raises(ValueError):
+        supertrend(high, low, close, length=7, mult=2.0, state=state)
+
+
+def test_supertrend_grid_matches_single_calls():
+    high, low, close = _ohlc()
+    close.iloc[40] = np.nan
+    lengths = [3, 10, 21]
+    mults = [0.5, 2.0, 3.0, 4.5]
+
+    grid = supertrend_grid(high, low, close, lengths, mults)
+
+    assert grid.supertrend.shape == (3, 4, len(close))
+    assert grid.direction.dtype == np.int8
+    for i, length in enumerate(lengths):
+        for j, mult in enumerate(mults):
+            expected = supertrend(high, low, close, length=length, mult=mult)
+            np.testing.assert_array_equal(grid.supertrend[i, j], expected["SUPERTREND"].to_numpy())
+            np.testing.assert_array_equal(grid.direction[i, j], expected["SUPERTREND_DIR"].to_numpy())
+
+
+def test_supertrend_grid_input_validation():
+    high, low, close = _ohlc()
+
+    with pytest.raises(ValueError):
+        supertrend_grid(high, low, close, [10], [])
+    with pytest.raises(ValueError):
+        supertrend_grid(high, low, close, [10], [2.0, 0.0])
+    with pytest.raises(ValueError):
+        supertrend_grid(high, low, close, [0, 10], [2.0])
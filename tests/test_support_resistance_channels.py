@@ -1,6 +1,11 @@
+import numpy as np
 import pandas as pd
 import pytest
 
+from v1indicators.foundational.trend.support_resistance_channels import (
+    _sr_channels_kernel,
+    _sr_channels_parallel_kernel,
+)
 from v1indicators.trend import support_resistance_channels
 
 
@@ -42,3 +47,90 @@ def test_support_resistance_channels_input_validation():
 
     with pytest.raises(TypeError):
         support_resistance_channels([1.0, 2.0], s, s)
+
+
+# Dense pivots (pivot_period=1, short loopback) fill the window buffer.
+@pytest.mark.parametrize("pivot_period, loopback", [(2, 40), (1, 5), (1, 10)])
+def test_support_resistance_channels_matches_window_scan(pivot_period, loopback):
+    rng = np.random.default_rng(11)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, 700).cumsum())
+    high = close + 0.5
+    low = close - 0.5
+
+    result = support_resistance_channels(
+        high, low, close, pivot_period=pivot_period, channel_width_pct=10.0, min_strength=2, loopback=loopback
+    )
+
+    pivots = result["PIVOT_VALUE"].to_numpy()
+    width = ((high.rolling(300).max() - low.rolling(300).min()) * 0.10).to_numpy()
+    for i in range(len(close)):
+        window = [p for p in pivots[max(0, i - loopback) : i + 1] if not np.isnan(p)]
+        best = {True: (0, np.nan), False: (0, np.nan)}
+        for p in window:
+            near = [q for q in window if abs(q - p) <= width[i]]
+            if len(near) < 2:
+                continue
+            level = sum(near) / len(near)
+            side = level >= close.iloc[i]
+            if len(near) > best[side][0]:
+                best[side] = (len(near), level)
+
+        assert result["SR_RESISTANCE_STRENGTH"].iloc[i] == best[True][0]
+        assert result["SR_SUPPORT_STRENGTH"].iloc[i] == best[False][0]
+        np.testing.assert_equal(result["SR_RESISTANCE"].iloc[i], best[True][1])
+        np.testing.assert_equal(result["SR_SUPPORT"].iloc[i], best[False][1])
+
+
+def test_support_resistance_channels_parallel_matches_serial():
+    rng = np.random.default_rng(3)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, 900).cumsum())
+    high = close + 0.5
+    low = close - 0.5
+
+    serial = support_resistance_channels(high, low, close, pivot_period=3, loopback=80)
+    parallel = support_resistance_channels(high, low, close, pivot_period=3, loopback=80, parallel=True)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+    dense = support_resistance_channels(high, low, close, pivot_period=1, loopback=5)
+    pd.testing.assert_frame_equal(
+        dense, support_resistance_channels(high, low, close, pivot_period=1, loopback=5, parallel=True)
+    )
+
+    args = (
+        close.to_numpy(),
+        serial["PIVOT_VALUE"].to_numpy(),
+        np.full(len(close), 2.0),
+        80,
+        2,
+    )
+    expected = _sr_channels_kernel(*args)
+    for blocks in (1, 7, len(close)):
+        for want, got in zip(expected, _sr_channels_parallel_kernel(*args, blocks)):
+            np.testing.assert_array_equal(want, got)
+
+
+def test_support_resistance_channels_no_break_on_bars_without_levels():
+    rng = np.random.default_rng(3)
+    close = 100.0 + rng.normal(0.0, 1.0, 900).cumsum()
+    pivots = support_resistance_channels(
+        pd.Series(close + 0.5), pd.Series(close - 0.5), pd.Series(close), pivot_period=3, loopback=80
+    )["PIVOT_VALUE"].to_numpy()
+    width = np.full(len(close), 2.0)
+
+    breaks = _sr_channels_kernel(close, pivots, width, 80, 2)[4]
+    bar = int(np.flatnonzero(breaks)[0])
+
+    # A bar whose width is missing (e.g. an inf high in the range window) or
+    # whose close is missing gets no levels and no break flags.
+    for w, c in ((np.nan, close[bar]), (0.0, close[bar]), (2.0, np.nan)):
+        width_v = width.copy()
+        close_v = close.copy()
+        width_v[bar] = w
+        close_v[bar] = c
+        for kernel_out in (
+            _sr_channels_kernel(close_v, pivots, width_v, 80, 2),
+            _sr_channels_parallel_kernel(close_v, pivots, width_v, 80, 2, 7),
+        ):
+            assert np.isnan(kernel_out[0][bar])
+            assert not kernel_out[4][bar]
+            assert not kernel_out[5][bar]
@@ -50,3 +50,44 @@ def test_swing_leg_profile_validation():
         swing_leg_profile(s, s, s, s, s, bin_atr_mult=0)
     with pytest.raises(TypeError):
         swing_leg_profile(cast(Any, [1.0, 2.0]), s, s, s, s)
+
+
+def test_swing_leg_profile_leg_volume_is_split_into_buy_and_sell():
+    df = _ohlcv(600)
+    out = swing_leg_profile(
+        df["open"],
+        df["high"],
+        df["low"],
+        df["close"],
+        df["volume"],
+        swing_length=10,
+        atr_length=20,
+        bin_atr_mult=0.01,
+    )
+
+    legs = out.dropna(subset=["SLP_TOTAL_VOL"])
+    assert (legs["SLP_BIN_COUNT"] > 128).any()
+    np.testing.assert_allclose(legs["SLP_BUY_VOL"] + legs["SLP_SELL_VOL"], legs["SLP_TOTAL_VOL"])
+    for _, row in legs.drop_duplicates(["SLP_LEG_START", "SLP_LEG_END"]).iterrows():
+        leg = df.iloc[int(row["SLP_LEG_START"]) : int(row["SLP_LEG_END"]) + 1]
+        assert row["SLP_TOTAL_VOL"] == pytest.approx(leg["volume"].sum())
+
+
+@pytest.mark.parametrize("price", [np.inf, -np.inf])
+def test_swing_leg_profile_infinite_close_falls_in_edge_bin(price):
+    df = _ohlcv()
+    args = dict(swing_length=20, atr_length=30)
+    clean = swing_leg_profile(df["open"], df["high"], df["low"], df["close"], df["volume"], **args)
+    leg = clean.dropna(subset=["SLP_TOTAL_VOL"]).iloc[-1]
+    start, end = int(leg["SLP_LEG_START"]), int(leg["SLP_LEG_END"])
+
+    # Swing legs come from high/low only; a non-finite close inside a leg is
+    # counted in the top (+inf) or bottom (-inf) bin instead of raising.
+    close = df["close"].copy()
+    close.iloc[start + 1] = price
+    out = swing_leg_profile(df["open"], df["high"], df["low"], close, df["volume"], **args)
+
+    legs = out[(out["SLP_LEG_START"] == start) & (out["SLP_LEG_END"] == end)]
+    assert not legs.empty
+    assert legs["SLP_TOTAL_VOL"].iloc[0] == pytest.approx(df["volume"].iloc[start : end + 1].sum())
+    assert np.isfinite(legs[["SLP_POC", "SLP_DELTA_PCT"]].to_numpy()).all()
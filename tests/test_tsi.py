@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from v1indicators.momentum import tsi
+
+
+def test_tsi_matches_chained_ewm():
+    rng = np.random.default_rng(3)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, 200).cumsum())
+    close.iloc[50:53] = np.nan
+
+    result = tsi(close, fast=5, slow=9, signal=4)
+
+    m = close.diff()
+    ema1 = m.ewm(span=9, adjust=False).mean().ewm(span=5, adjust=False).mean()
+    ema2 = m.abs().ewm(span=9, adjust=False).mean().ewm(span=5, adjust=False).mean()
+    tsi_line = 100.0 * ema1 / ema2
+    sig = tsi_line.ewm(span=4, adjust=False).mean()
+
+    expected = pd.DataFrame({"TSI": tsi_line, "TSI_SIGNAL": sig})
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_tsi_flat_start_is_nan():
+    close = pd.Series([5.0, 5.0, 5.0, 6.0, 7.0, 6.5])
+
+    result = tsi(close, fast=2, slow=3, signal=2)
+
+    assert result["TSI"].iloc[:3].isna().all()
+    assert np.isnan(result["TSI_SIGNAL"].iloc[1])
+    assert result["TSI"].iloc[3:].notna().all()
+
+
+def test_tsi_input_validation():
+    with pytest.raises(ValueError):
+        tsi(pd.Series([1.0, 2.0]), fast=0)
+
+    with pytest.raises(TypeError):
+        tsi([1.0, 2.0])
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -44,3 +45,31 @@ def test_ut_bot_input_validation():
 
     with pytest.raises(TypeError):
         ut_bot([1.0, 2.0], pd.Series([1.0, 2.0]), pd.Series([1.0, 2.0]))
+
+
+def test_ut_bot_resumes_from_state():
+    rng = np.random.default_rng(9)
+    close = pd.Series(rng.normal(0.0, 1.0, 250).cumsum() + 100.0)
+    high = close + np.abs(rng.normal(0.5, 0.2, 250))
+    low = close - np.abs(rng.normal(0.5, 0.2, 250))
+    close.iloc[[100, 101]] = np.nan
+
+    expected = ut_bot(high, low, close, key_value=1.5, atr_period=5)
+
+    head, state = ut_bot(
+        high.iloc[:101], low.iloc[:101], close.iloc[:101], key_value=1.5, atr_period=5, return_state=True
+    )
+    parts = [head]
+    for i in range(101, 250):
+        bar, state = ut_bot(
+            high.iloc[i : i + 1],
+            low.iloc[i : i + 1],
+            close.iloc[i : i + 1],
+            key_value=1.5,
+            atr_period=5,
+            state=state,
+            return_state=True,
+        )
+        parts.append(bar)
+
+    pd.testing.assert_frame_equal(pd.concat(parts), expected)
@@ -0,0 +1,80 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from v1indicators.momentum import cg, coppock
+from v1indicators.overlap import alma, fwma, pwma, sinwma, swma, wma
+from v1indicators.foundational.overlap._fir import _cached_weights
+
+
+def _close(n: int = 300) -> pd.Series:
+    rng = np.random.default_rng(17)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, n).cumsum())
+    close.iloc[[60, 61, 62, 150]] = np.nan
+    return close
+
+
+def _rolling_dot(series: pd.Series, weights: np.ndarray) -> pd.Series:
+    return series.rolling(len(weights)).apply(lambda x: np.dot(x, weights), raw=True)
+
+
+@pytest.mark.parametrize(
+    "func, kwargs, weights",
+    [
+        (wma, {"length": 6}, np.arange(1.0, 7.0) / 21.0),
+        (swma, {"length": 5}, np.array([1.0, 2.0, 3.0, 2.0, 1.0]) / 9.0),
+        (pwma, {"length": 5}, np.array([math.comb(4, i) for i in range(5)], dtype=float) / 16.0),
+        (fwma, {"length": 5}, np.array([1.0, 1.0, 2.0, 3.0, 5.0]) / 12.0),
+        (sinwma, {"length": 4}, np.sin(np.arange(1, 5) * np.pi / 5.0) / np.sin(np.arange(1, 5) * np.pi / 5.0).sum()),
+    ],
+)
+def test_weighted_windows_match_rolling_dot(func, kwargs, weights):
+    close = _close()
+    result = func(close, **kwargs)
+    expected = _rolling_dot(close, weights)
+
+    np.testing.assert_array_equal(result.isna().to_numpy(), expected.isna().to_numpy())
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-12, equal_nan=True)
+
+
+def test_alma_coppock_cg_nan_propagation():
+    close = _close()
+    assert alma(close, length=9).iloc[60:71].isna().all()
+    assert alma(close, length=9).iloc[71:149].notna().all()
+
+    roc = 100.0 * (close / close.shift(14) - 1.0) + 100.0 * (close / close.shift(11) - 1.0)
+    w = np.arange(1.0, 11.0)
+    expected = roc.rolling(10).apply(lambda x: np.dot(x, w) / w.sum(), raw=True)
+    pd.testing.assert_series_equal(coppock(close), expected, check_names=False)
+
+    num = close.rolling(10).apply(lambda x: -np.dot(x, w), raw=True)
+    expected = num / close.rolling(10).sum()
+    pd.testing.assert_series_equal(cg(close, length=10), expected, check_names=False)
+
+
+def test_cached_weights_are_shared_and_read_only():
+    calls = []
+
+    @_cached_weights
+    def build(length):
+        calls.append(length)
+        return np.ones(length)
+
+    first = build(4)
+    assert build(4) is first
+    assert calls == [4]
+    with pytest.raises(ValueError):
+        first[0] = 2.0
+
+
+def test_weighted_windows_treat_inf_as_missing():
+    close = _close(200)
+    close.iloc[20] = np.inf
+    w = np.arange(1.0, 6.0)
+    expected = close.rolling(5).apply(lambda x: np.dot(x, w) / w.sum(), raw=True)
+    result = wma(close, length=5)
+
+    assert result.iloc[20:25].isna().all()
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-12, equal_nan=True)
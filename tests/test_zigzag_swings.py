@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 import pytest
 
+from v1indicators.foundational.trend.zigzag_swings import _zigzag_swings_kernel, _zigzag_swings_parallel_kernel
 from v1indicators.trend import zigzag_swings
 
 
@@ -19,3 +21,17 @@ def test_zigzag_swings_input_validation():
         zigzag_swings(s, s, length=0)
     with pytest.raises(TypeError):
         zigzag_swings([1.0, 2.0], s)
+
+
+def test_zigzag_swings_parallel_matches_serial():
+    rng = np.random.default_rng(2)
+    close = pd.Series(100.0 + rng.normal(0.0, 1.0, 500).cumsum()).round(0)
+    high = close + 1.0
+    low = close - 1.0
+
+    pd.testing.assert_frame_equal(zigzag_swings(high, low, length=4), zigzag_swings(high, low, length=4, parallel=True))
+
+    expected = _zigzag_swings_kernel(high.to_numpy(), low.to_numpy(), 4)
+    for blocks in (1, 7, len(close)):
+        for want, got in zip(expected, _zigzag_swings_parallel_kernel(high.to_numpy(), low.to_numpy(), 4, blocks)):
+            np.testing.assert_array_equal(want, got)
@@ -204,6 +204,7 @@ STATISTICS_SYMBOLS = (
     "kurtosis",
     "skew",
     "entropy",
+    "mean_deviation",
 )
 
 PERFORMANCE_SYMBOLS = (
@@ -223,6 +224,9 @@ _SYMBOL_TO_PACKAGE.update({name: ".levels" for name in LEVELS_SYMBOLS})
 _SYMBOL_TO_PACKAGE.update({name: ".statistics" for name in STATISTICS_SYMBOLS})
 _SYMBOL_TO_PACKAGE.update({name: ".performance" for name in PERFORMANCE_SYMBOLS})
 
+# Package-level entry points that are not indicators, loaded lazily as well.
+_API_TO_MODULE = {"compute": "._planner"}
+
 __all__ = [
     "__version__",
     *OVERLAP_SYMBOLS,
@@ -237,7 +241,7 @@ __all__ = [
 
 
 def __getattr__(name: str):
-    package = _SYMBOL_TO_PACKAGE.get(name)
+    package = _SYMBOL_TO_PACKAGE.get(name) or _API_TO_MODULE.get(name)
     if package is None:
         raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -250,4 +254,4 @@ def __getattr__(name: str):
 
 
 def __dir__():
-    return sorted(set(globals().keys()) | set(__all__))
+    return sorted(set(globals().keys()) | set(__all__) | set(_API_TO_MODULE))
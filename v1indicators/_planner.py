@@ -0,0 +1,153 @@
+import inspect
+from importlib import import_module
+from typing import Any, Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+from ._utils import validate_df
+from .foundational._features import _arg_key, _feature, feature_cache
+
+# Parameter names bound to the OHLCV columns of the frame by default.
+_PRICE_COLUMNS = {
+    "open": "open",
+    "open_": "open",
+    "high": "high",
+    "low": "low",
+    "close": "close",
+    "volume": "volume",
+}
+
+Spec = Union[str, tuple]
+
+
+def _resolve(name: str):
+    package = import_module(__package__)
+    if name not in package._SYMBOL_TO_PACKAGE:
+        raise ValueError(f"unknown indicator {name!r}")
+    return getattr(package, name)
+
+
+def _is_series_parameter(parameter: inspect.Parameter) -> bool:
+    return "Series" in str(parameter.annotation)
+
+
+def _bind(name: str, func, params: dict, columns: dict, frame: pd.DataFrame) -> inspect.BoundArguments:
+    signature = inspect.signature(func)
+    unknown = set(params) - set(signature.parameters)
+    if unknown:
+        raise ValueError(f"{name} has no parameter(s) {sorted(unknown)}")
+
+    kwargs = {}
+    for parameter in signature.parameters.values():
+        if parameter.name in params:
+            value = params[parameter.name]
+            if isinstance(value, str) and _is_series_parameter(parameter):
+                if value not in frame.columns:
+                    raise ValueError(f"{name}: column {value!r} not found for {parameter.name}")
+                value = columns.setdefault(value, _column(frame, value))
+            kwargs[parameter.name] = value
+        elif parameter.name in _PRICE_COLUMNS and _is_series_parameter(parameter):
+            column = _PRICE_COLUMNS[parameter.name]
+            if column in columns:
+                kwargs[parameter.name] = columns[column]
+            elif parameter.default is inspect.Parameter.empty:
+                raise ValueError(f"{name} needs a {column!r} column")
+
+    try:
+        bound = signature.bind(**kwargs)
+    except TypeError as exc:
+        raise ValueError(f"{name}: {exc}") from None
+    bound.apply_defaults()
+    return bound
+
+
+def _column(frame: pd.DataFrame, label) -> pd.Series:
+    series = frame[label]
+    return series if series.dtype == np.float64 else series.astype(np.float64)
+
+
+def _output_columns(name: str, out: Any, index: pd.Index) -> list:
+    if isinstance(out, pd.Series):
+        parts = [(out.name if out.name is not None else name, out)]
+    elif isinstance(out, pd.DataFrame):
+        parts = list(out.items())
+    else:
+        raise ValueError(f"{name} does not return a Series or DataFrame")
+
+    for _, values in parts:
+        if not values.index.equals(index):
+            raise ValueError(f"{name} does not return one row per bar")
+    return parts
+
+
+def _is_numeric(values: pd.Series) -> bool:
+    return pd.api.types.is_bool_dtype(values.dtype) or pd.api.types.is_numeric_dtype(values.dtype)
+
+
+def compute(df: pd.DataFrame, specs: Iterable[Spec]) -> pd.DataFrame:
+    """
+    Evaluate several indicators on one OHLCV frame into a single feature frame.
+
+    ``specs`` lists indicator names from the package root, either bare
+    (``"rsi"``) or with parameters (``("atr", {"length": 20})``). Arguments
+    named ``open``/``open_``, ``high``, ``low``, ``close`` and ``volume`` are
+    taken from the matching (lower-case) columns of ``df`` unless given in
+    the parameters; a string passed for any series argument names a column.
+
+    Identical calls are evaluated once, foundational indicators before the
+    derived ones built on them, and all inside one ``feature_cache()`` block,
+    so building blocks shared between indicators (ATR, EMA, RSI, ...) are
+    computed once as well. Numeric output columns are written into one
+    preallocated float64 block (booleans become 0.0 / 1.0); other columns,
+    such as labels, keep their dtype.
+
+    Args:
+        df: Pandas DataFrame of bars.
+        specs: Indicator names or ``(name, params)`` pairs.
+
+    Returns:
+        Pandas DataFrame indexed like ``df`` with the output columns of every
+        spec, in spec order.
+    """
+    frame = validate_df(df, "df")
+    columns = {
+        column: _column(frame, column)
+        for column in set(_PRICE_COLUMNS.values())
+        if column in frame.columns
+    }
+
+    planned = {}
+    for spec in specs:
+        name, params = (spec, {}) if isinstance(spec, str) else spec
+        func = _resolve(name)
+        bound = _bind(name, func, dict(params), columns, frame)
+        key = (func, tuple((arg, _arg_key(value)) for arg, value in bound.arguments.items()))
+        planned.setdefault(key, (name, func, bound))
+
+    # Derived indicators consume foundational ones, so evaluate that layer first
+    # and let the derived calls pick its results up from the feature cache.
+    order = sorted(planned.values(), key=lambda item: item[1].__module__.startswith(f"{__package__}.derived"))
+    results = {}
+    with feature_cache():
+        for name, func, bound in order:
+            results[id(bound)] = _output_columns(name, _feature(func, *bound.args, **bound.kwargs), frame.index)
+
+    parts = [part for name, func, bound in planned.values() for part in results[id(bound)]]
+    labels = [label for label, _ in parts]
+    duplicates = sorted({str(label) for label in labels if labels.count(label) > 1})
+    if duplicates:
+        raise ValueError(f"duplicate output columns {duplicates}; pass distinguishing parameters")
+
+    # Numeric outputs go into one preallocated block; Fortran order keeps each
+    # column contiguous and lets the frame wrap the block without a copy.
+    numeric = [j for j, (_, values) in enumerate(parts) if _is_numeric(values)]
+    block = np.empty((len(frame), len(numeric)), dtype=np.float64, order="F")
+    for k, j in enumerate(numeric):
+        block[:, k] = parts[j][1].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    out = pd.DataFrame(block, index=frame.index, columns=[labels[j] for j in numeric], copy=False)
+    for j, (label, values) in enumerate(parts):
+        if j not in numeric:
+            out.insert(j, label, values)
+    return out
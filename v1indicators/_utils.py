@@ -50,4 +50,69 @@ def validate_df(df: pd.DataFrame, name: str = "dataframe") -> pd.DataFrame:
 
 def to_series(data: np.ndarray, index: pd.Index, name: Optional[str] = None) -> pd.Series:
     """Wraps numpy array back into a Pandas Series with the given index."""
-    return pd.Series(data, index=index, name=name)
\ No newline at end of file
+    return pd.Series(data, index=index, name=name)
+
+def validate_values(data, name: str = "data") -> np.ndarray:
+    """
+    Converts a scalar, sequence, numpy array or Pandas Series of new bars into a
+    contiguous 1D float64 array. Used by the streaming objects.
+    """
+    if isinstance(data, pd.DataFrame):
+        raise TypeError(f"{name} must be a scalar, 1D array or pandas Series")
+
+    values = np.asarray(data.to_numpy() if isinstance(data, pd.Series) else data, dtype=np.float64)
+    if values.ndim == 0:
+        values = values.reshape(1)
+    elif values.ndim != 1:
+        raise ValueError(f"{name} must be one-dimensional")
+
+    return np.ascontiguousarray(values)
+
+
+def validate_lengths(lengths, name: str = "lengths") -> np.ndarray:
+    """
+    Converts the window lengths of a parameter sweep into a 1D int64 array.
+    Ensures there is at least one length and every length is positive.
+    """
+    values = np.asarray(lengths)
+    if values.ndim != 1 or values.shape[0] == 0:
+        raise ValueError(f"{name} must be a non-empty 1D sequence")
+    if not np.issubdtype(values.dtype, np.integer):
+        raise TypeError(f"{name} must be integers")
+    if (values <= 0).any():
+        raise ValueError(f"{name} must be > 0")
+
+    return values.astype(np.int64)
+
+
+def stream_output(data, values: np.ndarray, name: Optional[str] = None):
+    """Mirrors the container of the bars pushed into a stream on its output."""
+    if isinstance(data, pd.Series):
+        return to_series(values, data.index, name=name)
+    return values
+
+
+def validate_panel(data, name: str = "data") -> np.ndarray:
+    """
+    Converts a (bars x symbols) 2D array or wide Pandas DataFrame into a
+    Fortran-ordered float64 array, so each symbol's column is contiguous.
+    Ensures the panel is two-dimensional and not empty.
+    """
+    if isinstance(data, pd.DataFrame):
+        data = data.to_numpy(dtype=np.float64)
+    elif not isinstance(data, np.ndarray):
+        raise TypeError(f"{name} must be a 2D numpy array or pandas DataFrame")
+
+    if data.ndim != 2:
+        raise ValueError(f"{name} must be two-dimensional")
+    if data.size == 0:
+        raise ValueError(f"{name} is empty")
+
+    return np.asfortranarray(data, dtype=np.float64)
+
+
+def panel_output(data, values: np.ndarray):
+    """Mirrors the container of a panel input (array or wide DataFrame) on its output."""
+    if isinstance(data, pd.DataFrame):
+        return pd.DataFrame(values, index=data.index, columns=data.columns, copy=False)
+    return values
@@ -1,6 +1,6 @@
 from .directional_logistic_oscillator import directional_logistic_oscillator
 from .inertia import inertia
-from .macd import macd
+from .macd import MACDStream, macd
 from .macd_state import macd_state
 from .mfi import mfi
 from .pgo import pgo
@@ -22,4 +22,5 @@ __all__ = [
     "qqe",
     "rsx",
     "directional_logistic_oscillator",
+    "MACDStream",
 ]
@@ -3,6 +3,7 @@ import pandas as pd
 
 from .._utils import check_series
 from ...derived.trend.adx import adx
+from ...foundational._features import _feature
 
 
 def _logistic_prob(series: pd.Series, mean_lookback: int, slope: float, smooth_len: int) -> pd.Series:
@@ -58,7 +59,7 @@ def directional_logistic_oscillator(
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
-    dmi = adx(high_s, low_s, close_s, length=di_length)
+    dmi = _feature(adx, high_s, low_s, close_s, length=di_length)
     plus_di = dmi[f"DMP_{di_length}"]
     minus_di = dmi[f"DMN_{di_length}"]
     adx_val = dmi[f"ADX_{di_length}"]
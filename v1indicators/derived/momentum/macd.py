@@ -1,6 +1,12 @@
+from typing import Optional
+
+import numpy as np
 import pandas as pd
+from numba import njit
+from ...foundational._features import _feature
+from ...foundational.overlap._ewm import _EWMMean, _ewm_mean_update, _span_com
 from ...foundational.overlap.ema import ema
-from .._utils import check_series
+from .._utils import check_series, validate_values
 
 def macd(
     close: pd.Series,
@@ -36,8 +42,8 @@ def macd(
     close = check_series(close, "close")
 
     # EMA handles its own validation but we already did it
-    fast_ema = ema(close, fast)
-    slow_ema = ema(close, slow)
+    fast_ema = _feature(ema, close, fast)
+    slow_ema = _feature(ema, close, slow)
 
     macd_line = fast_ema - slow_ema
     
@@ -51,3 +57,81 @@ def macd(
         "MACD_SIGNAL": signal_line,
         "MACD_HIST": hist,
     })
+
+
+@njit
+def _macd_stream_kernel(values, fast_state, slow_state, signal_state, fast_com, slow_com, signal_com):
+    n = values.shape[0]
+    macd_line = np.empty(n, dtype=np.float64)
+    signal_line = np.empty(n, dtype=np.float64)
+    hist = np.empty(n, dtype=np.float64)
+
+    for i in range(n):
+        fast_ema = _ewm_mean_update(fast_state, values[i], fast_com, False, 1)
+        slow_ema = _ewm_mean_update(slow_state, values[i], slow_com, False, 1)
+        macd_line[i] = fast_ema - slow_ema
+        signal_line[i] = _ewm_mean_update(signal_state, macd_line[i], signal_com, False, 1)
+        hist[i] = macd_line[i] - signal_line[i]
+
+    return macd_line, signal_line, hist
+
+
+class MACDStream:
+    """
+    Streaming MACD.
+
+    Carries the fast, slow and signal EMA states so each pushed bar costs O(1);
+    every row equals the last row of ``macd(close, fast, slow, signal)`` on the
+    extended series.
+    """
+
+    __slots__ = ("value", "_fast", "_slow", "_signal")
+
+    def __init__(
+        self,
+        close: Optional[pd.Series] = None,
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
+    ):
+        if min(fast, slow, signal) <= 0:
+            raise ValueError("periods must be > 0")
+
+        self.value = (np.nan, np.nan, np.nan)
+        self._fast = _EWMMean(_span_com(fast), False)
+        self._slow = _EWMMean(_span_com(slow), False)
+        self._signal = _EWMMean(_span_com(signal), False)
+
+        if close is not None:
+            self.update_many(validate_values(close, "close"))
+
+    def update(self, value: float) -> tuple:
+        """Push one bar and return its ``(MACD, MACD_SIGNAL, MACD_HIST)``."""
+        self._push(np.array([value], dtype=np.float64))
+        return self.value
+
+    def update_many(self, values) -> pd.DataFrame:
+        """Push a batch of bars and return their MACD rows."""
+        macd_line, signal_line, hist = self._push(validate_values(values, "values"))
+        return pd.DataFrame(
+            {
+                "MACD": macd_line,
+                "MACD_SIGNAL": signal_line,
+                "MACD_HIST": hist,
+            },
+            index=values.index if isinstance(values, pd.Series) else None,
+        )
+
+    def _push(self, values: np.ndarray):
+        out = _macd_stream_kernel(
+            values,
+            self._fast.state,
+            self._slow.state,
+            self._signal.state,
+            self._fast.com,
+            self._slow.com,
+            self._signal.com,
+        )
+        if values.shape[0]:
+            self.value = (float(out[0][-1]), float(out[1][-1]), float(out[2][-1]))
+        return out
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.overlap.ema import ema
 
 
@@ -26,7 +27,7 @@ def macd_state(
 
     close_s = check_series(close, "close")
 
-    macd_line = ema(close_s, fast) - ema(close_s, slow)
+    macd_line = _feature(ema, close_s, fast) - _feature(ema, close_s, slow)
     if ma_kind == "sma":
         signal_line = macd_line.rolling(signal).mean()
     else:
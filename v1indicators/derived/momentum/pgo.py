@@ -1,6 +1,7 @@
 import pandas as pd
 
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.volatility.atr import atr
 
 
@@ -14,7 +15,7 @@ def pgo(high: pd.Series, low: pd.Series, close: pd.Series, length: int = 14) ->
     close_s = check_series(close, "close")
 
     basis = close_s.rolling(length).mean()
-    atr_s = atr(high_s, low_s, close_s, length=length)
+    atr_s = _feature(atr, high_s, low_s, close_s, length=length)
 
     out = (close_s - basis) / atr_s
     out.name = f"PGO_{length}"
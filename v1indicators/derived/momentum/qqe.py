@@ -1,6 +1,7 @@
 import pandas as pd
 
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.momentum.rsi import rsi
 
 
@@ -12,7 +13,7 @@ def qqe(close: pd.Series, length: int = 14, smooth: int = 5, factor: float = 4.2
         raise ValueError("factor must be > 0")
 
     close_s = check_series(close, "close")
-    r = rsi(close_s, length=length)
+    r = _feature(rsi, close_s, length=length)
     rs = r.ewm(span=smooth, adjust=False).mean()
     dr = rs.diff().abs().ewm(span=length, adjust=False).mean()
     dar = factor * dr
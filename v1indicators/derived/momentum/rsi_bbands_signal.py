@@ -1,6 +1,7 @@
 import pandas as pd
 
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.momentum.rsi import rsi
 
 
@@ -24,7 +25,7 @@ def rsi_bbands_signal(
         raise ValueError("bb_mult must be > 0")
 
     close_s = check_series(close, "close")
-    rsi_line = rsi(close_s, rsi_length)
+    rsi_line = _feature(rsi, close_s, rsi_length)
 
     bb_basis = close_s.rolling(bb_length).mean()
     bb_dev = bb_mult * close_s.rolling(bb_length).std(ddof=0)
@@ -1,7 +1,9 @@
 import pandas as pd
 
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.momentum.rsi import rsi
+from ...foundational.overlap._ewm import _ewm_cascade
 
 
 def rsx(close: pd.Series, length: int = 14) -> pd.Series:
@@ -10,7 +12,6 @@ def rsx(close: pd.Series, length: int = 14) -> pd.Series:
         raise ValueError("length must be > 0")
 
     close_s = check_series(close, "close")
-    r = rsi(close_s, length=length)
-    out = r.ewm(span=length, adjust=False).mean().ewm(span=length, adjust=False).mean()
-    out.name = f"RSX_{length}"
-    return out
+    r = _feature(rsi, close_s, length=length)
+    out = _ewm_cascade(r.to_numpy(dtype=float), (length, length), ((1, 1.0),))
+    return pd.Series(out, index=r.index, name=f"RSX_{length}")
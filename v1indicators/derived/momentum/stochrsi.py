@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.momentum.rsi import rsi
 
 
@@ -21,7 +22,7 @@ def stochrsi(
         raise ValueError("rsi_length, stoch_length, k, and d must be > 0")
 
     close_s = check_series(close, "close")
-    rsi_s = rsi(close_s, rsi_length)
+    rsi_s = _feature(rsi, close_s, rsi_length)
 
     ll = rsi_s.rolling(stoch_length).min()
     hh = rsi_s.rolling(stoch_length).max()
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.volatility.atr import atr
 
 
@@ -20,6 +21,6 @@ def aberration(
     close_s = check_series(close, "close")
 
     zg = ((high_s + low_s + close_s) / 3.0).rolling(length).mean()
-    atr_s = atr(high_s, low_s, close_s, length=atr_length)
+    atr_s = _feature(atr, high_s, low_s, close_s, length=atr_length)
 
     return pd.DataFrame({"ABER_ZG": zg, "ABER_SG": zg + atr_s, "ABER_XG": zg - atr_s})
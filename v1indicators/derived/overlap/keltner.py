@@ -1,5 +1,6 @@
 import pandas as pd
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.overlap.ema import ema
 from ...foundational.volatility.atr import atr
 
@@ -20,8 +21,8 @@ def keltner(
     low = check_series(low, "low")
     close = check_series(close, "close")
 
-    mid = ema(close, length)
-    atr_v = atr(high, low, close, atr_length)
+    mid = _feature(ema, close, length)
+    atr_v = _feature(atr, high, low, close, atr_length)
 
     upper = mid + mult * atr_v
     lower = mid - mult * atr_v
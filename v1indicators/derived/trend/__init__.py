@@ -1,13 +1,14 @@
-from .adx import adx
+from ...foundational._features import feature_cache
+from .adx import ADXStream, adx
 from .cksp import cksp
 from .direction_regime import direction_regime
-from .dual_score_signals import dual_score_signals
+from .dual_score_signals import DualScoreSignalsStream, dual_score_signals
 from .ema_rsi_signal import ema_rsi_signal
 from .high_volume_levels import high_volume_levels
 from .htf_reversal_divergence import htf_reversal_divergence
-from .precision_confluence import precision_confluence
+from .precision_confluence import PrecisionConfluenceStream, precision_confluence
 from .range_filter_confluence import range_filter_confluence
-from .supertrend import supertrend
+from .supertrend import SupertrendGrid, supertrend, supertrend_grid
 from .swing_trend_entry import swing_trend_entry
 from .trendline_breaks import trendline_breaks
 from .ut_bot import ut_bot
@@ -15,6 +16,7 @@ from .ut_bot import ut_bot
 __all__ = [
     "adx",
     "supertrend",
+    "supertrend_grid",
     "ut_bot",
     "trendline_breaks",
     "direction_regime",
@@ -26,4 +28,9 @@ __all__ = [
     "htf_reversal_divergence",
     "range_filter_confluence",
     "high_volume_levels",
+    "ADXStream",
+    "PrecisionConfluenceStream",
+    "DualScoreSignalsStream",
+    "SupertrendGrid",
+    "feature_cache",
 ]
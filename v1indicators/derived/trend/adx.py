@@ -1,7 +1,12 @@
+from typing import Optional
+
 import pandas as pd
 import numpy as np
-from .._utils import check_series
+from numba import njit
+from .._utils import check_series, validate_values
+from ...foundational.overlap._ewm import _EWMMean, _alpha_com, _ewm_mean_update
 from ...foundational.overlap.rma import rma
+from ...foundational.volatility.true_range import _true_range, _true_range_value
 
 def adx(
     high: pd.Series,
@@ -18,14 +23,11 @@ def adx(
     low = check_series(low, "low")
     close = check_series(close, "close")
 
-    prev_close = close.shift()
+    return _adx_from_tr(high, low, _true_range(high, low, close), length)
 
-    # --- True Range ---
-    tr1 = high - low
-    tr2 = (high - prev_close).abs()
-    tr3 = (low - prev_close).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
 
+def _adx_from_tr(high: pd.Series, low: pd.Series, tr: pd.Series, length: int) -> pd.DataFrame:
+    """ADX of validated series given their precomputed true range (see ``_true_range``)."""
     # Wilder ATR (RMA)
     atr_val = rma(tr, length)
 
@@ -65,5 +67,122 @@ def adx(
             f"DMP_{length}": plus_di,
             f"DMN_{length}": minus_di,
         },
-        index=close.index
+        index=tr.index
     )
+
+
+@njit
+def _adx_stream_kernel(high, low, close, prev, atr_state, plus_state, minus_state, adx_state, com):
+    n = close.shape[0]
+    adx_val = np.empty(n, dtype=np.float64)
+    plus_di = np.empty(n, dtype=np.float64)
+    minus_di = np.empty(n, dtype=np.float64)
+
+    for i in range(n):
+        tr = _true_range_value(high[i], low[i], prev[2])
+        atr_val = _ewm_mean_update(atr_state, tr, com, False, 1)
+
+        up_move = high[i] - prev[0]
+        down_move = -(low[i] - prev[1])
+        plus_dm = up_move if (up_move > down_move and up_move > 0) else 0.0
+        minus_dm = down_move if (down_move > up_move and down_move > 0) else 0.0
+
+        plus_smoothed = _ewm_mean_update(plus_state, plus_dm, com, False, 1)
+        minus_smoothed = _ewm_mean_update(minus_state, minus_dm, com, False, 1)
+
+        atr_safe = np.nan if atr_val == 0.0 else atr_val
+        plus_di[i] = 100.0 * (plus_smoothed / atr_safe)
+        minus_di[i] = 100.0 * (minus_smoothed / atr_safe)
+
+        denom = plus_di[i] + minus_di[i]
+        if denom == 0.0:
+            denom = np.nan
+        dx = 100.0 * abs(plus_di[i] - minus_di[i]) / denom
+        adx_val[i] = _ewm_mean_update(adx_state, dx, com, False, 1)
+
+        prev[0] = high[i]
+        prev[1] = low[i]
+        prev[2] = close[i]
+
+    return adx_val, plus_di, minus_di
+
+
+class ADXStream:
+    """
+    Streaming Average Directional Index.
+
+    Carries the previous bar and the four Wilder smoothing states, so each
+    pushed bar costs O(1) and equals the last row of ``adx`` on the extended
+    series.
+    """
+
+    __slots__ = ("length", "value", "_prev", "_atr", "_plus", "_minus", "_adx")
+
+    def __init__(
+        self,
+        high: Optional[pd.Series] = None,
+        low: Optional[pd.Series] = None,
+        close: Optional[pd.Series] = None,
+        length: int = 14,
+    ):
+        if length <= 0:
+            raise ValueError("length must be > 0")
+
+        self.length = length
+        self.value = (np.nan, np.nan, np.nan)
+        self._prev = np.full(3, np.nan, dtype=np.float64)
+        com = _alpha_com(1.0 / length)
+        self._atr = _EWMMean(com, False)
+        self._plus = _EWMMean(com, False)
+        self._minus = _EWMMean(com, False)
+        self._adx = _EWMMean(com, False)
+
+        history = (high, low, close)
+        if any(part is not None for part in history):
+            if any(part is None for part in history):
+                raise ValueError("high, low and close must be given together")
+            self.update_many(high, low, close)
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        """Push one bar and return its ``(ADX, DMP, DMN)``."""
+        self._push(
+            np.array([high], dtype=np.float64),
+            np.array([low], dtype=np.float64),
+            np.array([close], dtype=np.float64),
+        )
+        return self.value
+
+    def update_many(self, high, low, close) -> pd.DataFrame:
+        """Push a batch of bars and return their ADX rows."""
+        adx_val, plus_di, minus_di = self._push(
+            validate_values(high, "high"),
+            validate_values(low, "low"),
+            validate_values(close, "close"),
+        )
+        return pd.DataFrame(
+            {
+                f"ADX_{self.length}": adx_val,
+                f"DMP_{self.length}": plus_di,
+                f"DMN_{self.length}": minus_di,
+            },
+            index=close.index if isinstance(close, pd.Series) else None,
+        )
+
+    def _push(self, high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        if not (high.shape[0] == low.shape[0] == close.shape[0]):
+            raise ValueError("high, low and close must have the same length")
+
+        out = _adx_stream_kernel(
+            high,
+            low,
+            close,
+            self._prev,
+            self._atr.state,
+            self._plus.state,
+            self._minus.state,
+            self._adx.state,
+            self._atr.com,
+        )
+        if close.shape[0]:
+            self.value = (float(out[0][-1]), float(out[1][-1]), float(out[2][-1]))
+        return out
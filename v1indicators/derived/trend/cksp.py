@@ -1,6 +1,7 @@
 import pandas as pd
 
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.volatility.atr import atr
 
 
@@ -22,7 +23,7 @@ def cksp(
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
-    atr_s = atr(high_s, low_s, close_s, length=p)
+    atr_s = _feature(atr, high_s, low_s, close_s, length=p)
     long_stop = (high_s.rolling(p).max() - x * atr_s).rolling(q).max()
     short_stop = (low_s.rolling(p).min() + x * atr_s).rolling(q).min()
 
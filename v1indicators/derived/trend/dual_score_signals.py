@@ -1,15 +1,19 @@
+from typing import Optional
+
 import numpy as np
 import pandas as pd
 from numba import njit
 
-from .._utils import check_series
-from ...derived.momentum.macd import macd
-from ...foundational.momentum.rsi import rsi
-from ...foundational.overlap.ema import ema
-from ...foundational.overlap.sma import sma
-from ...derived.trend.adx import adx
-from ...foundational.volatility.atr import atr
-from ...foundational.volume.vwap import vwap
+from .._utils import check_series, validate_values
+from ...derived.momentum.macd import MACDStream, macd
+from ...foundational.momentum.rsi import RSIStream, _rsi_update, rsi
+from ...foundational.overlap.ema import EMAStream, ema
+from ...foundational.overlap.sma import SMAStream, sma
+from ...derived.trend.adx import ADXStream, _adx_from_tr
+from ...foundational.volatility.atr import ATRStream, _atr_from_tr
+from ...foundational.volatility.true_range import _true_range
+from ...foundational._features import _feature
+from ...foundational.volume.vwap import VWAPStream, vwap
 from ._step_resample import _expand_group_series, _resample_last
 
 
@@ -22,7 +26,14 @@ def _trade_ladder_kernel(
     trigger_sell_v: np.ndarray,
     atr_v: np.ndarray,
     atr_multiplier: float,
+    ladder: np.ndarray,
 ):
+    """ATR target ladder over the EMA cross triggers.
+
+    ``ladder`` is ``[state, entry, sl, tp1..tp5, tp1_hit..tp5_hit]`` (see
+    ``_trade_ladder_state``); it seeds the ladder and is overwritten with the
+    final ladder so a later call can resume from it.
+    """
     n = close_v.shape[0]
 
     state = np.zeros(n, dtype=np.int8)
@@ -43,20 +54,20 @@ def _trade_ladder_kernel(
     buy_signal = np.zeros(n, dtype=np.bool_)
     sell_signal = np.zeros(n, dtype=np.bool_)
 
-    cur_state = 0
-    cur_entry = np.nan
-    cur_sl = np.nan
-    cur_tp1 = np.nan
-    cur_tp2 = np.nan
-    cur_tp3 = np.nan
-    cur_tp4 = np.nan
-    cur_tp5 = np.nan
-
-    cur_tp1_hit = False
-    cur_tp2_hit = False
-    cur_tp3_hit = False
-    cur_tp4_hit = False
-    cur_tp5_hit = False
+    cur_state = int(ladder[0])
+    cur_entry = ladder[1]
+    cur_sl = ladder[2]
+    cur_tp1 = ladder[3]
+    cur_tp2 = ladder[4]
+    cur_tp3 = ladder[5]
+    cur_tp4 = ladder[6]
+    cur_tp5 = ladder[7]
+
+    cur_tp1_hit = ladder[8] != 0.0
+    cur_tp2_hit = ladder[9] != 0.0
+    cur_tp3_hit = ladder[10] != 0.0
+    cur_tp4_hit = ladder[11] != 0.0
+    cur_tp5_hit = ladder[12] != 0.0
 
     for i in range(n):
         if trigger_buy_v[i] and cur_state <= 0:
@@ -134,6 +145,20 @@ def _trade_ladder_kernel(
         tp4_hit[i] = cur_tp4_hit
         tp5_hit[i] = cur_tp5_hit
 
+    ladder[0] = cur_state
+    ladder[1] = cur_entry
+    ladder[2] = cur_sl
+    ladder[3] = cur_tp1
+    ladder[4] = cur_tp2
+    ladder[5] = cur_tp3
+    ladder[6] = cur_tp4
+    ladder[7] = cur_tp5
+    ladder[8] = cur_tp1_hit
+    ladder[9] = cur_tp2_hit
+    ladder[10] = cur_tp3_hit
+    ladder[11] = cur_tp4_hit
+    ladder[12] = cur_tp5_hit
+
     return (
         state,
         buy_signal,
@@ -153,6 +178,59 @@ def _trade_ladder_kernel(
     )
 
 
+def _trade_ladder_state() -> np.ndarray:
+    """Flat ladder state for ``_trade_ladder_kernel``."""
+    ladder = np.full(13, np.nan, dtype=np.float64)
+    ladder[0] = 0.0
+    ladder[8:] = 0.0
+    return ladder
+
+
+@njit
+def _htf_rsi_kernel(close_v, step, carry, prev, gain_state, loss_state, com, min_periods):
+    """RSI of the ``step``-bar resampled close as known at each bar.
+
+    ``carry`` is ``[last valid close of the open group, bars in the open
+    group]``. The open group is evaluated on copies of the RSI state, which is
+    only advanced once the group completes.
+    """
+    n = close_v.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        if not np.isnan(close_v[i]):
+            carry[0] = close_v[i]
+        carry[1] += 1.0
+        if carry[1] >= step:
+            out[i] = _rsi_update(carry[0], prev, gain_state, loss_state, com, min_periods)
+            carry[0] = np.nan
+            carry[1] = 0.0
+        else:
+            out[i] = _rsi_update(carry[0], prev.copy(), gain_state.copy(), loss_state.copy(), com, min_periods)
+    return out
+
+
+def _validate_params(
+    ema_fast: int,
+    ema_slow: int,
+    atr_length: int,
+    adx_length: int,
+    rsi_length: int,
+    mtf_step: int,
+    volume_length: int,
+    atr_multiplier: float,
+) -> None:
+    if ema_fast <= 0 or ema_slow <= 0:
+        raise ValueError("ema_fast and ema_slow must be > 0")
+    if atr_length <= 0 or adx_length <= 0 or rsi_length <= 0:
+        raise ValueError("atr_length, adx_length, and rsi_length must be > 0")
+    if mtf_step <= 0:
+        raise ValueError("mtf_step must be > 0")
+    if volume_length <= 0:
+        raise ValueError("volume_length must be > 0")
+    if atr_multiplier <= 0:
+        raise ValueError("atr_multiplier must be > 0")
+
+
 def dual_score_signals(
     open_: pd.Series,
     high: pd.Series,
@@ -172,16 +250,7 @@ def dual_score_signals(
 
     Inspired by TradingView file 2, reworked into a native reusable indicator.
     """
-    if ema_fast <= 0 or ema_slow <= 0:
-        raise ValueError("ema_fast and ema_slow must be > 0")
-    if atr_length <= 0 or adx_length <= 0 or rsi_length <= 0:
-        raise ValueError("atr_length, adx_length, and rsi_length must be > 0")
-    if mtf_step <= 0:
-        raise ValueError("mtf_step must be > 0")
-    if volume_length <= 0:
-        raise ValueError("volume_length must be > 0")
-    if atr_multiplier <= 0:
-        raise ValueError("atr_multiplier must be > 0")
+    _validate_params(ema_fast, ema_slow, atr_length, adx_length, rsi_length, mtf_step, volume_length, atr_multiplier)
 
     open_s = check_series(open_, "open")
     high_s = check_series(high, "high")
@@ -189,17 +258,20 @@ def dual_score_signals(
     close_s = check_series(close, "close")
     volume_s = check_series(volume, "volume")
 
-    ema_fast_s = ema(close_s, ema_fast)
-    ema_slow_s = ema(close_s, ema_slow)
-    atr_s = atr(high_s, low_s, close_s, length=atr_length)
-    rsi_s = rsi(close_s, length=rsi_length)
-    vwap_s = vwap(high_s, low_s, close_s, volume_s)
-    macd_df = macd(close_s)
-    adx_df = adx(high_s, low_s, close_s, length=adx_length)
-    volume_avg = sma(volume_s, volume_length)
-
-    reduced_close, groups = _resample_last(close_s, mtf_step)
-    rsi_step_reduced = rsi(reduced_close, length=rsi_length)
+    # Building blocks go through the feature cache, so engines run together
+    # inside ``feature_cache()`` share them. ATR and ADX share one true range.
+    ema_fast_s = _feature(ema, close_s, ema_fast)
+    ema_slow_s = _feature(ema, close_s, ema_slow)
+    tr = _feature(_true_range, high_s, low_s, close_s)
+    atr_s = _feature(_atr_from_tr, tr, atr_length)
+    rsi_s = _feature(rsi, close_s, rsi_length)
+    vwap_s = _feature(vwap, high_s, low_s, close_s, volume_s)
+    macd_df = _feature(macd, close_s)
+    adx_df = _feature(_adx_from_tr, high_s, low_s, tr, adx_length)
+    volume_avg = _feature(sma, volume_s, volume_length)
+
+    reduced_close, groups = _feature(_resample_last, close_s, mtf_step)
+    rsi_step_reduced = _feature(rsi, reduced_close, rsi_length)
     rsi_step = _expand_group_series(rsi_step_reduced, groups, close_s.index, name="DSS_RSI_STEP")
 
     adx_col = f"ADX_{adx_length}"
@@ -261,6 +333,7 @@ def dual_score_signals(
         sell_cross.fillna(False).to_numpy(dtype=np.bool_),
         atr_s.to_numpy(dtype=np.float64),
         float(atr_multiplier),
+        _trade_ladder_state(),
     )
 
     state_s = pd.Series(state, index=close_s.index, name="DSS_STATE")
@@ -304,3 +377,218 @@ def dual_score_signals(
         },
         index=close_s.index,
     )
+
+
+_LADDER_COLUMNS = (
+    "DSS_STATE",
+    "DSS_BUY",
+    "DSS_SELL",
+    "DSS_ENTRY",
+    "DSS_SL",
+    "DSS_TP1",
+    "DSS_TP2",
+    "DSS_TP3",
+    "DSS_TP4",
+    "DSS_TP5",
+    "DSS_TP1_HIT",
+    "DSS_TP2_HIT",
+    "DSS_TP3_HIT",
+    "DSS_TP4_HIT",
+    "DSS_TP5_HIT",
+)
+
+
+class DualScoreSignalsStream:
+    """
+    Streaming ``dual_score_signals``.
+
+    Carries every indicator feeding the scores, the ``mtf_step`` RSI and the
+    target ladder, so each pushed bar costs O(1) and equals the last row of
+    ``dual_score_signals`` on the extended history. The step RSI of a group
+    that is still open is evaluated provisionally, as the batch engine would
+    see it on the truncated history.
+
+    The object holds only plain Python and NumPy state: pickle it to snapshot
+    a session and unpickle it to resume without replaying the history.
+
+    Args:
+        open_, high, low, close, volume: Optional Pandas Series of past bars to
+            seed the state; give all of them or none.
+        Remaining arguments: Same meaning as in ``dual_score_signals``.
+    """
+
+    __slots__ = (
+        "value",
+        "_mtf_step",
+        "_atr_multiplier",
+        "_ema_fast",
+        "_ema_slow",
+        "_atr",
+        "_rsi",
+        "_vwap",
+        "_macd",
+        "_adx",
+        "_volume_avg",
+        "_rsi_step",
+        "_step_carry",
+        "_prev_fast",
+        "_prev_slow",
+        "_ladder",
+    )
+
+    def __init__(
+        self,
+        open_: Optional[pd.Series] = None,
+        high: Optional[pd.Series] = None,
+        low: Optional[pd.Series] = None,
+        close: Optional[pd.Series] = None,
+        volume: Optional[pd.Series] = None,
+        ema_fast: int = 9,
+        ema_slow: int = 21,
+        atr_length: int = 14,
+        adx_length: int = 14,
+        rsi_length: int = 14,
+        mtf_step: int = 5,
+        volume_length: int = 20,
+        atr_multiplier: float = 1.5,
+    ):
+        _validate_params(ema_fast, ema_slow, atr_length, adx_length, rsi_length, mtf_step, volume_length, atr_multiplier)
+
+        self.value = None
+        self._mtf_step = int(mtf_step)
+        self._atr_multiplier = float(atr_multiplier)
+
+        self._ema_fast = EMAStream(None, ema_fast)
+        self._ema_slow = EMAStream(None, ema_slow)
+        self._atr = ATRStream(length=atr_length)
+        self._rsi = RSIStream(length=rsi_length)
+        self._vwap = VWAPStream()
+        self._macd = MACDStream()
+        self._adx = ADXStream(length=adx_length)
+        self._volume_avg = SMAStream(None, volume_length)
+        self._rsi_step = RSIStream(length=rsi_length)
+        self._step_carry = np.array([np.nan, 0.0], dtype=np.float64)
+        self._prev_fast = np.nan
+        self._prev_slow = np.nan
+        self._ladder = _trade_ladder_state()
+
+        history = (open_, high, low, close, volume)
+        if any(part is not None for part in history):
+            if any(part is None for part in history):
+                raise ValueError("open_, high, low, close and volume must be given together")
+            self.update_many(open_, high, low, close, volume)
+
+    def update(self, open_: float, high: float, low: float, close: float, volume: float) -> dict:
+        """Push one bar and return its row as a ``{column: value}`` dict."""
+        self._push(*(np.array([part], dtype=np.float64) for part in (open_, high, low, close, volume)))
+        return self.value
+
+    def update_many(self, open_, high, low, close, volume) -> pd.DataFrame:
+        """Push a batch of bars and return their rows as ``dual_score_signals`` would."""
+        columns = self._push(
+            validate_values(open_, "open"),
+            validate_values(high, "high"),
+            validate_values(low, "low"),
+            validate_values(close, "close"),
+            validate_values(volume, "volume"),
+        )
+        return pd.DataFrame(columns, index=close.index if isinstance(close, pd.Series) else None)
+
+    def _push(self, open_, high, low, close, volume) -> dict:
+        m = close.shape[0]
+        if not (open_.shape[0] == high.shape[0] == low.shape[0] == m == volume.shape[0]):
+            raise ValueError("open_, high, low, close and volume must have the same length")
+
+        ema_fast = self._ema_fast.update_many(close)
+        ema_slow = self._ema_slow.update_many(close)
+        atr_v = self._atr.update_many(high, low, close)
+        rsi_v = self._rsi.update_many(close)
+        vwap_v = self._vwap.update_many(high, low, close, volume)
+        macd_line, macd_signal, _ = self._macd._push(close)
+        adx_v, _, _ = self._adx._push(high, low, close)
+        volume_avg = self._volume_avg.update_many(volume)
+        rsi_step = _htf_rsi_kernel(
+            close,
+            self._mtf_step,
+            self._step_carry,
+            self._rsi_step._prev,
+            self._rsi_step._gain.state,
+            self._rsi_step._loss.state,
+            self._rsi_step._gain.com,
+            self._rsi_step._gain.min_periods,
+        )
+
+        bull_score = (
+            (close > vwap_v).astype(np.float64)
+            + (rsi_v > 50.0).astype(np.float64)
+            + (macd_line > macd_signal).astype(np.float64)
+            + (ema_fast > ema_slow).astype(np.float64)
+            + ((adx_v > 25.0) & (close > ema_fast)).astype(np.float64)
+            + ((volume > volume_avg) & (close > open_)).astype(np.float64)
+            + (rsi_step > 50.0).astype(np.float64)
+        )
+        bear_score = (
+            (close < vwap_v).astype(np.float64)
+            + (rsi_v < 50.0).astype(np.float64)
+            + (macd_line < macd_signal).astype(np.float64)
+            + (ema_fast < ema_slow).astype(np.float64)
+            + ((adx_v > 25.0) & (close < ema_fast)).astype(np.float64)
+            + ((volume > volume_avg) & (close < open_)).astype(np.float64)
+            + (rsi_step < 50.0).astype(np.float64)
+        )
+        bull_pct = (bull_score / 7.0) * 100.0
+        bear_pct = (bear_score / 7.0) * 100.0
+
+        diff = bull_pct - bear_pct
+        bias = np.zeros(m, dtype=np.int8)
+        bias[diff >= 40.0] = 2
+        bias[diff <= -40.0] = -2
+        bias[(diff > 0.0) & (diff < 40.0)] = 1
+        bias[(diff < 0.0) & (diff > -40.0)] = -1
+
+        prev_fast = np.concatenate(([self._prev_fast], ema_fast[:-1]))
+        prev_slow = np.concatenate(([self._prev_slow], ema_slow[:-1]))
+        if m:
+            self._prev_fast = float(ema_fast[-1])
+            self._prev_slow = float(ema_slow[-1])
+
+        ladder = _trade_ladder_kernel(
+            close,
+            high,
+            low,
+            (ema_fast > ema_slow) & (prev_fast <= prev_slow),
+            (ema_fast < ema_slow) & (prev_fast >= prev_slow),
+            atr_v,
+            self._atr_multiplier,
+            self._ladder,
+        )
+        state = ladder[0]
+        retest = ((state == 1) & (low <= ema_fast) & (low > ema_slow)) | (
+            (state == -1) & (high >= ema_fast) & (high < ema_slow)
+        )
+
+        columns = {
+            "DSS_EMA_FAST": ema_fast,
+            "DSS_EMA_SLOW": ema_slow,
+            "DSS_VWAP": vwap_v,
+            "DSS_ATR": atr_v,
+            "DSS_RSI": rsi_v,
+            "DSS_RSI_STEP": rsi_step,
+            "DSS_MACD": macd_line,
+            "DSS_MACD_SIGNAL": macd_signal,
+            "DSS_ADX": adx_v,
+            "DSS_BULL_SCORE": bull_score,
+            "DSS_BEAR_SCORE": bear_score,
+            "DSS_BULL_PCT": bull_pct,
+            "DSS_BEAR_PCT": bear_pct,
+            "DSS_BIAS": bias,
+        }
+        ladder_columns = dict(zip(_LADDER_COLUMNS, ladder))
+        columns["DSS_BUY"] = ladder_columns.pop("DSS_BUY")
+        columns["DSS_SELL"] = ladder_columns.pop("DSS_SELL")
+        columns.update(ladder_columns)
+        columns["DSS_RETEST"] = retest
+
+        if m:
+            self.value = {name: col[-1].item() for name, col in columns.items()}
+        return columns
@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.momentum.rsi import rsi
 from ...foundational.overlap.ema import ema
 
@@ -24,9 +25,9 @@ def ema_rsi_signal(
 
     close_s = check_series(close, "close")
 
-    fast_ema = ema(close_s, fast_length)
-    slow_ema = ema(close_s, slow_length)
-    rsi_line = rsi(close_s, rsi_length)
+    fast_ema = _feature(ema, close_s, fast_length)
+    slow_ema = _feature(ema, close_s, slow_length)
+    rsi_line = _feature(rsi, close_s, rsi_length)
 
     long_signal = (fast_ema > slow_ema) & (rsi_line > rsi_buy_level)
     short_signal = (fast_ema < slow_ema) & (rsi_line < rsi_sell_level)
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from .._utils import check_series
+from ...foundational._pivots import _swing_pivots
 from ...foundational.volume.delta_volume import delta_volume
 
 
@@ -33,8 +34,8 @@ def high_volume_levels(
     vol_hi = dvol.rolling(vol_length).max()
     vol_lo = dvol.rolling(vol_length).min()
 
-    ph = high_s.where(high_s == high_s.rolling(2 * lookback + 1).max().shift(-lookback))
-    pl = low_s.where(low_s == low_s.rolling(2 * lookback + 1).min().shift(-lookback))
+    ph = _swing_pivots(high_s, lookback, lookback, find_high=True)
+    pl = _swing_pivots(low_s, lookback, lookback, find_high=False)
 
     resistance = ph.where(dvol < vol_lo).ffill()
     support = pl.where(dvol > vol_hi).ffill()
@@ -1,23 +1,25 @@
 import numpy as np
 import pandas as pd
-from numba import njit
+from numba import njit, prange
 
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.momentum.rsi import rsi
+from ...foundational._pivots import _pivot_block
+from ...foundational.trend._parallel import _block_bounds, _parallel_blocks
 from ._step_resample import _group_end_mask, _resample_ohlc
 
 
 @njit
-def _rsi_divergence_kernel(
-    rsi_v: np.ndarray,
-    low_v: np.ndarray,
-    high_v: np.ndarray,
-    left: int,
-    right: int,
-):
+def _rsi_pivots_block(rsi_v, valid, left, right, lo, hi, pivot_low, pivot_high):
+    """RSI pivot flags of bars ``lo .. hi - 1``; bars that are not ``valid`` are ignored."""
+    _pivot_block(rsi_v, valid, left, right, False, False, lo, hi, pivot_low)
+    _pivot_block(rsi_v, valid, left, right, True, False, lo, hi, pivot_high)
+
+
+@njit
+def _rsi_divergence_from_pivots(rsi_v, low_v, high_v, pivot_low, pivot_high):
     n = rsi_v.shape[0]
-    pivot_low = np.zeros(n, dtype=np.bool_)
-    pivot_high = np.zeros(n, dtype=np.bool_)
     bull_div = np.zeros(n, dtype=np.bool_)
     bear_div = np.zeros(n, dtype=np.bool_)
 
@@ -29,28 +31,10 @@ def _rsi_divergence_kernel(
     prev_high_price = np.nan
     prev_high_rsi = np.nan
 
-    for i in range(left, n - right):
+    for i in range(n):
         rv = rsi_v[i]
-        if np.isnan(rv):
-            continue
-
-        is_low = True
-        is_high = True
-        for j in range(i - left, i + right + 1):
-            if j == i:
-                continue
-            rj = rsi_v[j]
-            if np.isnan(rj):
-                continue
-            if rj < rv:
-                is_low = False
-            if rj > rv:
-                is_high = False
-            if not is_low and not is_high:
-                break
-
-        if is_low:
-            pivot_low[i] = True
+
+        if pivot_low[i]:
             if has_prev_low and not np.isnan(low_v[i]) and not np.isnan(prev_low_price):
                 if low_v[i] < prev_low_price and rv > prev_low_rsi:
                     bull_div[i] = True
@@ -58,8 +42,7 @@ def _rsi_divergence_kernel(
             prev_low_rsi = rv
             has_prev_low = True
 
-        if is_high:
-            pivot_high[i] = True
+        if pivot_high[i]:
             if has_prev_high and not np.isnan(high_v[i]) and not np.isnan(prev_high_price):
                 if high_v[i] > prev_high_price and rv < prev_high_rsi:
                     bear_div[i] = True
@@ -67,6 +50,42 @@ def _rsi_divergence_kernel(
             prev_high_rsi = rv
             has_prev_high = True
 
+    return bull_div, bear_div
+
+
+@njit
+def _rsi_divergence_kernel(
+    rsi_v: np.ndarray,
+    low_v: np.ndarray,
+    high_v: np.ndarray,
+    left: int,
+    right: int,
+):
+    n = rsi_v.shape[0]
+    pivot_low = np.zeros(n, dtype=np.bool_)
+    pivot_high = np.zeros(n, dtype=np.bool_)
+    _rsi_pivots_block(rsi_v, ~np.isnan(rsi_v), left, right, left, max(n - right, left), pivot_low, pivot_high)
+    bull_div, bear_div = _rsi_divergence_from_pivots(rsi_v, low_v, high_v, pivot_low, pivot_high)
+    return pivot_low, pivot_high, bull_div, bear_div
+
+
+@njit(parallel=True)
+def _rsi_divergence_parallel_kernel(
+    rsi_v: np.ndarray,
+    low_v: np.ndarray,
+    high_v: np.ndarray,
+    left: int,
+    right: int,
+    blocks: int,
+):
+    n = rsi_v.shape[0]
+    pivot_low = np.zeros(n, dtype=np.bool_)
+    pivot_high = np.zeros(n, dtype=np.bool_)
+    valid = ~np.isnan(rsi_v)
+    bounds = _block_bounds(max(n - right - left, 0), blocks)
+    for b in prange(blocks):
+        _rsi_pivots_block(rsi_v, valid, left, right, left + bounds[b], left + bounds[b + 1], pivot_low, pivot_high)
+    bull_div, bear_div = _rsi_divergence_from_pivots(rsi_v, low_v, high_v, pivot_low, pivot_high)
     return pivot_low, pivot_high, bull_div, bear_div
 
 
@@ -79,10 +98,13 @@ def htf_reversal_divergence(
     rsi_length: int = 14,
     pivot_left: int = 5,
     pivot_right: int = 5,
+    parallel: bool = False,
 ) -> pd.DataFrame:
     """HTF reversal-pattern flags with RSI pivot divergence confirmation.
 
     Inspired by TradingView file 6, focused on non-visual signal outputs.
+    With `parallel=True` the RSI pivot scan runs on all numba threads; the
+    output is identical to the serial run.
     """
     if htf_step <= 0:
         raise ValueError("htf_step must be > 0")
@@ -129,14 +151,20 @@ def htf_reversal_divergence(
     hammer_full = pd.Series(hammer_arr, index=close_s.index)
     star_full = pd.Series(star_arr, index=close_s.index)
 
-    rsi_s = rsi(close_s, length=rsi_length)
-    pivot_low, pivot_high, bull_div, bear_div = _rsi_divergence_kernel(
+    rsi_s = _feature(rsi, close_s, length=rsi_length)
+    args = (
         rsi_s.to_numpy(dtype=np.float64),
         low_s.to_numpy(dtype=np.float64),
         high_s.to_numpy(dtype=np.float64),
         int(pivot_left),
         int(pivot_right),
     )
+    if parallel:
+        pivot_low, pivot_high, bull_div, bear_div = _rsi_divergence_parallel_kernel(
+            *args, _parallel_blocks(len(close_s))
+        )
+    else:
+        pivot_low, pivot_high, bull_div, bear_div = _rsi_divergence_kernel(*args)
 
     return pd.DataFrame(
         {
@@ -1,15 +1,20 @@
+from typing import Optional
+
 import numpy as np
 import pandas as pd
 from numba import njit
 
-from .._utils import check_series
-from ...derived.momentum.macd import macd
-from ...foundational.momentum.rsi import rsi
-from ...foundational.overlap.ema import ema
-from ...foundational.overlap.sma import sma
-from ...derived.trend.adx import adx
-from ...foundational.volatility.atr import atr
-from ...foundational.volume.vwap import vwap
+from .._utils import check_series, validate_values
+from ...derived.momentum.macd import MACDStream, macd
+from ...foundational.momentum.rsi import RSIStream, rsi
+from ...foundational.overlap._ewm import _EWMMean, _span_com
+from ...foundational.overlap.ema import EMAStream, ema
+from ...foundational.overlap.sma import SMAStream, sma
+from ...derived.trend.adx import ADXStream, _adx_from_tr
+from ...foundational.volatility.atr import ATRStream, _atr_from_tr
+from ...foundational.volatility.true_range import _true_range
+from ...foundational._features import _feature
+from ...foundational.volume.vwap import VWAPStream, vwap
 from ._step_resample import _expand_group_series, _resample_last
 
 
@@ -31,6 +36,12 @@ HTF_BIAS_WEIGHT = 1.5
 # Additional weight for fast-EMA directional alignment when composing the score.
 FAST_EMA_WEIGHT = 0.5
 
+# Fixed lengths of the secondary confirmations.
+_MACD_SLOW = 26
+_MACD_SIGNAL = 9
+_ADX_LENGTH = 14
+_VOL_SMA_LENGTH = 20
+
 def _resolve_profile(
     preset: str,
     ema_fast: int,
@@ -74,7 +85,14 @@ def _precision_trade_kernel(
     use_trailing: bool,
     swing_low_v: np.ndarray,
     swing_high_v: np.ndarray,
+    state: np.ndarray,
 ):
+    """Trade ladder over the gated signals.
+
+    ``state`` is ``[dir, entry, sl, tp1, tp2, tp3, trail, tp1_hit, tp2_hit,
+    tp3_hit, sl_hit]`` (see ``_precision_trade_state``); it seeds the ladder and
+    is overwritten with the final ladder so a later call can resume from it.
+    """
     n = close_v.shape[0]
     direction = np.zeros(n, dtype=np.int8)
     entry = np.full(n, np.nan, dtype=np.float64)
@@ -89,17 +107,17 @@ def _precision_trade_kernel(
     tp3_hit = np.zeros(n, dtype=np.bool_)
     sl_hit = np.zeros(n, dtype=np.bool_)
 
-    cur_dir = 0
-    cur_entry = np.nan
-    cur_sl = np.nan
-    cur_tp1 = np.nan
-    cur_tp2 = np.nan
-    cur_tp3 = np.nan
-    cur_trail = np.nan
-    cur_tp1_hit = False
-    cur_tp2_hit = False
-    cur_tp3_hit = False
-    cur_sl_hit = False
+    cur_dir = int(state[0])
+    cur_entry = state[1]
+    cur_sl = state[2]
+    cur_tp1 = state[3]
+    cur_tp2 = state[4]
+    cur_tp3 = state[5]
+    cur_trail = state[6]
+    cur_tp1_hit = state[7] != 0.0
+    cur_tp2_hit = state[8] != 0.0
+    cur_tp3_hit = state[9] != 0.0
+    cur_sl_hit = state[10] != 0.0
 
     for i in range(n):
         if buy_v[i]:
@@ -208,9 +226,83 @@ def _precision_trade_kernel(
         tp3_hit[i] = cur_tp3_hit
         sl_hit[i] = cur_sl_hit
 
+    state[0] = cur_dir
+    state[1] = cur_entry
+    state[2] = cur_sl
+    state[3] = cur_tp1
+    state[4] = cur_tp2
+    state[5] = cur_tp3
+    state[6] = cur_trail
+    state[7] = cur_tp1_hit
+    state[8] = cur_tp2_hit
+    state[9] = cur_tp3_hit
+    state[10] = cur_sl_hit
+
     return direction, entry, sl, tp1, tp2, tp3, trail, tp1_hit, tp2_hit, tp3_hit, sl_hit
 
 
+def _validate_params(swing_lookback: int, tp1_mult: float, tp2_mult: float, tp3_mult: float, htf_step: int) -> None:
+    if swing_lookback <= 0:
+        raise ValueError("swing_lookback must be > 0")
+    if tp1_mult <= 0 or tp2_mult <= 0 or tp3_mult <= 0:
+        raise ValueError("tp multipliers must be > 0")
+    if htf_step <= 0:
+        raise ValueError("htf_step must be > 0")
+
+
+def _precision_warmup(ef: int, es: int, et: int, rl: int, swing_lookback: int) -> int:
+    return max(
+        _MIN_WARMUP_BARS,
+        ef,
+        es,
+        et,
+        rl,
+        _MACD_SLOW,
+        _MACD_SIGNAL,
+        _ADX_LENGTH,
+        _VOL_SMA_LENGTH,
+        swing_lookback,
+    )
+
+
+def _precision_trade_state() -> np.ndarray:
+    """Flat trade ladder state for ``_precision_trade_kernel``."""
+    state = np.full(11, np.nan, dtype=np.float64)
+    state[0] = 0.0
+    state[7:] = 0.0
+    return state
+
+
+@njit
+def _precision_gate(
+    raw_buy: np.ndarray,
+    raw_sell: np.ndarray,
+    warmup: int,
+    offset: int = 0,
+    last_dir: int = 0,
+):
+    """Warmup and same-direction dedupe of the raw signals.
+
+    ``offset`` is the absolute bar index of ``raw_buy[0]``; the final
+    ``last_dir`` is returned so the gate can be resumed.
+    """
+    n = raw_buy.shape[0]
+    buy = np.zeros(n, dtype=np.bool_)
+    sell = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        cb = raw_buy[i] and last_dir != 1 and offset + i >= warmup
+        cs = raw_sell[i] and last_dir != -1 and offset + i >= warmup
+        if cb and cs:
+            cs = False
+        if cb:
+            last_dir = 1
+        elif cs:
+            last_dir = -1
+        buy[i] = cb
+        sell[i] = cs
+    return buy, sell, last_dir
+
+
 def precision_confluence(
     open_: pd.Series,
     high: pd.Series,
@@ -239,12 +331,7 @@ def precision_confluence(
 
     Inspired by TradingView file 4, implemented as a native v1indicators API.
     """
-    if swing_lookback <= 0:
-        raise ValueError("swing_lookback must be > 0")
-    if tp1_mult <= 0 or tp2_mult <= 0 or tp3_mult <= 0:
-        raise ValueError("tp multipliers must be > 0")
-    if htf_step <= 0:
-        raise ValueError("htf_step must be > 0")
+    _validate_params(swing_lookback, tp1_mult, tp2_mult, tp3_mult, htf_step)
 
     check_series(open_, "open")
     high_s = check_series(high, "high")
@@ -263,23 +350,25 @@ def precision_confluence(
         sl_mult,
     )
 
-    ema_fast_s = ema(close_s, ef)
-    ema_slow_s = ema(close_s, es)
-    ema_trend_s = ema(close_s, et)
-    atr_s = atr(high_s, low_s, close_s, length=al)
-    rsi_s = rsi(close_s, length=rl)
-    macd_slow = 26
-    macd_signal = 9
-    macd_df = macd(close_s)
-    adx_len = 14
-    adx_df = adx(high_s, low_s, close_s, length=adx_len)
-    vol_sma_len = 20
-    vol_sma = sma(volume_s, vol_sma_len)
-    vwap_s = vwap(high_s, low_s, close_s, volume_s)
-
-    reduced_close, groups = _resample_last(close_s, htf_step)
-    htf_fast = ema(reduced_close, ef)
-    htf_slow = ema(reduced_close, es)
+    if al <= 0:
+        raise ValueError("atr_length must be > 0")
+
+    # Building blocks go through the feature cache, so engines run together
+    # inside ``feature_cache()`` share them. ATR and ADX share one true range.
+    ema_fast_s = _feature(ema, close_s, ef)
+    ema_slow_s = _feature(ema, close_s, es)
+    ema_trend_s = _feature(ema, close_s, et)
+    tr = _feature(_true_range, high_s, low_s, close_s)
+    atr_s = _feature(_atr_from_tr, tr, al)
+    rsi_s = _feature(rsi, close_s, rl)
+    macd_df = _feature(macd, close_s)
+    adx_df = _feature(_adx_from_tr, high_s, low_s, tr, _ADX_LENGTH)
+    vol_sma = _feature(sma, volume_s, _VOL_SMA_LENGTH)
+    vwap_s = _feature(vwap, high_s, low_s, close_s, volume_s)
+
+    reduced_close, groups = _feature(_resample_last, close_s, htf_step)
+    htf_fast = _feature(ema, reduced_close, ef)
+    htf_slow = _feature(ema, reduced_close, es)
     htf_fast_full = _expand_group_series(htf_fast, groups, close_s.index, name="PC_HTF_FAST")
     htf_slow_full = _expand_group_series(htf_slow, groups, close_s.index, name="PC_HTF_SLOW")
     htf_bias = pd.Series(
@@ -330,32 +419,8 @@ def precision_confluence(
     raw_buy_np = raw_buy.to_numpy(dtype=bool, copy=False)
     raw_sell_np = raw_sell.to_numpy(dtype=bool, copy=False)
 
-    warmup = max(
-        _MIN_WARMUP_BARS,
-        ef,
-        es,
-        et,
-        rl,
-        macd_slow,
-        macd_signal,
-        adx_len,
-        vol_sma_len,
-        swing_lookback,
-    )
-    buy = np.zeros(len(close_s), dtype=bool)
-    sell = np.zeros(len(close_s), dtype=bool)
-    last_dir = 0
-    for i in range(len(close_s)):
-        cb = raw_buy_np[i] and last_dir != 1 and i >= warmup
-        cs = raw_sell_np[i] and last_dir != -1 and i >= warmup
-        if cb and cs:
-            cs = False
-        if cb:
-            last_dir = 1
-        elif cs:
-            last_dir = -1
-        buy[i] = cb
-        sell[i] = cs
+    warmup = _precision_warmup(ef, es, et, rl, swing_lookback)
+    buy, sell, _ = _precision_gate(raw_buy_np, raw_sell_np, warmup)
 
     swing_low = low_s.rolling(swing_lookback, min_periods=1).min()
     swing_high = high_s.rolling(swing_lookback, min_periods=1).max()
@@ -387,6 +452,7 @@ def precision_confluence(
         bool(use_trailing),
         swing_low.to_numpy(dtype=np.float64),
         swing_high.to_numpy(dtype=np.float64),
+        _precision_trade_state(),
     )
 
     return pd.DataFrame(
@@ -423,3 +489,413 @@ def precision_confluence(
         },
         index=close_s.index,
     )
+
+
+@njit
+def _rolling_extreme_kernel(tail, values, lookback, use_max):
+    """``rolling(lookback, min_periods=1).min()/max()`` of ``values`` preceded by ``tail``."""
+    offset = tail.shape[0]
+    n = values.shape[0]
+    data = np.empty(offset + n, dtype=np.float64)
+    data[:offset] = tail
+    data[offset:] = values
+
+    out = np.full(n, np.nan, dtype=np.float64)
+    for i in range(n):
+        end = offset + i + 1
+        start = max(end - lookback, 0)
+        best = np.nan
+        for j in range(start, end):
+            v = data[j]
+            if np.isnan(v):
+                continue
+            if np.isnan(best) or (use_max and v > best) or (not use_max and v < best):
+                best = v
+        out[i] = best
+    return out
+
+
+# Columns of the per-bar rows kept for the open higher-timeframe group.
+_ROW_BULL_BASE = 0
+_ROW_BEAR_BASE = 1
+_ROW_BULL_FAST = 2
+_ROW_BEAR_FAST = 3
+_ROW_BUY_OK = 4
+_ROW_SELL_OK = 5
+_ROW_CLOSE = 6
+_ROW_HIGH = 7
+_ROW_LOW = 8
+_ROW_ATR = 9
+_ROW_SWING_LOW = 10
+_ROW_SWING_HIGH = 11
+_ROW_WIDTH = 12
+
+_TRADE_COLUMNS = (
+    "PC_DIR",
+    "PC_ENTRY",
+    "PC_SL",
+    "PC_TP1",
+    "PC_TP2",
+    "PC_TP3",
+    "PC_TRAIL",
+    "PC_TP1_HIT",
+    "PC_TP2_HIT",
+    "PC_TP3_HIT",
+    "PC_SL_HIT",
+)
+
+
+class PrecisionConfluenceStream:
+    """
+    Streaming ``precision_confluence``.
+
+    Every indicator feeding the score is carried by its own stream, the
+    signal gate and trade ladder keep their carry state, and each pushed bar
+    yields the last row of ``precision_confluence`` on the extended history.
+
+    The higher-timeframe bias is taken from the last close of the still-open
+    ``htf_step`` group, so it can change until that group completes and the
+    batch engine repaints the whole group with it. The stream reproduces this
+    by replaying the open group (at most ``htf_step`` bars) from the gate and
+    ladder state at the group start; nothing is committed until the group
+    closes.
+
+    Args:
+        open_, high, low, close, volume: Optional Pandas Series of past bars to
+            seed the state; give all of them or none.
+        Remaining arguments: Same meaning as in ``precision_confluence``.
+    """
+
+    __slots__ = (
+        "value",
+        "_ef",
+        "_score_req",
+        "_sl_mult",
+        "_tp_mults",
+        "_use_trailing",
+        "_use_structure_sl",
+        "_swing_lookback",
+        "_htf_step",
+        "_htf_bias_weight",
+        "_fast_ema_weight",
+        "_profile",
+        "_warmup",
+        "_ema_fast",
+        "_ema_slow",
+        "_ema_trend",
+        "_atr",
+        "_rsi",
+        "_macd",
+        "_adx",
+        "_vol_sma",
+        "_vwap",
+        "_htf_fast",
+        "_htf_slow",
+        "_htf_last",
+        "_low_tail",
+        "_high_tail",
+        "_prev_fast",
+        "_prev_slow",
+        "_group",
+        "_group_len",
+        "_group_start",
+        "_last_dir",
+        "_trade",
+    )
+
+    def __init__(
+        self,
+        open_: Optional[pd.Series] = None,
+        high: Optional[pd.Series] = None,
+        low: Optional[pd.Series] = None,
+        close: Optional[pd.Series] = None,
+        volume: Optional[pd.Series] = None,
+        preset: str = "default",
+        ema_fast: int = 9,
+        ema_slow: int = 21,
+        ema_trend: int = 55,
+        rsi_length: int = 13,
+        atr_length: int = 14,
+        min_score: int = 5,
+        sl_mult: float = 1.5,
+        tp1_mult: float = 1.0,
+        tp2_mult: float = 2.0,
+        tp3_mult: float = 3.0,
+        use_trailing: bool = True,
+        use_structure_sl: bool = True,
+        swing_lookback: int = 10,
+        htf_step: int = 5,
+        htf_bias_weight: float = HTF_BIAS_WEIGHT,
+        fast_ema_weight: float = FAST_EMA_WEIGHT,
+    ):
+        _validate_params(swing_lookback, tp1_mult, tp2_mult, tp3_mult, htf_step)
+        ef, es, et, rl, al, score_req, sl_eff, resolved_preset = _resolve_profile(
+            preset,
+            ema_fast,
+            ema_slow,
+            ema_trend,
+            rsi_length,
+            atr_length,
+            min_score,
+            sl_mult,
+        )
+
+        self.value = None
+        self._ef = ef
+        self._score_req = float(score_req)
+        self._sl_mult = float(sl_eff)
+        self._tp_mults = (float(tp1_mult), float(tp2_mult), float(tp3_mult))
+        self._use_trailing = bool(use_trailing)
+        self._use_structure_sl = bool(use_structure_sl)
+        self._swing_lookback = int(swing_lookback)
+        self._htf_step = int(htf_step)
+        self._htf_bias_weight = float(htf_bias_weight)
+        self._fast_ema_weight = float(fast_ema_weight)
+        self._profile = resolved_preset
+        self._warmup = _precision_warmup(ef, es, et, rl, swing_lookback)
+
+        self._ema_fast = EMAStream(None, ef)
+        self._ema_slow = EMAStream(None, es)
+        self._ema_trend = EMAStream(None, et)
+        self._atr = ATRStream(length=al)
+        self._rsi = RSIStream(length=rl)
+        self._macd = MACDStream(slow=_MACD_SLOW, signal=_MACD_SIGNAL)
+        self._adx = ADXStream(length=_ADX_LENGTH)
+        self._vol_sma = SMAStream(None, _VOL_SMA_LENGTH)
+        self._vwap = VWAPStream()
+
+        self._htf_fast = _EWMMean(_span_com(ef), False)
+        self._htf_slow = _EWMMean(_span_com(es), False)
+        self._htf_last = np.nan
+        self._low_tail = np.empty(0, dtype=np.float64)
+        self._high_tail = np.empty(0, dtype=np.float64)
+        self._prev_fast = np.nan
+        self._prev_slow = np.nan
+
+        self._group = np.empty((self._htf_step, _ROW_WIDTH), dtype=np.float64)
+        self._group_len = 0
+        self._group_start = 0
+        self._last_dir = 0
+        self._trade = _precision_trade_state()
+
+        history = (open_, high, low, close, volume)
+        if any(part is not None for part in history):
+            if any(part is None for part in history):
+                raise ValueError("open_, high, low, close and volume must be given together")
+            self._seed(open_, high, low, close, volume)
+
+    def update(self, open_: float, high: float, low: float, close: float, volume: float) -> dict:
+        """Push one bar and return its row as a ``{column: value}`` dict."""
+        self._push(*(np.array([part], dtype=np.float64) for part in (open_, high, low, close, volume)))
+        return self.value
+
+    def update_many(self, open_, high, low, close, volume) -> pd.DataFrame:
+        """Push a batch of bars and return their rows as ``precision_confluence`` would."""
+        columns = self._push(
+            validate_values(open_, "open"),
+            validate_values(high, "high"),
+            validate_values(low, "low"),
+            validate_values(close, "close"),
+            validate_values(volume, "volume"),
+        )
+        return pd.DataFrame(columns, index=close.index if isinstance(close, pd.Series) else None)
+
+    def _features(self, open_, high, low, close, volume):
+        """Advance the indicator streams and build the HTF-independent rows."""
+        m = close.shape[0]
+        if not (open_.shape[0] == high.shape[0] == low.shape[0] == m == volume.shape[0]):
+            raise ValueError("open_, high, low, close and volume must have the same length")
+
+        ema_f = self._ema_fast.update_many(close)
+        ema_s = self._ema_slow.update_many(close)
+        ema_t = self._ema_trend.update_many(close)
+        atr_v = self._atr.update_many(high, low, close)
+        rsi_v = self._rsi.update_many(close)
+        macd_line, macd_signal, macd_hist = self._macd._push(close)
+        adx_v, dmp, dmn = self._adx._push(high, low, close)
+        vol_sma = self._vol_sma.update_many(volume)
+        vwap_v = self._vwap.update_many(high, low, close, volume)
+
+        lookback = self._swing_lookback
+        swing_low = _rolling_extreme_kernel(self._low_tail, low, lookback, False)
+        swing_high = _rolling_extreme_kernel(self._high_tail, high, lookback, True)
+        self._low_tail = np.concatenate((self._low_tail, low))[-(lookback - 1) :] if lookback > 1 else low[:0]
+        self._high_tail = np.concatenate((self._high_tail, high))[-(lookback - 1) :] if lookback > 1 else high[:0]
+
+        prev_fast = np.concatenate(([self._prev_fast], ema_f[:-1]))
+        prev_slow = np.concatenate(([self._prev_slow], ema_s[:-1]))
+        if m:
+            self._prev_fast = float(ema_f[-1])
+            self._prev_slow = float(ema_s[-1])
+
+        rows = np.empty((m, _ROW_WIDTH), dtype=np.float64)
+        rows[:, _ROW_BULL_BASE] = (
+            (ema_f > ema_s).astype(np.float64)
+            + (close > ema_t).astype(np.float64)
+            + ((rsi_v > 50.0) & (rsi_v < 75.0)).astype(np.float64)
+            + (macd_hist > 0.0).astype(np.float64)
+            + (macd_line > macd_signal).astype(np.float64)
+            + (close > vwap_v).astype(np.float64)
+            + (volume > vol_sma).astype(np.float64)
+            + ((adx_v > 20.0) & (dmp > dmn)).astype(np.float64)
+        )
+        rows[:, _ROW_BEAR_BASE] = (
+            (ema_f < ema_s).astype(np.float64)
+            + (close < ema_t).astype(np.float64)
+            + ((rsi_v < 50.0) & (rsi_v > 25.0)).astype(np.float64)
+            + (macd_hist < 0.0).astype(np.float64)
+            + (macd_line < macd_signal).astype(np.float64)
+            + (close < vwap_v).astype(np.float64)
+            + (volume > vol_sma).astype(np.float64)
+            + ((adx_v > 20.0) & (dmn > dmp)).astype(np.float64)
+        )
+        rows[:, _ROW_BULL_FAST] = (close > ema_f).astype(np.float64) * self._fast_ema_weight
+        rows[:, _ROW_BEAR_FAST] = (close < ema_f).astype(np.float64) * self._fast_ema_weight
+        rows[:, _ROW_BUY_OK] = (
+            (ema_f > ema_s) & (prev_fast <= prev_slow) & (close > ema_f) & (close > ema_s) & (rsi_v < 75.0)
+        )
+        rows[:, _ROW_SELL_OK] = (
+            (ema_f < ema_s) & (prev_fast >= prev_slow) & (close < ema_f) & (close < ema_s) & (rsi_v > 25.0)
+        )
+        rows[:, _ROW_CLOSE] = close
+        rows[:, _ROW_HIGH] = high
+        rows[:, _ROW_LOW] = low
+        rows[:, _ROW_ATR] = atr_v
+        rows[:, _ROW_SWING_LOW] = swing_low
+        rows[:, _ROW_SWING_HIGH] = swing_high
+
+        columns = {
+            "PC_EMA_FAST": ema_f,
+            "PC_EMA_SLOW": ema_s,
+            "PC_EMA_TREND": ema_t,
+            "PC_ATR": atr_v,
+            "PC_RSI": rsi_v,
+            "PC_MACD": macd_line,
+            "PC_MACD_SIGNAL": macd_signal,
+            "PC_MACD_HIST": macd_hist,
+            "PC_ADX": adx_v,
+            "PC_DI_PLUS": dmp,
+            "PC_DI_MINUS": dmn,
+            "PC_VWAP": vwap_v,
+        }
+        return rows, columns
+
+    def _signals(self, rows, bias, offset, last_dir, trade_state):
+        """Scores, gated signals and trade ladder of ``rows`` under one HTF bias."""
+        bull = (rows[:, _ROW_BULL_BASE] + (bias == 1).astype(np.float64) * self._htf_bias_weight) + rows[
+            :, _ROW_BULL_FAST
+        ]
+        bear = (rows[:, _ROW_BEAR_BASE] + (bias == -1).astype(np.float64) * self._htf_bias_weight) + rows[
+            :, _ROW_BEAR_FAST
+        ]
+        raw_buy = (rows[:, _ROW_BUY_OK] != 0.0) & (bull >= self._score_req)
+        raw_sell = (rows[:, _ROW_SELL_OK] != 0.0) & (bear >= self._score_req)
+        buy, sell, last_dir = _precision_gate(raw_buy, raw_sell, self._warmup, offset, last_dir)
+
+        tp1_mult, tp2_mult, tp3_mult = self._tp_mults
+        trade = _precision_trade_kernel(
+            np.ascontiguousarray(rows[:, _ROW_CLOSE]),
+            np.ascontiguousarray(rows[:, _ROW_HIGH]),
+            np.ascontiguousarray(rows[:, _ROW_LOW]),
+            buy,
+            sell,
+            np.ascontiguousarray(rows[:, _ROW_ATR]),
+            self._sl_mult,
+            tp1_mult,
+            tp2_mult,
+            tp3_mult,
+            self._use_structure_sl,
+            self._use_trailing,
+            np.ascontiguousarray(rows[:, _ROW_SWING_LOW]),
+            np.ascontiguousarray(rows[:, _ROW_SWING_HIGH]),
+            trade_state,
+        )
+        return bull, bear, buy, sell, last_dir, trade
+
+    def _bias(self, fast: float, slow: float) -> int:
+        return 1 if fast > slow else (-1 if fast < slow else 0)
+
+    def _seed(self, open_, high, low, close, volume):
+        """Bulk-load a history: complete HTF groups at once, the open group bar by bar."""
+        close_v = validate_values(close, "close")
+        rows, _ = self._features(
+            validate_values(open_, "open"),
+            validate_values(high, "high"),
+            validate_values(low, "low"),
+            close_v,
+            validate_values(volume, "volume"),
+        )
+
+        step = self._htf_step
+        done = (close_v.shape[0] // step) * step
+        if done:
+            reduced, groups = _resample_last(pd.Series(close_v[:done]), step)
+            reduced_v = reduced.to_numpy(dtype=np.float64)
+            htf_fast = self._htf_fast.update_many(reduced_v)[groups]
+            htf_slow = self._htf_slow.update_many(reduced_v)[groups]
+            bias = np.where(htf_fast > htf_slow, 1, np.where(htf_fast < htf_slow, -1, 0))
+            _, _, _, _, self._last_dir, _ = self._signals(rows[:done], bias, 0, 0, self._trade)
+            self._group_start = done
+
+        for i in range(done, close_v.shape[0]):
+            self._step(rows[i])
+
+    def _step(self, row):
+        """Add one bar to the open HTF group and replay the group under its current bias."""
+        k = self._group_len
+        self._group[k] = row
+        self._group_len = k + 1
+        if not np.isnan(row[_ROW_CLOSE]):
+            self._htf_last = float(row[_ROW_CLOSE])
+
+        bias = self._bias(self._htf_fast.peek(self._htf_last), self._htf_slow.peek(self._htf_last))
+        trade_state = self._trade.copy()
+        bull, bear, buy, sell, last_dir, trade = self._signals(
+            self._group[: k + 1],
+            np.full(k + 1, bias, dtype=np.int8),
+            self._group_start,
+            self._last_dir,
+            trade_state,
+        )
+
+        if self._group_len == self._htf_step:
+            self._htf_fast.update(self._htf_last)
+            self._htf_slow.update(self._htf_last)
+            self._htf_last = np.nan
+            self._last_dir = last_dir
+            self._trade = trade_state
+            self._group_len = 0
+            self._group_start += self._htf_step
+
+        return bias, bull[-1], bear[-1], buy[-1], sell[-1], [col[-1] for col in trade]
+
+    def _push(self, open_, high, low, close, volume) -> dict:
+        rows, columns = self._features(open_, high, low, close, volume)
+        m = rows.shape[0]
+
+        bias = np.zeros(m, dtype=np.int8)
+        bull = np.empty(m, dtype=np.float64)
+        bear = np.empty(m, dtype=np.float64)
+        buy = np.zeros(m, dtype=bool)
+        sell = np.zeros(m, dtype=bool)
+        trade = [
+            np.zeros(m, dtype=np.int8),
+            *(np.empty(m, dtype=np.float64) for _ in range(6)),
+            *(np.zeros(m, dtype=bool) for _ in range(4)),
+        ]
+        for i in range(m):
+            bias[i], bull[i], bear[i], buy[i], sell[i], trade_row = self._step(rows[i])
+            for col, val in zip(trade, trade_row):
+                col[i] = val
+
+        columns["PC_HTF_BIAS"] = bias
+        columns["PC_BULL_SCORE"] = bull
+        columns["PC_BEAR_SCORE"] = bear
+        columns["PC_BUY"] = buy
+        columns["PC_SELL"] = sell
+        columns.update(zip(_TRADE_COLUMNS, trade))
+        columns["PC_PROFILE"] = np.repeat(self._profile, m)
+
+        if m:
+            self.value = {name: col[-1].item() for name, col in columns.items()}
+        return columns
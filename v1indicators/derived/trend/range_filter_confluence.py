@@ -3,10 +3,12 @@ import pandas as pd
 from numba import njit
 
 from .._utils import check_series
+from ...foundational._features import _feature
 from ...foundational.overlap.ema import ema
-from ...derived.trend.adx import adx
-from ...foundational.volatility.atr import atr
-from ...foundational.volatility.chop import chop
+from ...derived.trend.adx import _adx_from_tr
+from ...foundational.volatility.atr import _atr_from_tr
+from ...foundational.volatility.chop import _chop_from_tr
+from ...foundational.volatility.true_range import _true_range
 
 
 @njit
@@ -53,6 +55,32 @@ def _range_filter_kernel(src_v: np.ndarray, rng_v: np.ndarray):
     return filt, trend, signal
 
 
+@njit
+def _cooldown_gate_kernel(raw_long: np.ndarray, raw_short: np.ndarray, gate: np.ndarray, use_cooldown: bool, cooldown_bars: int):
+    n = raw_long.shape[0]
+    long_signal = np.zeros(n, dtype=np.bool_)
+    short_signal = np.zeros(n, dtype=np.bool_)
+    cooldown_clear = np.zeros(n, dtype=np.bool_)
+    bars_since = np.full(n, 999, dtype=np.int64)
+
+    counter = 999
+    for i in range(n):
+        counter += 1
+        cd_ok = (not use_cooldown) or (counter >= cooldown_bars)
+        cooldown_clear[i] = cd_ok
+
+        if raw_long[i] and gate[i] and cd_ok:
+            long_signal[i] = True
+            counter = 0
+        elif raw_short[i] and gate[i] and cd_ok:
+            short_signal[i] = True
+            counter = 0
+
+        bars_since[i] = counter
+
+    return long_signal, short_signal, cooldown_clear, bars_since
+
+
 def range_filter_confluence(
     high: pd.Series,
     low: pd.Series,
@@ -93,7 +121,10 @@ def range_filter_confluence(
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
-    atr_s = atr(high_s, low_s, close_s, length=atr_length)
+    # ATR, ADX and CHOP all read the same true range; build it once. The
+    # building blocks go through the feature cache, see ``feature_cache()``.
+    tr = _feature(_true_range, high_s, low_s, close_s)
+    atr_s = _feature(_atr_from_tr, tr, atr_length)
     range_s = atr_s * float(atr_multiplier) * (float(sensitivity) / 8.0)
 
     filt, trend, rf_sig = _range_filter_kernel(
@@ -104,16 +135,16 @@ def range_filter_confluence(
     trend_s = pd.Series(trend, index=close_s.index)
     rf_sig_s = pd.Series(rf_sig, index=close_s.index)
 
-    adx_df = adx(high_s, low_s, close_s, length=adx_length)
+    adx_df = _feature(_adx_from_tr, high_s, low_s, tr, adx_length)
     adx_col = f"ADX_{adx_length}"
     adx_val = adx_df[adx_col]
     adx_trending = adx_val >= adx_threshold
 
-    chop_val = chop(high_s, low_s, close_s, length=chop_length)
+    chop_val = _feature(_chop_from_tr, high_s, low_s, tr, chop_length)
     chop_clear = chop_val <= chop_threshold
 
-    ema_fast = ema(close_s, ema_fast_length)
-    ema_slow = ema(close_s, ema_slow_length)
+    ema_fast = _feature(ema, close_s, ema_fast_length)
+    ema_slow = _feature(ema, close_s, ema_slow_length)
 
     ema_cross_bull = ema_fast > ema_slow
     ema_cross_bear = ema_fast < ema_slow
@@ -174,25 +205,13 @@ def range_filter_confluence(
     raw_long = (rf_sig_s == 1)
     raw_short = (rf_sig_s == -1)
 
-    long_signal = np.zeros(len(close_s), dtype=bool)
-    short_signal = np.zeros(len(close_s), dtype=bool)
-    cooldown_clear = np.zeros(len(close_s), dtype=bool)
-    bars_since = np.full(len(close_s), 999, dtype=np.int64)
-
-    counter = 999
-    for i in range(len(close_s)):
-        counter += 1
-        cd_ok = (not use_cooldown) or (counter >= cooldown_bars)
-        cooldown_clear[i] = cd_ok
-
-        if bool(raw_long.iloc[i]) and bool(chop_gate.iloc[i]) and bool(ema_gate.iloc[i]) and cd_ok:
-            long_signal[i] = True
-            counter = 0
-        elif bool(raw_short.iloc[i]) and bool(chop_gate.iloc[i]) and bool(ema_gate.iloc[i]) and cd_ok:
-            short_signal[i] = True
-            counter = 0
-
-        bars_since[i] = counter
+    long_signal, short_signal, cooldown_clear, bars_since = _cooldown_gate_kernel(
+        raw_long.to_numpy(dtype=bool),
+        raw_short.to_numpy(dtype=bool),
+        (chop_gate & ema_gate).to_numpy(dtype=bool),
+        bool(use_cooldown),
+        int(cooldown_bars),
+    )
 
     filtered_long = raw_long & ~pd.Series(long_signal, index=close_s.index)
     filtered_short = raw_short & ~pd.Series(short_signal, index=close_s.index)
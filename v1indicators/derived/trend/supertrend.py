@@ -1,59 +1,105 @@
+import copy
+from typing import NamedTuple, Optional
+
 import pandas as pd
 import numpy as np
-from numba import njit
-from ...foundational.volatility.atr import atr
-from .._utils import check_series
+from numba import njit, prange
+from ...foundational._features import _feature
+from ...foundational.volatility.atr import ATRStream, atr, atr_sweep
+from .._utils import check_series, validate_lengths
+
+
+class SupertrendState(NamedTuple):
+    """Carry state returned by ``supertrend(..., return_state=True)``."""
+
+    length: int
+    mult: float
+    atr: ATRStream
+    started: bool
+    final_upper: float
+    final_lower: float
+    prev_close: float
+    direction: int
+
+
+class SupertrendGrid(NamedTuple):
+    """Result of ``supertrend_grid``; arrays are indexed ``[length, mult, bar]``."""
+
+    lengths: np.ndarray
+    mults: np.ndarray
+    supertrend: np.ndarray
+    direction: np.ndarray
+
+
+@njit(inline="always")
+def _supertrend_step(close, upper_basic, lower_basic, prev_upper, prev_lower, prev_close, current_dir):
+    """
+    One bar of the band recursion; returns the new
+    ``(supertrend, direction, final_upper, final_lower)``.
+    """
+    final_upper = upper_basic
+    final_lower = lower_basic
+
+    # 1. Update Final Bands
+    if (lower_basic < prev_lower) and (prev_close > prev_lower):
+        final_lower = prev_lower
+
+    if (upper_basic > prev_upper) and (prev_close < prev_upper):
+        final_upper = prev_upper
+
+    # 2. Determine Direction
+    if close > prev_upper:
+        current_dir = 1
+    elif close < prev_lower:
+        current_dir = -1
+
+    # 3. Set Supertrend Value
+    st = final_lower if current_dir == 1 else final_upper
+    return st, current_dir, final_upper, final_lower
+
 
 @njit
-def _supertrend_kernel(close_val, upper_basic, lower_basic):
+def _supertrend_kernel(
+    close_val,
+    upper_basic,
+    lower_basic,
+    started=False,
+    prev_upper=np.nan,
+    prev_lower=np.nan,
+    prev_close=np.nan,
+    current_dir=1,
+):
     length_data = len(close_val)
     st = np.full(length_data, np.nan)
     direction = np.full(length_data, 1, dtype=np.int8)
     
-    final_upper = np.copy(upper_basic)
-    final_lower = np.copy(lower_basic)
-    
-    current_dir = 1
-    
-    # Find first non-NaN index
     start_idx = 0
-    for i in range(length_data):
-        if not np.isnan(upper_basic[i]):
-            start_idx = i
-            break
-    
-    if start_idx == 0 and np.isnan(upper_basic[0]):
-        return st, direction
-
-    # Initialize first valid supertrend value
-    st[start_idx] = final_upper[start_idx] if current_dir == -1 else final_lower[start_idx]
-
-    for i in range(start_idx + 1, length_data):
-        prev_upper = final_upper[i-1]
-        prev_lower = final_lower[i-1]
-        
-        # 1. Update Final Bands
-        if (lower_basic[i] < prev_lower) and (close_val[i-1] > prev_lower):
-            final_lower[i] = prev_lower
-            
-        if (upper_basic[i] > prev_upper) and (close_val[i-1] < prev_upper):
-            final_upper[i] = prev_upper
-            
-        # 2. Determine Direction
-        if close_val[i] > final_upper[i-1]:
-            current_dir = 1
-        elif close_val[i] < final_lower[i-1]:
-            current_dir = -1
-        
+    if not started:
+        # Find first non-NaN index
+        start_idx = -1
+        for i in range(length_data):
+            if not np.isnan(upper_basic[i]):
+                start_idx = i
+                break
+
+        if start_idx < 0:
+            return st, direction, False, prev_upper, prev_lower, prev_close, current_dir
+
+        # Initialize first valid supertrend value
+        st[start_idx] = upper_basic[start_idx] if current_dir == -1 else lower_basic[start_idx]
+        prev_upper = upper_basic[start_idx]
+        prev_lower = lower_basic[start_idx]
+        prev_close = close_val[start_idx]
+        start_idx += 1
+
+    for i in range(start_idx, length_data):
+        st[i], current_dir, prev_upper, prev_lower = _supertrend_step(
+            close_val[i], upper_basic[i], lower_basic[i], prev_upper, prev_lower, prev_close, current_dir
+        )
         direction[i] = current_dir
-        
-        # 3. Set Supertrend Value
-        if current_dir == 1:
-            st[i] = final_lower[i]
-        else:
-            st[i] = final_upper[i]
+        prev_close = close_val[i]
             
-    return st, direction
+    return st, direction, True, prev_upper, prev_lower, prev_close, current_dir
 
 def supertrend(
     high: pd.Series,
@@ -61,7 +107,9 @@ def supertrend(
     close: pd.Series,
     length: int = 10,
     mult: float = 3.0,
-) -> pd.DataFrame:
+    state: Optional[SupertrendState] = None,
+    return_state: bool = False,
+):
     """
     Supertrend Indicator. (Numba Optimized)
 
@@ -80,10 +128,14 @@ def supertrend(
         close: Pandas Series of close prices.
         length: ATR period (default 10).
         mult: ATR multiplier (default 3.0).
+        state: Final state of a previous call. When given, the inputs are only
+            the bars that follow that call and the path resumes from it.
+        return_state: If True, also return the final state.
 
     Returns:
         Pandas DataFrame with columns: ['SUPERTREND', 'SUPERTREND_DIR'].
         SUPERTREND_DIR is 1 (Uptrend) or -1 (Downtrend).
+        With ``return_state=True``, a ``(DataFrame, SupertrendState)`` tuple.
     """
     
     if length <= 0 or mult <= 0:
@@ -93,8 +145,16 @@ def supertrend(
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
+    if state is not None and (state.length != length or state.mult != mult):
+        raise ValueError("state was produced with a different length/mult")
+
     # Calculate ATR (returns Series)
-    atr_v = atr(high_s, low_s, close_s, length)
+    if state is None and not return_state:
+        atr_stream = None
+        atr_v = _feature(atr, high_s, low_s, close_s, length)
+    else:
+        atr_stream = ATRStream(length=length) if state is None else copy.deepcopy(state.atr)
+        atr_v = atr_stream.update_many(high_s, low_s, close_s)
     
     # Pre-calculate bands (vectorized)
     hl2 = (high_s + low_s) / 2
@@ -106,9 +166,112 @@ def supertrend(
     upper_basic = upper_band_basic.to_numpy()
     lower_basic = lower_band_basic.to_numpy()
     
-    st, direction = _supertrend_kernel(close_val, upper_basic, lower_basic)
+    if state is None:
+        carry = (False, np.nan, np.nan, np.nan, 1)
+    else:
+        carry = (state.started, state.final_upper, state.final_lower, state.prev_close, state.direction)
+
+    st, direction, *final = _supertrend_kernel(close_val, upper_basic, lower_basic, *carry)
 
-    return pd.DataFrame({
+    result = pd.DataFrame({
         "SUPERTREND": st,
         "SUPERTREND_DIR": direction,
     }, index=close.index)
+
+    if not return_state:
+        return result
+
+    started, final_upper, final_lower, prev_close, current_dir = final
+    return result, SupertrendState(
+        length, mult, atr_stream, bool(started), final_upper, final_lower, prev_close, int(current_dir)
+    )
+
+
+@njit(parallel=True)
+def _supertrend_grid_kernel(close_val, hl2, atr_block, mults):
+    """
+    The ``_supertrend_kernel`` path of every (ATR row, multiplier) pair.
+
+    Bands are formed bar by bar from ``hl2`` and the ATR row instead of as
+    per-pair arrays; pairs are independent and spread over the numba thread
+    pool.
+    """
+    width = atr_block.shape[0]
+    depth = mults.shape[0]
+    n = close_val.shape[0]
+    st = np.full((width, depth, n), np.nan)
+    direction = np.ones((width, depth, n), dtype=np.int8)
+
+    for p in prange(width * depth):
+        k = p // depth
+        j = p % depth
+        mult = mults[j]
+        atr_v = atr_block[k]
+        st_v = st[k, j]
+        dir_v = direction[k, j]
+
+        start = 0
+        while start < n and np.isnan(hl2[start] + mult * atr_v[start]):
+            start += 1
+        if start == n:
+            continue
+
+        prev_upper = hl2[start] + mult * atr_v[start]
+        prev_lower = hl2[start] - mult * atr_v[start]
+        prev_close = close_val[start]
+        current_dir = 1
+        st_v[start] = prev_lower
+        for i in range(start + 1, n):
+            offset = mult * atr_v[i]
+            st_v[i], current_dir, prev_upper, prev_lower = _supertrend_step(
+                close_val[i], hl2[i] + offset, hl2[i] - offset, prev_upper, prev_lower, prev_close, current_dir
+            )
+            dir_v[i] = current_dir
+            prev_close = close_val[i]
+    return st, direction
+
+
+def supertrend_grid(
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
+    lengths,
+    mults,
+) -> SupertrendGrid:
+    """
+    Supertrend over every (length, mult) combination of a parameter grid.
+
+    Each ATR length and HL2 are computed once; the band recursion for all
+    combinations then runs in one compiled loop on all numba threads
+    (``NUMBA_NUM_THREADS``). ``supertrend[i, j]`` and ``direction[i, j]``
+    equal the 'SUPERTREND' and 'SUPERTREND_DIR' columns of
+    ``supertrend(high, low, close, lengths[i], mults[j])``.
+
+    Args:
+        high: Pandas Series of high prices.
+        low: Pandas Series of low prices.
+        close: Pandas Series of close prices.
+        lengths: Sequence of positive integer ATR periods.
+        mults: Sequence of ATR multipliers, all > 0.
+
+    Returns:
+        SupertrendGrid of the lengths, the mults, and the stacked float64
+        supertrend and int8 direction arrays, each shaped
+        ``(len(lengths), len(mults), bars)``.
+    """
+    lengths = validate_lengths(lengths)
+    mults = np.asarray(mults, dtype=np.float64)
+    if mults.ndim != 1 or mults.shape[0] == 0:
+        raise ValueError("mults must be a non-empty 1D sequence")
+    if not np.all(mults > 0):
+        raise ValueError("mults must be > 0")
+
+    high_s = check_series(high, "high")
+    low_s = check_series(low, "low")
+    close_s = check_series(close, "close")
+
+    atr_block = np.ascontiguousarray(atr_sweep(high_s, low_s, close_s, lengths).to_numpy().T)
+    hl2 = ((high_s + low_s) / 2).to_numpy()
+
+    st, direction = _supertrend_grid_kernel(close_s.to_numpy(), hl2, atr_block, mults)
+    return SupertrendGrid(lengths, mults, st, direction)
@@ -3,6 +3,9 @@ import pandas as pd
 from numba import njit
 
 from .._utils import check_series
+from ...foundational._features import _feature
+from ...foundational._pivots import _swing_pivots
+from ...foundational.overlap.linreg import _rolling_linreg
 from ...foundational.volatility.atr import atr
 
 
@@ -118,23 +121,18 @@ def trendline_breaks(
     close_s = check_series(close, "close")
 
     if method == "atr":
-        slope = atr(high_s, low_s, close_s, length=length) / float(length)
+        slope = _feature(atr, high_s, low_s, close_s, length=length) / float(length)
         slope = slope * mult
     elif method == "stdev":
         slope = close_s.rolling(length).std(ddof=0) / float(length)
         slope = slope * mult
     else:
-        n = pd.Series(np.arange(close_s.size, dtype=np.float64), index=close_s.index)
-        mean_src = close_s.rolling(length).mean()
-        mean_n = n.rolling(length).mean()
-        mean_srcn = (close_s * n).rolling(length).mean()
-        var_n = n.rolling(length).var(ddof=0).replace(0.0, np.nan)
-        slope = (mean_srcn - mean_src * mean_n).abs() / var_n / 2.0
+        _, slope_v, _ = _rolling_linreg(close_s.to_numpy(dtype=np.float64), length)
+        slope = pd.Series(np.abs(slope_v) / 2.0, index=close_s.index)
         slope = slope * mult
 
-    window = 2 * length + 1
-    pivot_high = high_s.where(high_s == high_s.rolling(window).max().shift(-length))
-    pivot_low = low_s.where(low_s == low_s.rolling(window).min().shift(-length))
+    pivot_high = _swing_pivots(high_s, length, length, find_high=True)
+    pivot_low = _swing_pivots(low_s, length, length, find_high=False)
 
     upper, lower, slope_upper, slope_lower, breakout_up, breakout_down = _trendline_breaks_kernel(
         close_s.to_numpy(dtype=np.float64),
@@ -1,13 +1,36 @@
+import copy
+from typing import NamedTuple, Optional
+
 import numpy as np
 import pandas as pd
 from numba import njit
 
 from .._utils import check_series
-from ...foundational.volatility.atr import atr
+from ...foundational._features import _feature
+from ...foundational.volatility.atr import ATRStream, atr
+
+
+class UTBotState(NamedTuple):
+    """Carry state returned by ``ut_bot(..., return_state=True)``."""
+
+    key_value: float
+    atr_period: int
+    atr: ATRStream
+    started: bool
+    prev_stop: float
+    prev_src: float
+    direction: int
 
 
 @njit
-def _ut_bot_kernel(src_v: np.ndarray, nloss_v: np.ndarray):
+def _ut_bot_kernel(
+    src_v: np.ndarray,
+    nloss_v: np.ndarray,
+    started: bool = False,
+    prev_stop: float = np.nan,
+    prev_src: float = np.nan,
+    prev_dir: int = 0,
+):
     length = src_v.shape[0]
     stop = np.full(length, np.nan, dtype=np.float64)
     direction = np.zeros(length, dtype=np.int8)
@@ -15,19 +38,24 @@ def _ut_bot_kernel(src_v: np.ndarray, nloss_v: np.ndarray):
     sell = np.zeros(length, dtype=np.bool_)
 
     if length == 0:
-        return stop, direction, buy, sell
+        return stop, direction, buy, sell, started, prev_stop, prev_src, prev_dir
 
-    stop[0] = src_v[0]
+    start = 0
+    if not started:
+        stop[0] = src_v[0]
+        prev_stop = stop[0]
+        prev_src = src_v[0]
+        start = 1
 
-    for i in range(1, length):
-        prev_stop = stop[i - 1]
+    for i in range(start, length):
         cur_src = src_v[i]
-        prev_src = src_v[i - 1]
         cur_loss = nloss_v[i]
 
         if np.isnan(prev_stop) or np.isnan(cur_src) or np.isnan(prev_src) or np.isnan(cur_loss):
             stop[i] = np.nan
-            direction[i] = direction[i - 1]
+            direction[i] = prev_dir
+            prev_stop = np.nan
+            prev_src = cur_src
             continue
 
         if cur_src > prev_stop and prev_src > prev_stop:
@@ -42,18 +70,20 @@ def _ut_bot_kernel(src_v: np.ndarray, nloss_v: np.ndarray):
         stop[i] = cur_stop
 
         if prev_src < prev_stop and cur_src > prev_stop:
-            direction[i] = 1
+            prev_dir = 1
         elif prev_src > prev_stop and cur_src < prev_stop:
-            direction[i] = -1
-        else:
-            direction[i] = direction[i - 1]
+            prev_dir = -1
+        direction[i] = prev_dir
 
         above = prev_src <= prev_stop and cur_src > cur_stop
         below = prev_stop <= prev_src and cur_stop > cur_src
         buy[i] = cur_src > cur_stop and above
         sell[i] = cur_src < cur_stop and below
 
-    return stop, direction, buy, sell
+        prev_stop = cur_stop
+        prev_src = cur_src
+
+    return stop, direction, buy, sell, True, prev_stop, prev_src, prev_dir
 
 
 def ut_bot(
@@ -62,11 +92,17 @@ def ut_bot(
     close: pd.Series,
     key_value: float = 1.0,
     atr_period: int = 10,
-) -> pd.DataFrame:
+    state: Optional[UTBotState] = None,
+    return_state: bool = False,
+):
     """
     UT Bot trend indicator.
 
     Returns trailing stop, direction, and buy/sell trigger flags.
+
+    Pass the ``state`` returned by a previous call with ``return_state=True``
+    to continue on the bars that follow it without recomputing the history;
+    the call then returns a ``(DataFrame, UTBotState)`` tuple.
     """
     if key_value <= 0:
         raise ValueError("key_value must be > 0")
@@ -77,15 +113,29 @@ def ut_bot(
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
-    atr_v = atr(high_s, low_s, close_s, length=atr_period)
+    if state is not None and (state.key_value != key_value or state.atr_period != atr_period):
+        raise ValueError("state was produced with a different key_value/atr_period")
+
+    if state is None and not return_state:
+        atr_stream = None
+        atr_v = _feature(atr, high_s, low_s, close_s, length=atr_period)
+    else:
+        atr_stream = ATRStream(length=atr_period) if state is None else copy.deepcopy(state.atr)
+        atr_v = atr_stream.update_many(high_s, low_s, close_s)
     nloss = key_value * atr_v
 
-    stop, direction, buy, sell = _ut_bot_kernel(
+    if state is None:
+        carry = (False, np.nan, np.nan, 0)
+    else:
+        carry = (state.started, state.prev_stop, state.prev_src, state.direction)
+
+    stop, direction, buy, sell, *final = _ut_bot_kernel(
         close_s.to_numpy(dtype=np.float64),
         nloss.to_numpy(dtype=np.float64),
+        *carry,
     )
 
-    return pd.DataFrame(
+    result = pd.DataFrame(
         {
             "UT_STOP": stop,
             "UT_DIR": direction,
@@ -94,3 +144,11 @@ def ut_bot(
         },
         index=close_s.index,
     )
+
+    if not return_state:
+        return result
+
+    started, prev_stop, prev_src, prev_dir = final
+    return result, UTBotState(
+        key_value, atr_period, atr_stream, bool(started), prev_stop, prev_src, int(prev_dir)
+    )
@@ -1,44 +1,32 @@
 import numpy as np
 import pandas as pd
+from numba import njit
 
 from .._utils import check_series
+from ...foundational._features import _feature
+from ...foundational.statistics._pairwise import _pairwise_sum
 from ...foundational.volatility.atr import atr
 
 
-def swing_leg_profile(
-    open_: pd.Series,
-    high: pd.Series,
-    low: pd.Series,
-    close: pd.Series,
-    volume: pd.Series,
-    swing_length: int = 50,
-    atr_length: int = 200,
-    bin_atr_mult: float = 0.5,
-    min_bin_count: int = 5,
-) -> pd.DataFrame:
-    """Swing-leg volume profile summary metrics.
-
-    Inspired by TradingView file 3, converted to non-visual per-bar profile outputs.
+@njit
+def _swing_leg_profile_kernel(
+    open_v: np.ndarray,
+    high_v: np.ndarray,
+    low_v: np.ndarray,
+    close_v: np.ndarray,
+    volume_v: np.ndarray,
+    highest_v: np.ndarray,
+    lowest_v: np.ndarray,
+    atr_v: np.ndarray,
+    bin_atr_mult: float,
+    min_bin_count: int,
+):
+    """Swing detection and per-leg volume histogram.
+
+    The bin buffers are allocated once and only grown when a leg needs more
+    bins than any leg before it.
     """
-    if swing_length <= 1:
-        raise ValueError("swing_length must be > 1")
-    if atr_length <= 0:
-        raise ValueError("atr_length must be > 0")
-    if bin_atr_mult <= 0:
-        raise ValueError("bin_atr_mult must be > 0")
-    if min_bin_count <= 0:
-        raise ValueError("min_bin_count must be > 0")
-
-    open_s = check_series(open_, "open")
-    high_s = check_series(high, "high")
-    low_s = check_series(low, "low")
-    close_s = check_series(close, "close")
-    volume_s = check_series(volume, "volume")
-
-    n = len(close_s)
-    highest = high_s.rolling(swing_length, min_periods=swing_length).max()
-    lowest = low_s.rolling(swing_length, min_periods=swing_length).min()
-    atr_s = atr(high_s, low_s, close_s, length=atr_length)
+    n = close_v.shape[0]
 
     dir_v = np.zeros(n, dtype=np.int8)
     swing_high_v = np.full(n, np.nan, dtype=np.float64)
@@ -54,6 +42,11 @@ def swing_leg_profile(
     leg_start_v = np.full(n, -1, dtype=np.int64)
     leg_end_v = np.full(n, -1, dtype=np.int64)
 
+    capacity = max(min_bin_count, 1)
+    vol_bins = np.zeros(capacity, dtype=np.float64)
+    buy_bins = np.zeros(capacity, dtype=np.float64)
+    sell_bins = np.zeros(capacity, dtype=np.float64)
+
     is_down_move = False
     prev_is_down_move = False
 
@@ -71,15 +64,6 @@ def swing_leg_profile(
     cur_leg_start = -1
     cur_leg_end = -1
 
-    open_v = open_s.to_numpy(dtype=np.float64)
-    high_v = high_s.to_numpy(dtype=np.float64)
-    low_v = low_s.to_numpy(dtype=np.float64)
-    close_v = close_s.to_numpy(dtype=np.float64)
-    volume_arr = volume_s.to_numpy(dtype=np.float64)
-    highest_v = highest.to_numpy(dtype=np.float64)
-    lowest_v = lowest.to_numpy(dtype=np.float64)
-    atr_v = atr_s.to_numpy(dtype=np.float64)
-
     for i in range(n):
         if not np.isnan(highest_v[i]) and high_v[i] >= highest_v[i]:
             is_down_move = True
@@ -118,22 +102,30 @@ def swing_leg_profile(
                 if step <= 0:
                     step = 1e-9
 
-                vol_bins = np.zeros(bin_count, dtype=np.float64)
-                buy_bins = np.zeros(bin_count, dtype=np.float64)
-                sell_bins = np.zeros(bin_count, dtype=np.float64)
+                if bin_count > capacity:
+                    capacity = max(bin_count, 2 * capacity)
+                    vol_bins = np.zeros(capacity, dtype=np.float64)
+                    buy_bins = np.zeros(capacity, dtype=np.float64)
+                    sell_bins = np.zeros(capacity, dtype=np.float64)
+                else:
+                    vol_bins[:bin_count] = 0.0
+                    buy_bins[:bin_count] = 0.0
+                    sell_bins[:bin_count] = 0.0
 
                 for j in range(leg_start, leg_end + 1):
                     cj = close_v[j]
                     oj = open_v[j]
-                    vj = volume_arr[j]
+                    vj = volume_v[j]
                     if np.isnan(cj) or np.isnan(oj) or np.isnan(vj):
                         continue
 
-                    idx = int((cj - swing_bottom) / step)
-                    if idx < 0:
+                    pos = (cj - swing_bottom) / step
+                    if pos < 0.0:
                         idx = 0
-                    elif idx >= bin_count:
+                    elif pos >= bin_count:
                         idx = bin_count - 1
+                    else:
+                        idx = int(pos)
 
                     vol_bins[idx] += vj
                     if cj > oj:
@@ -141,13 +133,16 @@ def swing_leg_profile(
                     else:
                         sell_bins[idx] += vj
 
-                total = vol_bins.sum()
+                total = _pairwise_sum(vol_bins, 0, bin_count)
                 if total > 0.0:
-                    poc_idx = int(np.argmax(vol_bins))
+                    poc_idx = 0
+                    for b in range(1, bin_count):
+                        if vol_bins[b] > vol_bins[poc_idx]:
+                            poc_idx = b
                     cur_poc = swing_bottom + (poc_idx + 0.5) * step
                     cur_total = total
-                    cur_buy = buy_bins.sum()
-                    cur_sell = sell_bins.sum()
+                    cur_buy = _pairwise_sum(buy_bins, 0, bin_count)
+                    cur_sell = _pairwise_sum(sell_bins, 0, bin_count)
                     cur_delta = ((cur_buy - cur_sell) / cur_total) * 100.0
                     cur_bins = float(bin_count)
                     cur_leg_start = leg_start
@@ -167,6 +162,80 @@ def swing_leg_profile(
         leg_start_v[i] = cur_leg_start
         leg_end_v[i] = cur_leg_end
 
+    return (
+        dir_v,
+        swing_high_v,
+        swing_low_v,
+        poc_v,
+        total_v,
+        buy_v,
+        sell_v,
+        delta_v,
+        bins_v,
+        leg_start_v,
+        leg_end_v,
+    )
+
+
+def swing_leg_profile(
+    open_: pd.Series,
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
+    volume: pd.Series,
+    swing_length: int = 50,
+    atr_length: int = 200,
+    bin_atr_mult: float = 0.5,
+    min_bin_count: int = 5,
+) -> pd.DataFrame:
+    """Swing-leg volume profile summary metrics.
+
+    Inspired by TradingView file 3, converted to non-visual per-bar profile outputs.
+    """
+    if swing_length <= 1:
+        raise ValueError("swing_length must be > 1")
+    if atr_length <= 0:
+        raise ValueError("atr_length must be > 0")
+    if bin_atr_mult <= 0:
+        raise ValueError("bin_atr_mult must be > 0")
+    if min_bin_count <= 0:
+        raise ValueError("min_bin_count must be > 0")
+
+    open_s = check_series(open_, "open")
+    high_s = check_series(high, "high")
+    low_s = check_series(low, "low")
+    close_s = check_series(close, "close")
+    volume_s = check_series(volume, "volume")
+
+    highest = high_s.rolling(swing_length, min_periods=swing_length).max()
+    lowest = low_s.rolling(swing_length, min_periods=swing_length).min()
+    atr_s = _feature(atr, high_s, low_s, close_s, length=atr_length)
+
+    (
+        dir_v,
+        swing_high_v,
+        swing_low_v,
+        poc_v,
+        total_v,
+        buy_v,
+        sell_v,
+        delta_v,
+        bins_v,
+        leg_start_v,
+        leg_end_v,
+    ) = _swing_leg_profile_kernel(
+        open_s.to_numpy(dtype=np.float64),
+        high_s.to_numpy(dtype=np.float64),
+        low_s.to_numpy(dtype=np.float64),
+        close_s.to_numpy(dtype=np.float64),
+        volume_s.to_numpy(dtype=np.float64),
+        highest.to_numpy(dtype=np.float64),
+        lowest.to_numpy(dtype=np.float64),
+        atr_s.to_numpy(dtype=np.float64),
+        float(bin_atr_mult),
+        int(min_bin_count),
+    )
+
     return pd.DataFrame(
         {
             "SLP_DIR": pd.Series(dir_v, index=close_s.index),
@@ -0,0 +1,71 @@
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ._pivots import pivot_cache
+
+_FEATURE_CACHE: ContextVar[Optional[dict]] = ContextVar("_FEATURE_CACHE", default=None)
+
+
+@contextmanager
+def feature_cache():
+    """
+    Share sub-indicator results between indicator calls made inside the block.
+
+    The confluence engines fetch their building blocks (EMA, RSI, MACD, true
+    range, ATR, ADX, VWAP, ...) through this cache, so running several of
+    them on the same bars computes each ``(indicator, inputs, parameters)``
+    once. Inputs are matched by identity: they must not be modified in place
+    while the block is open, and should already be float64 (other dtypes are
+    converted anew by every call). Swing pivots are shared as in
+    ``pivot_cache``.
+    """
+    cache = _FEATURE_CACHE.get()
+    token = _FEATURE_CACHE.set({} if cache is None else cache)
+    try:
+        with pivot_cache():
+            yield
+    finally:
+        _FEATURE_CACHE.reset(token)
+
+
+def _arg_key(arg):
+    if isinstance(arg, (pd.Series, pd.DataFrame, np.ndarray)):
+        return (type(arg), id(arg))
+    return arg
+
+
+@functools.lru_cache(maxsize=None)
+def _signature(func) -> inspect.Signature:
+    return inspect.signature(func)
+
+
+def _feature(func, *args, **kwargs):
+    """
+    ``func(*args, **kwargs)``, reused from the open ``feature_cache`` if any.
+
+    Arguments are bound to ``func``'s signature first, so positional, keyword
+    and defaulted spellings of the same call share one entry.
+    """
+    cache = _FEATURE_CACHE.get()
+    if cache is None:
+        return func(*args, **kwargs)
+
+    bound = _signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    key = (func, tuple((name, _arg_key(arg)) for name, arg in bound.arguments.items()))
+    try:
+        hit = cache.get(key)
+    except TypeError:
+        # Unhashable parameters (lists, dicts) are not cached.
+        return func(*bound.args, **bound.kwargs)
+    if hit is None:
+        # Holding the inputs keeps their ids from being reused while cached.
+        hit = (bound.arguments, func(*bound.args, **bound.kwargs))
+        cache[key] = hit
+    return hit[1]
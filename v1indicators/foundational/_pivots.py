@@ -0,0 +1,103 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+_PIVOT_CACHE: ContextVar[Optional[dict]] = ContextVar("_PIVOT_CACHE", default=None)
+
+
+@njit
+def _pivot_block(values, valid, left, right, find_high, strict, lo, hi, out):
+    """
+    Flag the swing pivots centred on bars ``lo .. hi - 1``.
+
+    Bar ``t`` is a pivot high when ``values[t]`` equals the maximum over
+    ``[t - left, t + right]`` (a pivot low uses the minimum). The window
+    extreme is tracked with a monotonic deque, so a block costs
+    O(hi - lo + left + right). Bars with ``valid`` False never count; with
+    ``strict`` they also void every window they fall in, as a missing value
+    does in a pandas rolling window. The caller keeps every window inside the
+    array.
+    """
+    w = left + right + 1
+    dq = np.empty(hi - lo + w, dtype=np.int64)
+    head = 0
+    tail = 0
+    last_invalid = -1
+
+    for e in range(lo - left, hi + right):
+        while head < tail and dq[head] <= e - w:
+            head += 1
+
+        if valid[e]:
+            v = values[e]
+            if find_high:
+                while tail > head and values[dq[tail - 1]] <= v:
+                    tail -= 1
+            else:
+                while tail > head and values[dq[tail - 1]] >= v:
+                    tail -= 1
+            dq[tail] = e
+            tail += 1
+        else:
+            last_invalid = e
+
+        t = e - right
+        if t < lo or not valid[t]:
+            continue
+        if strict and last_invalid >= t - left:
+            continue
+        if values[dq[head]] == values[t]:
+            out[t] = True
+
+
+@njit
+def _pivot_mask(values, valid, left, right, find_high, strict):
+    n = values.shape[0]
+    out = np.zeros(n, dtype=np.bool_)
+    if n >= left + right + 1:
+        _pivot_block(values, valid, left, right, find_high, strict, left, n - right, out)
+    return out
+
+
+@contextmanager
+def pivot_cache():
+    """
+    Share swing pivots between indicator calls made inside the block.
+
+    The pivots of a series are then computed once per ``(series, left,
+    right)``. Series are matched by identity, so they must not be modified
+    in place while the block is open.
+    """
+    cache = _PIVOT_CACHE.get()
+    token = _PIVOT_CACHE.set({} if cache is None else cache)
+    try:
+        yield
+    finally:
+        _PIVOT_CACHE.reset(token)
+
+
+def _swing_pivots(series: pd.Series, left: int, right: int, find_high: bool) -> pd.Series:
+    """
+    ``series`` where it is a swing pivot, NaN elsewhere.
+
+    Same result as ``series.where(series == series.rolling(left + right +
+    1).max().shift(-right))`` (``min`` for pivot lows), including the void
+    windows around missing and infinite values.
+    """
+    cache = _PIVOT_CACHE.get()
+    key = (id(series), int(left), int(right), bool(find_high))
+    if cache is not None and key in cache:
+        return cache[key][1]
+
+    values = series.to_numpy(dtype=np.float64)
+    mask = _pivot_mask(values, np.isfinite(values), int(left), int(right), bool(find_high), True)
+    out = series.where(mask)
+
+    if cache is not None:
+        # Holding the series keeps its id from being reused while cached.
+        cache[key] = (series, out)
+    return out
@@ -1,3 +1,23 @@
-from .._utils import check_series, to_series, validate_df, validate_series
+from .._utils import (
+    check_series,
+    panel_output,
+    stream_output,
+    to_series,
+    validate_df,
+    validate_lengths,
+    validate_panel,
+    validate_series,
+    validate_values,
+)
 
-__all__ = ["check_series", "to_series", "validate_df", "validate_series"]
+__all__ = [
+    "check_series",
+    "panel_output",
+    "stream_output",
+    "to_series",
+    "validate_df",
+    "validate_lengths",
+    "validate_panel",
+    "validate_series",
+    "validate_values",
+]
@@ -1,3 +1,4 @@
+from .._pivots import pivot_cache
 from .equal_highs_lows import equal_highs_lows
 from .fibonacci import fibonacci
 from .pivot_points import pivot_points
@@ -8,4 +9,5 @@ __all__ = [
     "pivot_points",
     "support_resistance",
     "equal_highs_lows",
+    "pivot_cache",
 ]
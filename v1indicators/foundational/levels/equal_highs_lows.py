@@ -1,6 +1,7 @@
 import pandas as pd
 
 from ..._utils import check_series
+from .._pivots import _swing_pivots
 
 
 def equal_highs_lows(
@@ -23,9 +24,8 @@ def equal_highs_lows(
     high_s = check_series(high, "high")
     low_s = check_series(low, "low")
 
-    window = 2 * length + 1
-    pivot_high = high_s.where(high_s == high_s.rolling(window).max().shift(-length))
-    pivot_low = low_s.where(low_s == low_s.rolling(window).min().shift(-length))
+    pivot_high = _swing_pivots(high_s, length, length, find_high=True)
+    pivot_low = _swing_pivots(low_s, length, length, find_high=False)
 
     last_ph = pivot_high.ffill()
     prev_ph = last_ph.shift(1)
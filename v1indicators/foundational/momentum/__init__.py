@@ -24,7 +24,7 @@ from .ppo import ppo
 from .psl import psl
 from .qstick import qstick
 from .roc import roc
-from .rsi import rsi
+from .rsi import RSIStream, rsi, rsi_panel, rsi_sweep
 from .rvgi import rvgi
 from .slope import slope
 from .smi import smi
@@ -76,4 +76,7 @@ __all__ = [
     "cdl_doji",
     "cdl_inside",
     "ebsw",
+    "RSIStream",
+    "rsi_sweep",
+    "rsi_panel",
 ]
@@ -0,0 +1,224 @@
+import numpy as np
+import pandas as pd
+from numba import njit
+
+# Pattern ids of the shared engine. Variants with the same column name differ
+# in their definitions between the detectors, so each gets its own id.
+_DOJI = 0
+_BULLISH_ENGULFING = 1
+_BEARISH_ENGULFING = 2
+_HAMMER = 3
+_INVERTED_HAMMER = 4
+_MORNING_STAR = 5
+_EVENING_STAR = 6
+_EXT_DOJI = 7
+_BULLISH_HARAMI = 8
+_BEARISH_HARAMI = 9
+_EXT_BULLISH_ENGULFING = 10
+_EXT_BEARISH_ENGULFING = 11
+_PIERCING_LINE = 12
+_BULLISH_BELT_HOLD = 13
+_BULLISH_KICKER = 14
+_BEARISH_KICKER = 15
+_HANGING_MAN = 16
+_SHOOTING_STAR = 17
+_EXT_HAMMER = 18
+_EXT_INVERTED_HAMMER = 19
+_INSIDE = 20
+_BULLISH_THREE_LINE_STRIKE = 21
+_BEARISH_THREE_LINE_STRIKE = 22
+
+_BELT_HOLD_LOOKBACK = 10
+
+
+@njit
+def _prev(values, i, k):
+    return values[i - k] if i >= k else np.nan
+
+
+@njit
+def _nanmax2(a, b):
+    """Row max of two columns as ``DataFrame.max(axis=1)`` computes it."""
+    if np.isnan(a):
+        return b
+    if np.isnan(b):
+        return a
+    return max(a, b)
+
+
+@njit
+def _nanmin2(a, b):
+    if np.isnan(a):
+        return b
+    if np.isnan(b):
+        return a
+    return min(a, b)
+
+
+@njit
+def _prior_low_min(low_v, i, lookback):
+    """Minimum of the ``lookback`` lows before bar ``i``; NaN if any is missing."""
+    if i < lookback:
+        return np.nan
+    out = np.inf
+    for k in range(i - lookback, i):
+        if not np.isfinite(low_v[k]):
+            return np.nan
+        if low_v[k] < out:
+            out = low_v[k]
+    return out
+
+
+@njit(error_model="numpy")
+def _candle_kernel(open_v, high_v, low_v, close_v, patterns, doji_size, trend_bars):
+    """
+    Flag the requested candlestick patterns in one pass over the bars.
+
+    Bit ``k`` of ``out[i]`` is set when pattern ``patterns[k]`` fires on bar
+    ``i``. Comparisons against missing values are false, as in pandas.
+    """
+    n = close_v.shape[0]
+    out = np.zeros(n, dtype=np.int32)
+
+    want = 0
+    for p in patterns:
+        want |= 1 << p
+
+    for i in range(n):
+        o0 = open_v[i]
+        h0 = high_v[i]
+        l0 = low_v[i]
+        c0 = close_v[i]
+        o1 = _prev(open_v, i, 1)
+        h1 = _prev(high_v, i, 1)
+        l1 = _prev(low_v, i, 1)
+        c1 = _prev(close_v, i, 1)
+        o2 = _prev(open_v, i, 2)
+        h2 = _prev(high_v, i, 2)
+        c2 = _prev(close_v, i, 2)
+
+        body = abs(o0 - c0)
+        full_range = h0 - l0
+        prev_top = _nanmax2(o1, c1)
+        prev_bottom = _nanmin2(o1, c1)
+        o_trend = _prev(open_v, i, trend_bars)
+        uptrend = o_trend < o0
+        downtrend = o_trend > o0
+
+        hits = 0
+        if want & (1 << _DOJI):
+            if full_range != 0.0 and body <= full_range * doji_size:
+                hits |= 1 << _DOJI
+        if want & (1 << _BULLISH_ENGULFING):
+            if o1 > c1 and c0 > o0 and c0 >= o1 and o0 <= c1:
+                hits |= 1 << _BULLISH_ENGULFING
+        if want & (1 << _BEARISH_ENGULFING):
+            if c1 > o1 and o0 > c0 and o0 >= c1 and c0 <= o1:
+                hits |= 1 << _BEARISH_ENGULFING
+        if want & (1 << _HAMMER):
+            den = h0 - l0 + 1e-12
+            if full_range > 3.0 * body and (c0 - l0) / den > 0.6 and (o0 - l0) / den > 0.6:
+                hits |= 1 << _HAMMER
+        if want & (1 << _INVERTED_HAMMER):
+            den = h0 - l0 + 1e-12
+            if full_range > 3.0 * body and (h0 - c0) / den > 0.6 and (h0 - o0) / den > 0.6:
+                hits |= 1 << _INVERTED_HAMMER
+        if want & (1 << _MORNING_STAR):
+            if c2 < o2 and prev_top < c2 and o0 > prev_top and c0 > o0:
+                hits |= 1 << _MORNING_STAR
+        if want & (1 << _EVENING_STAR):
+            if c2 > o2 and prev_bottom > c2 and o0 < prev_bottom and c0 < o0:
+                hits |= 1 << _EVENING_STAR
+        if want & (1 << _EXT_DOJI):
+            if body <= full_range * doji_size:
+                hits |= 1 << _EXT_DOJI
+        if want & (1 << _BULLISH_HARAMI):
+            if o1 > c1 and c0 > o0 and c0 <= o1 and c1 <= o0 and (c0 - o0) < (o1 - c1) and downtrend:
+                hits |= 1 << _BULLISH_HARAMI
+        if want & (1 << _BEARISH_HARAMI):
+            if c1 > o1 and o0 > c0 and o0 <= c1 and o1 <= c0 and (o0 - c0) < (c1 - o1) and uptrend:
+                hits |= 1 << _BEARISH_HARAMI
+        if want & (1 << _EXT_BULLISH_ENGULFING):
+            if o1 > c1 and c0 > o0 and c0 >= o1 and c1 >= o0 and (c0 - o0) > (o1 - c1) and downtrend:
+                hits |= 1 << _EXT_BULLISH_ENGULFING
+        if want & (1 << _EXT_BEARISH_ENGULFING):
+            if c1 > o1 and o0 > c0 and o0 >= c1 and o1 >= c0 and (o0 - c0) > (c1 - o1) and uptrend:
+                hits |= 1 << _EXT_BEARISH_ENGULFING
+        if want & (1 << _PIERCING_LINE):
+            if c1 < o1 and o0 < l1 and c0 > (c1 + (o1 - c1) / 2.0) and c0 < o1 and downtrend:
+                hits |= 1 << _PIERCING_LINE
+        if want & (1 << _BULLISH_BELT_HOLD):
+            if l0 == o0 and o0 < c0 and c0 > ((h1 - l1) / 2.0 + l1) and downtrend:
+                if o0 < _prior_low_min(low_v, i, _BELT_HOLD_LOOKBACK):
+                    hits |= 1 << _BULLISH_BELT_HOLD
+        if want & (1 << _BULLISH_KICKER):
+            if o1 > c1 and o0 >= o1 and c0 > o0 and downtrend:
+                hits |= 1 << _BULLISH_KICKER
+        if want & (1 << _BEARISH_KICKER):
+            if o1 < c1 and o0 <= o1 and c0 <= o0 and uptrend:
+                hits |= 1 << _BEARISH_KICKER
+        if want & (1 << _HANGING_MAN):
+            den = 0.001 + full_range
+            if (
+                full_range > 4.0 * body
+                and (c0 - l0) / den >= 0.75
+                and (o0 - l0) / den >= 0.75
+                and uptrend
+                and h1 < o0
+                and h2 < o0
+            ):
+                hits |= 1 << _HANGING_MAN
+        if want & (1 << _SHOOTING_STAR):
+            if o1 < c1 and o0 > c1 and (h0 - _nanmax2(o0, c0)) >= body * 3.0 and (_nanmin2(o0, c0) - l0) <= body:
+                hits |= 1 << _SHOOTING_STAR
+        if want & (1 << _EXT_HAMMER):
+            den = 0.001 + full_range
+            if full_range > 3.0 * body and (c0 - l0) / den > 0.6 and (o0 - l0) / den > 0.6:
+                hits |= 1 << _EXT_HAMMER
+        if want & (1 << _EXT_INVERTED_HAMMER):
+            den = 0.001 + full_range
+            if full_range > 3.0 * body and (h0 - c0) / den > 0.6 and (h0 - o0) / den > 0.6:
+                hits |= 1 << _EXT_INVERTED_HAMMER
+        if want & (1 << _INSIDE):
+            if h0 < h1 and l0 > l1:
+                hits |= 1 << _INSIDE
+        if want & ((1 << _BULLISH_THREE_LINE_STRIKE) | (1 << _BEARISH_THREE_LINE_STRIKE)):
+            o3 = _prev(open_v, i, 3)
+            c3 = _prev(close_v, i, 3)
+            if c3 < o3 and c2 < o2 and c1 < o1 and c0 > o1:
+                hits |= 1 << _BULLISH_THREE_LINE_STRIKE
+            if c3 > o3 and c2 > o2 and c1 > o1 and c0 < o1:
+                hits |= 1 << _BEARISH_THREE_LINE_STRIKE
+
+        if hits:
+            mask = 0
+            for k in range(patterns.shape[0]):
+                if hits & (1 << patterns[k]):
+                    mask |= 1 << k
+            out[i] = mask
+
+    return out
+
+
+def _candle_bits(
+    patterns: tuple,
+    open_s: pd.Series,
+    high_s: pd.Series,
+    low_s: pd.Series,
+    close_s: pd.Series,
+    doji_size: float = 0.05,
+    trend_bars: int = 1,
+) -> np.ndarray:
+    """
+    Bitmask per bar whose bit ``k`` marks ``patterns[k]``.
+
+    Inputs a pattern set does not read may be passed as None.
+    """
+    series = (open_s, high_s, low_s, close_s)
+    n = len(next(s for s in series if s is not None))
+    values = [np.full(n, np.nan) if s is None else s.to_numpy(dtype=np.float64) for s in series]
+    return _candle_kernel(*values, np.asarray(patterns, dtype=np.int64), float(doji_size), int(trend_bars))
+
+
+def _candle_frame(bits: np.ndarray, columns: tuple, index: pd.Index) -> pd.DataFrame:
+    return pd.DataFrame({name: (bits & (1 << k)) != 0 for k, name in enumerate(columns)}, index=index)
@@ -1,7 +1,36 @@
-import numpy as np
 import pandas as pd
 
 from .._utils import check_series
+from ._candles import (
+    _BEARISH_ENGULFING,
+    _BULLISH_ENGULFING,
+    _DOJI,
+    _EVENING_STAR,
+    _HAMMER,
+    _INVERTED_HAMMER,
+    _MORNING_STAR,
+    _candle_bits,
+    _candle_frame,
+)
+
+_COLUMNS = (
+    "DOJI",
+    "BULLISH_ENGULFING",
+    "BEARISH_ENGULFING",
+    "HAMMER",
+    "INVERTED_HAMMER",
+    "MORNING_STAR",
+    "EVENING_STAR",
+)
+_PATTERNS = (
+    _DOJI,
+    _BULLISH_ENGULFING,
+    _BEARISH_ENGULFING,
+    _HAMMER,
+    _INVERTED_HAMMER,
+    _MORNING_STAR,
+    _EVENING_STAR,
+)
 
 
 def candlestick_patterns(
@@ -10,11 +39,14 @@ def candlestick_patterns(
     low: pd.Series,
     close: pd.Series,
     doji_size: float = 0.05,
+    bitmask: bool = False,
 ) -> pd.DataFrame:
     """
     Candlestick pattern detector.
 
-    Returns common bullish/bearish and neutral pattern flags.
+    Returns common bullish/bearish and neutral pattern flags. With
+    `bitmask=True` a single int32 Series is returned instead, where bit k is
+    set when the k-th column of the DataFrame output fires.
     """
     if doji_size <= 0:
         raise ValueError("doji_size must be > 0")
@@ -24,59 +56,7 @@ def candlestick_patterns(
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
-    prev_open = open_s.shift(1)
-    prev_close = close_s.shift(1)
-
-    body = (open_s - close_s).abs()
-    full_range = (high_s - low_s).replace(0.0, np.nan)
-
-    doji = body <= full_range * doji_size
-
-    bullish_engulfing = (
-        (prev_open > prev_close)
-        & (close_s > open_s)
-        & (close_s >= prev_open)
-        & (open_s <= prev_close)
-    )
-    bearish_engulfing = (
-        (prev_close > prev_open)
-        & (open_s > close_s)
-        & (open_s >= prev_close)
-        & (close_s <= prev_open)
-    )
-
-    hammer = (
-        (high_s - low_s > 3.0 * body)
-        & (((close_s - low_s) / (high_s - low_s + 1e-12)) > 0.6)
-        & (((open_s - low_s) / (high_s - low_s + 1e-12)) > 0.6)
-    )
-    inverted_hammer = (
-        (high_s - low_s > 3.0 * body)
-        & (((high_s - close_s) / (high_s - low_s + 1e-12)) > 0.6)
-        & (((high_s - open_s) / (high_s - low_s + 1e-12)) > 0.6)
-    )
-
-    morning_star = (
-        (close_s.shift(2) < open_s.shift(2))
-        & (pd.concat([open_s.shift(1), close_s.shift(1)], axis=1).max(axis=1) < close_s.shift(2))
-        & (open_s > pd.concat([open_s.shift(1), close_s.shift(1)], axis=1).max(axis=1))
-        & (close_s > open_s)
-    )
-    evening_star = (
-        (close_s.shift(2) > open_s.shift(2))
-        & (pd.concat([open_s.shift(1), close_s.shift(1)], axis=1).min(axis=1) > close_s.shift(2))
-        & (open_s < pd.concat([open_s.shift(1), close_s.shift(1)], axis=1).min(axis=1))
-        & (close_s < open_s)
-    )
-
-    return pd.DataFrame(
-        {
-            "DOJI": doji,
-            "BULLISH_ENGULFING": bullish_engulfing,
-            "BEARISH_ENGULFING": bearish_engulfing,
-            "HAMMER": hammer,
-            "INVERTED_HAMMER": inverted_hammer,
-            "MORNING_STAR": morning_star,
-            "EVENING_STAR": evening_star,
-        }
-    )
+    bits = _candle_bits(_PATTERNS, open_s, high_s, low_s, close_s, doji_size=doji_size)
+    if bitmask:
+        return pd.Series(bits, index=close_s.index, name="CDL_PATTERNS")
+    return _candle_frame(bits, _COLUMNS, close_s.index)
@@ -1,6 +1,60 @@
 import pandas as pd
 
 from .._utils import check_series
+from ._candles import (
+    _BEARISH_HARAMI,
+    _BEARISH_KICKER,
+    _BULLISH_BELT_HOLD,
+    _BULLISH_HARAMI,
+    _BULLISH_KICKER,
+    _EVENING_STAR,
+    _EXT_BEARISH_ENGULFING,
+    _EXT_BULLISH_ENGULFING,
+    _EXT_DOJI,
+    _EXT_HAMMER,
+    _EXT_INVERTED_HAMMER,
+    _HANGING_MAN,
+    _MORNING_STAR,
+    _PIERCING_LINE,
+    _SHOOTING_STAR,
+    _candle_bits,
+    _candle_frame,
+)
+
+_COLUMNS = (
+    "DOJI",
+    "BULLISH_HARAMI",
+    "BEARISH_HARAMI",
+    "BULLISH_ENGULFING",
+    "BEARISH_ENGULFING",
+    "PIERCING_LINE",
+    "BULLISH_BELT_HOLD",
+    "BULLISH_KICKER",
+    "BEARISH_KICKER",
+    "HANGING_MAN",
+    "MORNING_STAR",
+    "EVENING_STAR",
+    "SHOOTING_STAR",
+    "HAMMER",
+    "INVERTED_HAMMER",
+)
+_PATTERNS = (
+    _EXT_DOJI,
+    _BULLISH_HARAMI,
+    _BEARISH_HARAMI,
+    _EXT_BULLISH_ENGULFING,
+    _EXT_BEARISH_ENGULFING,
+    _PIERCING_LINE,
+    _BULLISH_BELT_HOLD,
+    _BULLISH_KICKER,
+    _BEARISH_KICKER,
+    _HANGING_MAN,
+    _MORNING_STAR,
+    _EVENING_STAR,
+    _SHOOTING_STAR,
+    _EXT_HAMMER,
+    _EXT_INVERTED_HAMMER,
+)
 
 
 def candlestick_patterns_extended(
@@ -10,11 +64,14 @@ def candlestick_patterns_extended(
     close: pd.Series,
     doji_size: float = 0.05,
     trend_bars: int = 5,
+    bitmask: bool = False,
 ) -> pd.DataFrame:
     """
     Extended candlestick pattern detector.
 
-    Includes common bullish/bearish reversal and continuation patterns.
+    Includes common bullish/bearish reversal and continuation patterns. With
+    `bitmask=True` a single int32 Series is returned instead, where bit k is
+    set when the k-th column of the DataFrame output fires.
     """
     if doji_size <= 0:
         raise ValueError("doji_size must be > 0")
@@ -26,127 +83,7 @@ def candlestick_patterns_extended(
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
-    prev_open = open_s.shift(1)
-    prev_close = close_s.shift(1)
-
-    full_range = high_s - low_s
-    body = (open_s - close_s).abs()
-
-    uptrend = open_s.shift(trend_bars) < open_s
-    downtrend = open_s.shift(trend_bars) > open_s
-
-    doji = body <= full_range * doji_size
-
-    bullish_harami = (
-        (prev_open > prev_close)
-        & (close_s > open_s)
-        & (close_s <= prev_open)
-        & (prev_close <= open_s)
-        & ((close_s - open_s) < (prev_open - prev_close))
-        & downtrend
-    )
-    bearish_harami = (
-        (prev_close > prev_open)
-        & (open_s > close_s)
-        & (open_s <= prev_close)
-        & (prev_open <= close_s)
-        & ((open_s - close_s) < (prev_close - prev_open))
-        & uptrend
-    )
-
-    bullish_engulfing = (
-        (prev_open > prev_close)
-        & (close_s > open_s)
-        & (close_s >= prev_open)
-        & (prev_close >= open_s)
-        & ((close_s - open_s) > (prev_open - prev_close))
-        & downtrend
-    )
-    bearish_engulfing = (
-        (prev_close > prev_open)
-        & (open_s > close_s)
-        & (open_s >= prev_close)
-        & (prev_open >= close_s)
-        & ((open_s - close_s) > (prev_close - prev_open))
-        & uptrend
-    )
-
-    piercing_line = (
-        (prev_close < prev_open)
-        & (open_s < low_s.shift(1))
-        & (close_s > (prev_close + (prev_open - prev_close) / 2.0))
-        & (close_s < prev_open)
-        & downtrend
-    )
-
-    lower10 = low_s.rolling(10).min().shift(1)
-    bullish_belt_hold = (
-        (low_s == open_s)
-        & (open_s < lower10)
-        & (open_s < close_s)
-        & (close_s > ((high_s.shift(1) - low_s.shift(1)) / 2.0 + low_s.shift(1)))
-        & downtrend
-    )
-
-    bullish_kicker = (prev_open > prev_close) & (open_s >= prev_open) & (close_s > open_s) & downtrend
-    bearish_kicker = (prev_open < prev_close) & (open_s <= prev_open) & (close_s <= open_s) & uptrend
-
-    hanging_man = (
-        (full_range > 4.0 * body)
-        & (((close_s - low_s) / (0.001 + full_range)) >= 0.75)
-        & (((open_s - low_s) / (0.001 + full_range)) >= 0.75)
-        & uptrend
-        & (high_s.shift(1) < open_s)
-        & (high_s.shift(2) < open_s)
-    )
-
-    evening_star = (
-        (close_s.shift(2) > open_s.shift(2))
-        & (pd.concat([open_s.shift(1), close_s.shift(1)], axis=1).min(axis=1) > close_s.shift(2))
-        & (open_s < pd.concat([open_s.shift(1), close_s.shift(1)], axis=1).min(axis=1))
-        & (close_s < open_s)
-    )
-    morning_star = (
-        (close_s.shift(2) < open_s.shift(2))
-        & (pd.concat([open_s.shift(1), close_s.shift(1)], axis=1).max(axis=1) < close_s.shift(2))
-        & (open_s > pd.concat([open_s.shift(1), close_s.shift(1)], axis=1).max(axis=1))
-        & (close_s > open_s)
-    )
-
-    shooting_star = (
-        (open_s.shift(1) < close_s.shift(1))
-        & (open_s > close_s.shift(1))
-        & ((high_s - pd.concat([open_s, close_s], axis=1).max(axis=1)) >= body * 3.0)
-        & ((pd.concat([open_s, close_s], axis=1).min(axis=1) - low_s) <= body)
-    )
-
-    hammer = (
-        (full_range > 3.0 * body)
-        & (((close_s - low_s) / (0.001 + full_range)) > 0.6)
-        & (((open_s - low_s) / (0.001 + full_range)) > 0.6)
-    )
-    inverted_hammer = (
-        (full_range > 3.0 * body)
-        & (((high_s - close_s) / (0.001 + full_range)) > 0.6)
-        & (((high_s - open_s) / (0.001 + full_range)) > 0.6)
-    )
-
-    return pd.DataFrame(
-        {
-            "DOJI": doji,
-            "BULLISH_HARAMI": bullish_harami,
-            "BEARISH_HARAMI": bearish_harami,
-            "BULLISH_ENGULFING": bullish_engulfing,
-            "BEARISH_ENGULFING": bearish_engulfing,
-            "PIERCING_LINE": piercing_line,
-            "BULLISH_BELT_HOLD": bullish_belt_hold,
-            "BULLISH_KICKER": bullish_kicker,
-            "BEARISH_KICKER": bearish_kicker,
-            "HANGING_MAN": hanging_man,
-            "MORNING_STAR": morning_star,
-            "EVENING_STAR": evening_star,
-            "SHOOTING_STAR": shooting_star,
-            "HAMMER": hammer,
-            "INVERTED_HAMMER": inverted_hammer,
-        }
-    )
+    bits = _candle_bits(_PATTERNS, open_s, high_s, low_s, close_s, doji_size=doji_size, trend_bars=trend_bars)
+    if bitmask:
+        return pd.Series(bits, index=close_s.index, name="CDL_PATTERNS_EXT")
+    return _candle_frame(bits, _COLUMNS, close_s.index)
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
-from .._utils import check_series
+from .._utils import check_series, to_series
+from ..statistics.mean_deviation import _rolling_mean_deviation
 
 def cci(
     high: pd.Series,
@@ -27,10 +28,7 @@ def cci(
     
     # Mean Absolute Deviation (MAD)
     # MAD = mean(|TP - SMA(TP)|)
-    def mad(x):
-        return np.abs(x - x.mean()).mean()
-    
-    mean_dev = typical_price.rolling(length).apply(mad, raw=True)
+    mean_dev = to_series(_rolling_mean_deviation(typical_price.to_numpy(dtype=np.float64), length), typical_price.index)
     
     # CCI Formula: (TP - SMA_TP) / (0.015 * MAD)
     cci_val = (typical_price - sma_tp) / (c * mean_dev)
@@ -1,10 +1,11 @@
 import pandas as pd
 
 from .._utils import check_series
+from ._candles import _DOJI, _candle_bits
 
 
 def cdl_doji(open_: pd.Series, high: pd.Series, low: pd.Series, close: pd.Series, factor: float = 0.1) -> pd.Series:
-    """Doji candlestick pattern signal."""
+    """Doji candlestick pattern signal; bars with no range are never a doji."""
     if factor <= 0:
         raise ValueError("factor must be > 0")
 
@@ -13,8 +14,5 @@ def cdl_doji(open_: pd.Series, high: pd.Series, low: pd.Series, close: pd.Series
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
-    body = (close_s - open_s).abs()
-    rng = (high_s - low_s).replace(0.0, pd.NA)
-    out = (body <= factor * rng).astype(int)
-    out.name = "CDL_DOJI"
-    return out
+    bits = _candle_bits((_DOJI,), open_s, high_s, low_s, close_s, doji_size=factor)
+    return pd.Series(bits.astype(int), index=close_s.index, name="CDL_DOJI")
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from .._utils import check_series
+from ._candles import _INSIDE, _candle_bits
 
 
 def cdl_inside(high: pd.Series, low: pd.Series, asbool: bool = False) -> pd.Series:
@@ -8,7 +9,5 @@ def cdl_inside(high: pd.Series, low: pd.Series, asbool: bool = False) -> pd.Seri
     high_s = check_series(high, "high")
     low_s = check_series(low, "low")
 
-    inside = (high_s < high_s.shift(1)) & (low_s > low_s.shift(1))
-    out = inside if asbool else inside.astype(int)
-    out.name = "CDL_INSIDE"
-    return out
+    bits = _candle_bits((_INSIDE,), None, high_s, low_s, None)
+    return pd.Series(bits != 0 if asbool else bits.astype(int), index=high_s.index, name="CDL_INSIDE")
@@ -1,7 +1,8 @@
 import numpy as np
 import pandas as pd
 
-from .._utils import check_series
+from .._utils import check_series, to_series
+from ..overlap.linreg import _rolling_linreg
 
 
 def cfo(close: pd.Series, length: int = 9, scalar: float = 100.0) -> pd.Series:
@@ -11,18 +12,8 @@ def cfo(close: pd.Series, length: int = 9, scalar: float = 100.0) -> pd.Series:
 
     close_s = check_series(close, "close")
 
-    x = np.arange(length, dtype=np.float64)
-    x_mean = x.mean()
-    x_center = x - x_mean
-    var_x = (x_center * x_center).sum()
-
-    def _forecast(y: np.ndarray) -> float:
-        y_mean = y.mean()
-        beta = ((x_center * (y - y_mean)).sum()) / var_x
-        alpha = y_mean - beta * x_mean
-        return alpha + beta * (length - 1)
-
-    reg = close_s.rolling(length).apply(_forecast, raw=True)
+    _, _, forecast = _rolling_linreg(close_s.to_numpy(dtype=np.float64), length)
+    reg = to_series(forecast, close_s.index)
     out = scalar * (close_s - reg) / close_s.replace(0.0, np.nan)
     out.name = f"CFO_{length}"
     return out
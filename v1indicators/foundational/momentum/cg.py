@@ -1,7 +1,9 @@
 import numpy as np
 import pandas as pd
 
-from .._utils import check_series
+from .._utils import check_series, to_series
+from ..overlap._fir import _fir_filter
+from ..overlap.wma import _wma_weights
 
 
 def cg(close: pd.Series, length: int = 10) -> pd.Series:
@@ -10,8 +12,7 @@ def cg(close: pd.Series, length: int = 10) -> pd.Series:
         raise ValueError("length must be > 0")
 
     close_s = check_series(close, "close")
-    w = np.arange(1.0, length + 1.0)
-    numerator = close_s.rolling(length).apply(lambda x: -np.dot(x, w), raw=True)
+    numerator = to_series(-_fir_filter(close_s.to_numpy(dtype=np.float64), _wma_weights(length)), close_s.index)
     denominator = close_s.rolling(length).sum().replace(0.0, np.nan)
 
     out = numerator / denominator
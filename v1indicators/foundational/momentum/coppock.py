@@ -1,7 +1,8 @@
 import numpy as np
 import pandas as pd
 
-from .._utils import check_series
+from .._utils import check_series, to_series
+from ..overlap.wma import _wma_values
 
 
 def coppock(close: pd.Series, long: int = 14, short: int = 11, smooth: int = 10) -> pd.Series:
@@ -15,7 +16,5 @@ def coppock(close: pd.Series, long: int = 14, short: int = 11, smooth: int = 10)
     roc_short = 100.0 * (close_s / close_s.shift(short) - 1.0)
     raw = roc_long + roc_short
 
-    w = np.arange(1, smooth + 1, dtype=np.float64)
-    out = raw.rolling(smooth).apply(lambda x: np.dot(x, w) / w.sum(), raw=True)
-    out.name = f"COPPOCK_{long}_{short}_{smooth}"
-    return out
+    out = _wma_values(raw.to_numpy(dtype=np.float64), smooth)
+    return to_series(out, close_s.index, name=f"COPPOCK_{long}_{short}_{smooth}")
@@ -1,7 +1,8 @@
 import numpy as np
 import pandas as pd
 
-from .._utils import check_series
+from .._utils import check_series, to_series
+from ..overlap._rolling import _rolling_sum_of_squares
 
 
 def ebsw(close: pd.Series, length: int = 40) -> pd.Series:
@@ -10,10 +11,9 @@ def ebsw(close: pd.Series, length: int = 40) -> pd.Series:
         raise ValueError("length must be > 1")
 
     close_s = check_series(close, "close")
-    hp = close_s - close_s.rolling(length).mean()
-    phase = hp.rolling(length // 2 if length > 2 else 2).apply(
-        lambda x: np.arctan2(x.iloc[-1], np.sqrt((x * x).sum() + 1e-12)), raw=False
-    )
-    out = np.sin(phase)
-    out.name = f"EBSW_{length}"
-    return out
+    hp = (close_s - close_s.rolling(length).mean()).to_numpy(dtype=np.float64)
+
+    # Phase of the latest high-pass value against the RMS energy of its window.
+    power = _rolling_sum_of_squares(hp, length // 2 if length > 2 else 2)
+    phase = np.arctan2(hp, np.sqrt(power + 1e-12))
+    return to_series(np.sin(phase), close_s.index, name=f"EBSW_{length}")
@@ -1,6 +1,10 @@
+from typing import Optional
+
 import pandas as pd
 import numpy as np
-from .._utils import check_series
+from numba import njit, prange
+from .._utils import check_series, panel_output, stream_output, validate_lengths, validate_panel, validate_values
+from ..overlap._ewm import _EWMMean, _alpha_com, _ewm_advance, _ewm_mean_update, _ewm_states
 
 def rsi(close: pd.Series, length: int = 14) -> pd.Series:
     """
@@ -42,3 +46,174 @@ def rsi(close: pd.Series, length: int = 14) -> pd.Series:
     rsi_series.name = f"RSI_{length}"
     return rsi_series
 
+
+@njit(error_model="numpy")
+def _rsi_sweep_kernel(values, coms, lengths):
+    """
+    RSI for every length in one pass: the price change is split into gain and
+    loss once per bar and fed to each length's pair of Wilder recursions.
+    """
+    n = values.shape[0]
+    width = coms.shape[0]
+    gains = _ewm_states(coms, True)
+    losses = _ewm_states(coms, True)
+
+    out = np.empty((n, width), dtype=np.float64)
+    gain_obs = 0
+    loss_obs = 0
+    prev = np.nan
+    for i in range(n):
+        delta = values[i] - prev
+        prev = values[i]
+
+        # pandas window functions read infinities as missing values
+        positive = 0.0 if delta < 0.0 else delta
+        negative = 0.0 if delta > 0.0 else delta
+        if np.isinf(positive):
+            positive = np.nan
+        if np.isinf(negative):
+            negative = np.nan
+        if not np.isnan(positive):
+            gain_obs += 1
+        if not np.isnan(negative):
+            loss_obs += 1
+
+        for k in range(width):
+            avg_gain = _ewm_advance(gains, k, positive, True)
+            avg_loss = abs(_ewm_advance(losses, k, negative, True))
+            if gain_obs < lengths[k]:
+                avg_gain = np.nan
+            if loss_obs < lengths[k]:
+                avg_loss = np.nan
+            out[i, k] = 100.0 * avg_gain / (avg_gain + avg_loss)
+    return out
+
+
+def rsi_sweep(close: pd.Series, lengths) -> pd.DataFrame:
+    """
+    RSI of one series for many lengths in a single pass.
+
+    Column ``RSI_{n}`` equals ``rsi(close, n)``; the price change is computed
+    once and every length's smoothing runs inside one compiled loop that fills
+    the (bars x lengths) output block.
+
+    Args:
+        close: Pandas Series of prices.
+        lengths: Sequence of positive integer periods.
+
+    Returns:
+        Pandas DataFrame with one 'RSI_{length}' column per length.
+    """
+    lengths = validate_lengths(lengths)
+    close = check_series(close, "close")
+
+    coms = np.array([_alpha_com(1.0 / float(n)) for n in lengths.tolist()], dtype=np.float64)
+    block = _rsi_sweep_kernel(close.to_numpy(), coms, lengths)
+    return pd.DataFrame(block, index=close.index, columns=[f"RSI_{n}" for n in lengths.tolist()], copy=False)
+
+
+@njit(parallel=True)
+def _rsi_panel_kernel(values, com, length):
+    """``_rsi_sweep_kernel`` of every column of a panel, columns in parallel."""
+    n, width = values.shape
+    coms = np.full(1, com)
+    lengths = np.full(1, length, dtype=np.int64)
+    out = np.empty((width, n), dtype=np.float64)
+    for k in prange(width):
+        out[k] = _rsi_sweep_kernel(values[:, k], coms, lengths)[:, 0]
+    return out.T
+
+
+def rsi_panel(close, length: int = 14):
+    """
+    RSI of every symbol of a (bars x symbols) panel.
+
+    Columns run independently, in parallel, in one compiled kernel, each with
+    its own NaN warmup. Column ``j`` equals ``rsi(close[:, j], length)``.
+
+    Args:
+        close: 2D NumPy array or wide Pandas DataFrame of prices.
+        length: Period length (default 14).
+
+    Returns:
+        Panel of the same shape and container as ``close``.
+    """
+    if length <= 0:
+        raise ValueError("length must be > 0")
+
+    values = validate_panel(close, "close")
+    return panel_output(close, _rsi_panel_kernel(values, _alpha_com(1.0 / float(length)), int(length)))
+
+
+@njit
+def _rsi_update(cur, prev, gain_state, loss_state, com, min_periods):
+    """One RSI step; ``prev`` and both smoothing states are advanced in place."""
+    delta = cur - prev[0]
+    prev[0] = cur
+
+    positive = 0.0 if delta < 0.0 else delta
+    negative = 0.0 if delta > 0.0 else delta
+
+    avg_gain = _ewm_mean_update(gain_state, positive, com, True, min_periods)
+    avg_loss = abs(_ewm_mean_update(loss_state, negative, com, True, min_periods))
+
+    denom = avg_gain + avg_loss
+    return np.nan if denom == 0.0 else 100.0 * avg_gain / denom
+
+
+@njit
+def _rsi_stream_kernel(values, prev, gain_state, loss_state, com, min_periods):
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        out[i] = _rsi_update(values[i], prev, gain_state, loss_state, com, min_periods)
+    return out
+
+
+class RSIStream:
+    """
+    Streaming Relative Strength Index.
+
+    Seeded from a history, then advanced with ``update`` / ``update_many`` in
+    O(1) per bar. Each value is bit-for-bit the last row of ``rsi(close, length)``
+    on the extended series, including the adjust=True warmup weighting.
+
+    Args:
+        close: Optional Pandas Series of past prices to seed the state.
+        length: Period length (default 14).
+    """
+
+    __slots__ = ("length", "name", "value", "_prev", "_gain", "_loss")
+
+    def __init__(self, close: Optional[pd.Series] = None, length: int = 14):
+        if length <= 0:
+            raise ValueError("length must be > 0")
+
+        self.length = length
+        self.name = f"RSI_{length}"
+        self.value = np.nan
+        self._prev = np.array([np.nan], dtype=np.float64)
+        com = _alpha_com(1.0 / float(length))
+        self._gain = _EWMMean(com, True, length)
+        self._loss = _EWMMean(com, True, length)
+
+        if close is not None:
+            self.update_many(validate_values(close, "close"))
+
+    def update(self, value: float) -> float:
+        """Push one bar and return its RSI."""
+        return float(self.update_many(np.array([value], dtype=np.float64))[0])
+
+    def update_many(self, values):
+        """Push a batch of bars and return their RSI values (Series in, Series out)."""
+        out = _rsi_stream_kernel(
+            validate_values(values, "values"),
+            self._prev,
+            self._gain.state,
+            self._loss.state,
+            self._gain.com,
+            self._gain.min_periods,
+        )
+        if out.shape[0]:
+            self.value = float(out[-1])
+        return stream_output(values, out, self.name)
@@ -1,33 +1,9 @@
 import numpy as np
 import pandas as pd
 
-from .._utils import check_series
-
-
-def _rolling_linreg_current(values: pd.Series, length: int) -> pd.Series:
-    """
-    Rolling linear regression evaluated at the current bar.
-
-    For each rolling window, this returns the fitted y-value at x = length - 1.
-    """
-    arr = values.to_numpy(dtype=np.float64)
-    out = np.full(arr.shape, np.nan, dtype=np.float64)
-
-    if arr.size < length:
-        return pd.Series(out, index=values.index)
-
-    x = np.arange(length, dtype=np.float64)
-    x_mean = x.mean()
-    var_x = np.sum((x - x_mean) ** 2)
-
-    window_sum = np.convolve(arr, np.ones(length, dtype=np.float64), mode="valid")
-    weighted_sum = np.correlate(arr, x, mode="valid")
-
-    slope = (weighted_sum - x_mean * window_sum) / var_x
-    intercept = (window_sum / length) - slope * x_mean
-    out[length - 1 :] = intercept + slope * (length - 1)
-
-    return pd.Series(out, index=values.index)
+from .._utils import check_series, to_series
+from ..overlap.linreg import _rolling_linreg
+from ..volatility.true_range import _true_range
 
 
 def squeeze_momentum(
@@ -61,16 +37,7 @@ def squeeze_momentum(
     bb_lower = bb_mid - bb_mult * bb_std
 
     if use_true_range:
-        prev_close = close_s.shift(1)
-        tr = pd.concat(
-            [
-                high_s - low_s,
-                (high_s - prev_close).abs(),
-                (low_s - prev_close).abs(),
-            ],
-            axis=1,
-        ).max(axis=1)
-        kc_range = tr
+        kc_range = _true_range(high_s, low_s, close_s)
     else:
         kc_range = high_s - low_s
 
@@ -88,7 +55,8 @@ def squeeze_momentum(
     center = ((highest_h + lowest_l) / 2.0 + close_s.rolling(kc_length).mean()) / 2.0
     deviation = close_s - center
 
-    momentum = _rolling_linreg_current(deviation, kc_length)
+    _, _, momentum_v = _rolling_linreg(deviation.to_numpy(dtype=np.float64), kc_length)
+    momentum = to_series(momentum_v, close_s.index)
 
     return pd.DataFrame(
         {
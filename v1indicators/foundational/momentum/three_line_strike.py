@@ -1,6 +1,10 @@
 import pandas as pd
 
 from .._utils import check_series
+from ._candles import _BEARISH_THREE_LINE_STRIKE, _BULLISH_THREE_LINE_STRIKE, _candle_bits, _candle_frame
+
+_COLUMNS = ("BULLISH_THREE_LINE_STRIKE", "BEARISH_THREE_LINE_STRIKE")
+_PATTERNS = (_BULLISH_THREE_LINE_STRIKE, _BEARISH_THREE_LINE_STRIKE)
 
 
 def three_line_strike(open_: pd.Series, close: pd.Series) -> pd.DataFrame:
@@ -13,22 +17,5 @@ def three_line_strike(open_: pd.Series, close: pd.Series) -> pd.DataFrame:
     open_s = check_series(open_, "open_")
     close_s = check_series(close, "close")
 
-    bull = (
-        (close_s.shift(3) < open_s.shift(3))
-        & (close_s.shift(2) < open_s.shift(2))
-        & (close_s.shift(1) < open_s.shift(1))
-        & (close_s > open_s.shift(1))
-    )
-    bear = (
-        (close_s.shift(3) > open_s.shift(3))
-        & (close_s.shift(2) > open_s.shift(2))
-        & (close_s.shift(1) > open_s.shift(1))
-        & (close_s < open_s.shift(1))
-    )
-
-    return pd.DataFrame(
-        {
-            "BULLISH_THREE_LINE_STRIKE": bull.fillna(False),
-            "BEARISH_THREE_LINE_STRIKE": bear.fillna(False),
-        }
-    )
+    bits = _candle_bits(_PATTERNS, open_s, None, None, close_s)
+    return _candle_frame(bits, _COLUMNS, close_s.index)
@@ -1,6 +1,29 @@
+import numpy as np
 import pandas as pd
+from numba import njit
 
 from .._utils import check_series
+from ..overlap._ewm import _ewm_advance, _ewm_states, _span_com
+
+
+@njit
+def _tsi_kernel(close, slow_com, fast_com, signal_com):
+    """Both double-smoothed momentum series and the signal line in one pass."""
+    n = close.shape[0]
+    states = _ewm_states(np.array([slow_com, fast_com, slow_com, fast_com, signal_com]), False)
+
+    tsi_line = np.empty(n, dtype=np.float64)
+    sig = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        m = close[i] - close[i - 1] if i > 0 else np.nan
+        if np.isinf(m):
+            m = np.nan
+        ema1 = _ewm_advance(states, 1, _ewm_advance(states, 0, m, False), False)
+        ema2 = _ewm_advance(states, 3, _ewm_advance(states, 2, abs(m), False), False)
+
+        tsi_line[i] = np.nan if ema2 == 0.0 else 100.0 * ema1 / ema2
+        sig[i] = _ewm_advance(states, 4, tsi_line[i], False)
+    return tsi_line, sig
 
 
 def tsi(close: pd.Series, fast: int = 13, slow: int = 25, signal: int = 13) -> pd.DataFrame:
@@ -9,10 +32,10 @@ def tsi(close: pd.Series, fast: int = 13, slow: int = 25, signal: int = 13) -> p
         raise ValueError("fast, slow, and signal must be > 0")
 
     close_s = check_series(close, "close")
-    m = close_s.diff()
-    ema1 = m.ewm(span=slow, adjust=False).mean().ewm(span=fast, adjust=False).mean()
-    ema2 = m.abs().ewm(span=slow, adjust=False).mean().ewm(span=fast, adjust=False).mean()
-
-    tsi_line = 100.0 * ema1 / ema2.replace(0.0, pd.NA)
-    sig = tsi_line.ewm(span=signal, adjust=False).mean()
-    return pd.DataFrame({"TSI": tsi_line, "TSI_SIGNAL": sig})
+    tsi_line, sig = _tsi_kernel(
+        close_s.to_numpy(dtype=float),
+        _span_com(slow),
+        _span_com(fast),
+        _span_com(signal),
+    )
+    return pd.DataFrame({"TSI": tsi_line, "TSI_SIGNAL": sig}, index=close_s.index)
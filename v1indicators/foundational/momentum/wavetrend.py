@@ -1,7 +1,25 @@
 import numpy as np
 import pandas as pd
+from numba import njit
 
 from .._utils import check_series
+from ..overlap._ewm import _ewm_advance, _ewm_input, _ewm_states, _span_com
+
+
+@njit
+def _wavetrend_kernel(ap, channel_com, average_com):
+    """WT1 from the typical price, carrying the three EWM states together."""
+    n = ap.shape[0]
+    states = _ewm_states(np.array([channel_com, channel_com, average_com]), False)
+
+    wt1 = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        esa = _ewm_advance(states, 0, ap[i], False)
+        dev = ap[i] - esa
+        d = _ewm_advance(states, 1, abs(dev), False)
+        ci = dev / (0.015 * d) if d != 0.0 else np.nan
+        wt1[i] = _ewm_advance(states, 2, ci, False)
+    return wt1
 
 
 def wavetrend(
@@ -25,11 +43,10 @@ def wavetrend(
     close_s = check_series(close, "close")
 
     ap = (high_s + low_s + close_s) / 3.0
-    esa = ap.ewm(span=channel_length, adjust=False).mean()
-    d = (ap - esa).abs().ewm(span=channel_length, adjust=False).mean().replace(0.0, np.nan)
-    ci = (ap - esa) / (0.015 * d)
-
-    wt1 = ci.ewm(span=average_length, adjust=False).mean()
+    wt1 = pd.Series(
+        _wavetrend_kernel(_ewm_input(ap), _span_com(channel_length), _span_com(average_length)),
+        index=ap.index,
+    )
     wt2 = wt1.rolling(signal_length).mean()
     hist = wt1 - wt2
 
@@ -1,9 +1,9 @@
 from .accbands import accbands
 from .alma import alma
-from .bbands import bbands
+from .bbands import bbands, bbands_sweep
 from .dema import dema
 from .donchian import donchian
-from .ema import ema
+from .ema import EMAStream, ema, ema_panel, ema_sweep
 from .fwma import fwma
 from .ha import ha
 from .hilo import hilo
@@ -20,10 +20,10 @@ from .midpoint import midpoint
 from .midprice import midprice
 from .ohlc4 import ohlc4
 from .pwma import pwma
-from .rma import rma
+from .rma import RMAStream, rma
 from .sinwma import sinwma
-from .sma import sma
-from .smma import smma
+from .sma import SMAStream, sma, sma_panel, sma_sweep
+from .smma import SMMAStream, smma
 from .ssf import ssf
 from .swma import swma
 from .t3 import t3
@@ -76,4 +76,13 @@ __all__ = [
     "mcgd",
     "hwma",
     "ssf",
+    "EMAStream",
+    "RMAStream",
+    "SMMAStream",
+    "SMAStream",
+    "ema_sweep",
+    "sma_sweep",
+    "bbands_sweep",
+    "ema_panel",
+    "sma_panel",
 ]
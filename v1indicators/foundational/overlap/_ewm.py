@@ -0,0 +1,260 @@
+import numpy as np
+from numba import njit, prange
+
+from .._utils import stream_output, validate_values
+
+
+def _span_com(span: float) -> float:
+    """Center of mass for a span, computed exactly like pandas."""
+    return float((span - 1) / 2)
+
+
+def _alpha_com(alpha: float) -> float:
+    """Center of mass for a smoothing factor, computed exactly like pandas."""
+    return float((1 - alpha) / alpha)
+
+
+@njit(inline="always")
+def _ewm_step(weighted, old_wt, new_wt, cur, old_wt_factor, adjust, com_is_one):
+    """
+    One step of the pandas ``ewm(...).mean()`` recursion (``ignore_na=False``)
+    on scalar state; returns the new ``(weighted, old_wt, new_wt)``.
+    """
+    if not np.isnan(weighted):
+        old_wt *= old_wt_factor
+        if not adjust and com_is_one:
+            new_wt = 1.0 - old_wt
+        if not np.isnan(cur):
+            # avoid numerical errors on constant series
+            if weighted != cur:
+                weighted = old_wt * weighted + new_wt * cur
+                weighted = weighted / (old_wt + new_wt)
+            if adjust:
+                old_wt += new_wt
+            else:
+                old_wt = 1.0
+    elif not np.isnan(cur):
+        weighted = cur
+    return weighted, old_wt, new_wt
+
+
+@njit
+def _ewm_mean_update(state, cur, com, adjust, min_periods):
+    """
+    One step of the pandas ``ewm(...).mean()`` recursion (``ignore_na=False``).
+
+    ``state`` is ``[weighted, old_wt, new_wt, nobs]`` and is advanced in place,
+    so consecutive calls continue the same recursion bit for bit. Infinities
+    are read as missing, as pandas window functions read them.
+    """
+    if np.isinf(cur):
+        cur = np.nan
+    alpha = 1.0 / (1.0 + com)
+    if not np.isnan(cur):
+        state[3] += 1.0
+
+    weighted, state[1], state[2] = _ewm_step(state[0], state[1], state[2], cur, 1.0 - alpha, adjust, com == 1)
+    state[0] = weighted
+    return weighted if state[3] >= min_periods else np.nan
+
+
+@njit
+def _ewm_mean_kernel(values, com, adjust, min_periods, state):
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        out[i] = _ewm_mean_update(state, values[i], com, adjust, min_periods)
+    return out
+
+
+@njit
+def _ewm_states(coms, adjust):
+    """
+    Scalar-step state of ``len(coms)`` recursions kept live together:
+    ``(weighted, old_wt, new_wt, old_wt_factor, com_is_one)``.
+    """
+    depth = coms.shape[0]
+    weighted = np.full(depth, np.nan)
+    old_wt = np.ones(depth)
+    new_wt = np.empty(depth)
+    old_wt_factor = np.empty(depth)
+    com_is_one = np.empty(depth, dtype=np.bool_)
+    for k in range(depth):
+        alpha = 1.0 / (1.0 + coms[k])
+        new_wt[k] = 1.0 if adjust else alpha
+        old_wt_factor[k] = 1.0 - alpha
+        com_is_one[k] = coms[k] == 1
+    return weighted, old_wt, new_wt, old_wt_factor, com_is_one
+
+
+@njit(inline="always")
+def _ewm_advance(states, k, cur, adjust):
+    """Push ``cur`` into recursion ``k`` of ``_ewm_states`` and return its mean."""
+    weighted, old_wt, new_wt, old_wt_factor, com_is_one = states
+    weighted[k], old_wt[k], new_wt[k] = _ewm_step(
+        weighted[k], old_wt[k], new_wt[k], cur, old_wt_factor[k], adjust, com_is_one[k]
+    )
+    return weighted[k]
+
+
+@njit
+def _ewm_cascade_kernel(values, coms, adjust, levels, weights):
+    """
+    Chained EWM means in one pass over ``values``.
+
+    Stage ``k`` smooths the output of stage ``k - 1`` with ``coms[k]``; the
+    stage states stay live together instead of one Series per pass. Each bar
+    emits ``sum(weights[j] * stage[levels[j]])``, added up in the given order
+    so it equals the same expression written on pandas Series.
+    """
+    n = values.shape[0]
+    depth = coms.shape[0]
+    states = _ewm_states(coms, adjust)
+    stage = states[0]
+
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        cur = values[i]
+        for k in range(depth):
+            cur = _ewm_advance(states, k, cur, adjust)
+
+        acc = weights[0] * stage[levels[0]]
+        for j in range(1, levels.shape[0]):
+            acc += weights[j] * stage[levels[j]]
+        out[i] = acc
+    return out
+
+
+@njit
+def _ewm_sweep_kernel(values, coms, adjust, min_periods):
+    """
+    Independent EWM means of ``values``, one per ``coms[k]``, in one pass.
+
+    Column ``k`` of the ``(bars, len(coms))`` result is
+    ``ewm(com=coms[k], adjust=adjust, min_periods=min_periods[k]).mean()``;
+    the observation count is shared since every recursion reads the same bars.
+    """
+    n = values.shape[0]
+    width = coms.shape[0]
+    states = _ewm_states(coms, adjust)
+
+    out = np.empty((n, width), dtype=np.float64)
+    nobs = 0
+    for i in range(n):
+        cur = values[i]
+        if not np.isnan(cur):
+            nobs += 1
+        for k in range(width):
+            mean = _ewm_advance(states, k, cur, adjust)
+            out[i, k] = mean if nobs >= min_periods[k] else np.nan
+    return out
+
+
+def _ewm_sweep(values, coms, adjust: bool, min_periods) -> np.ndarray:
+    """
+    ``ewm(com=...).mean()`` of ``values`` for every center of mass in ``coms``;
+    ``min_periods`` is one count for all or one per entry of ``coms``.
+    """
+    coms = np.asarray(coms, dtype=np.float64)
+    min_periods = np.broadcast_to(np.maximum(np.asarray(min_periods, dtype=np.int64), 1), coms.shape)
+    return _ewm_sweep_kernel(_ewm_input(values), coms, bool(adjust), np.ascontiguousarray(min_periods))
+
+
+@njit(parallel=True)
+def _ewm_panel_kernel(values, com, adjust, min_periods):
+    """
+    ``ewm(com=com, adjust=adjust, min_periods=min_periods).mean()`` of every
+    column of a (bars x symbols) panel, columns spread over the thread pool.
+    Infinities are read as missing, as pandas does.
+    """
+    n, width = values.shape
+    alpha = 1.0 / (1.0 + com)
+    out = np.empty((width, n), dtype=np.float64)
+    for k in prange(width):
+        weighted, old_wt, new_wt = np.nan, 1.0, 1.0 if adjust else alpha
+        nobs = 0
+        for i in range(n):
+            cur = values[i, k]
+            if np.isinf(cur):
+                cur = np.nan
+            if not np.isnan(cur):
+                nobs += 1
+            weighted, old_wt, new_wt = _ewm_step(weighted, old_wt, new_wt, cur, 1.0 - alpha, adjust, com == 1)
+            out[k, i] = weighted if nobs >= min_periods else np.nan
+    return out.T
+
+
+def _ewm_input(values) -> np.ndarray:
+    """Float64 values with infinities missing, as pandas window functions read them."""
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(np.isinf(values), np.nan, values)
+
+
+def _ewm_cascade(values, spans, terms, adjust: bool = False) -> np.ndarray:
+    """
+    ``ewm(span=...).mean()`` chained over ``spans``, blended by ``terms``.
+
+    ``terms`` lists ``(stage, weight)`` pairs; stage 0 is the first EWM.
+    """
+    return _ewm_cascade_kernel(
+        _ewm_input(values),
+        np.array([_span_com(span) for span in spans], dtype=np.float64),
+        bool(adjust),
+        np.array([stage for stage, _ in terms], dtype=np.int64),
+        np.array([weight for _, weight in terms], dtype=np.float64),
+    )
+
+
+def _ewm_initial_state(com: float, adjust: bool) -> np.ndarray:
+    alpha = 1.0 / (1.0 + com)
+    return np.array([np.nan, 1.0, 1.0 if adjust else alpha, 0.0], dtype=np.float64)
+
+
+class _EWMMean:
+    """Resumable state of a pandas exponentially weighted mean."""
+
+    __slots__ = ("com", "adjust", "min_periods", "state")
+
+    def __init__(self, com: float, adjust: bool, min_periods: int = 0):
+        self.com = float(com)
+        self.adjust = bool(adjust)
+        self.min_periods = max(int(min_periods), 1)
+
+        self.state = _ewm_initial_state(self.com, self.adjust)
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        return _ewm_mean_kernel(values, self.com, self.adjust, self.min_periods, self.state)
+
+    def update(self, value: float) -> float:
+        return float(self.update_many(np.array([value], dtype=np.float64))[0])
+
+    def peek(self, value: float) -> float:
+        """Value ``update`` would return, without advancing the state."""
+        return float(_ewm_mean_update(self.state.copy(), value, self.com, self.adjust, self.min_periods))
+
+
+class _EWMStream:
+    """Shared driver for the single-input EWM streams (EMA, RMA, SMMA)."""
+
+    __slots__ = ("length", "name", "value", "_ewm")
+
+    def __init__(self, close, length: int, com: float, adjust: bool, name: str):
+        self.length = length
+        self.name = name
+        self.value = np.nan
+        self._ewm = _EWMMean(com, adjust)
+
+        if close is not None:
+            self.update_many(validate_values(close, "close"))
+
+    def update(self, value: float) -> float:
+        """Push one bar and return its value."""
+        self.value = self._ewm.update(value)
+        return self.value
+
+    def update_many(self, values):
+        """Push a batch of bars and return their values (Series in, Series out)."""
+        out = self._ewm.update_many(validate_values(values, "values"))
+        if out.shape[0]:
+            self.value = float(out[-1])
+        return stream_output(values, out, self.name)
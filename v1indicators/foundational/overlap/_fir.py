@@ -0,0 +1,38 @@
+import functools
+
+import numpy as np
+
+
+def _cached_weights(builder):
+    """
+    Memoize a window-weight builder per argument tuple.
+
+    Each decorated builder gets its own cache, so weights are computed once per
+    (indicator, length, params). The cached arrays are read-only.
+    """
+
+    @functools.lru_cache(maxsize=128)
+    @functools.wraps(builder)
+    def cached(*args):
+        weights = np.array(builder(*args), dtype=np.float64)
+        weights.setflags(write=False)
+        return weights
+
+    return cached
+
+
+def _fir_filter(values: np.ndarray, weights: np.ndarray, divisor: float = 1.0) -> np.ndarray:
+    """
+    Fixed-weight moving window, aligned to the input.
+
+    Equivalent to ``rolling(len(weights)).apply(lambda x: np.dot(x, weights) / divisor)``
+    but evaluated as one convolution: the first ``len(weights) - 1`` values are
+    NaN and, as in pandas rolling windows, any window containing a NaN or an
+    infinite value is NaN.
+    """
+    values = np.where(np.isinf(values), np.nan, values)
+    length = weights.shape[0]
+    out = np.full(values.shape[0], np.nan, dtype=np.float64)
+    if values.shape[0] >= length:
+        out[length - 1 :] = np.convolve(values, weights[::-1], mode="valid") / divisor
+    return out
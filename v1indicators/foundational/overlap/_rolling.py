@@ -0,0 +1,243 @@
+import numpy as np
+from numba import njit
+
+from ..statistics._pairwise import _pairwise_sum
+
+# pandas rebuilds a rolling variance from its window once a removal leaves
+# less than this fraction of the previous sum of squared deviations.
+_VAR_REBUILD = 1e3 * np.finfo(np.float64).eps
+
+
+@njit(inline="always")
+def _mean_add(cur, sum_x, comp, nobs, neg_ct, same_ct, prev_value):
+    """pandas' ``add_mean``; returns the new ``(sum, comp, nobs, neg_ct, same_ct, prev_value)``."""
+    if not np.isnan(cur):
+        nobs += 1
+        y = cur - comp
+        t = sum_x + y
+        comp = t - sum_x - y
+        sum_x = t
+        if np.signbit(cur):
+            neg_ct += 1
+        if cur == prev_value:
+            same_ct += 1
+        else:
+            same_ct = 1
+        prev_value = cur
+    return sum_x, comp, nobs, neg_ct, same_ct, prev_value
+
+
+@njit(inline="always")
+def _mean_remove(old, sum_x, comp, nobs, neg_ct):
+    """pandas' ``remove_mean``; returns the new ``(sum, comp, nobs, neg_ct)``."""
+    if not np.isnan(old):
+        nobs -= 1
+        y = -old - comp
+        t = sum_x + y
+        comp = t - sum_x - y
+        sum_x = t
+        if np.signbit(old):
+            neg_ct -= 1
+    return sum_x, comp, nobs, neg_ct
+
+
+@njit(inline="always")
+def _mean_result(sum_x, nobs, neg_ct, same_ct, prev_value, min_periods):
+    if nobs >= min_periods and nobs > 0:
+        result = sum_x / nobs
+        if same_ct >= nobs:
+            result = prev_value
+        elif neg_ct == 0 and result < 0:
+            result = 0.0
+        elif neg_ct == nobs and result > 0:
+            result = 0.0
+        return result
+    return np.nan
+
+
+@njit
+def _rolling_mean_update(buf, fstate, istate, cur, min_periods):
+    """
+    One step of pandas' fixed-window ``rolling(length).mean()``.
+
+    Reproduces the compensated add/remove summation pandas uses, so results
+    are bit-identical. ``buf`` holds the last ``length`` inputs, ``fstate`` is
+    ``[sum, comp_add, comp_remove, prev_value]`` and ``istate`` is
+    ``[nobs, neg_ct, same_value_ct, bars_seen]``; all are advanced in place.
+    Infinities are read as missing, as pandas window functions read them.
+    """
+    if np.isinf(cur):
+        cur = np.nan
+    length = buf.shape[0]
+    seen = istate[3]
+
+    if seen == 0 or length == 1:
+        fstate[0] = 0.0
+        fstate[1] = 0.0
+        fstate[2] = 0.0
+        fstate[3] = cur
+        istate[0] = 0
+        istate[1] = 0
+        istate[2] = 0
+    elif seen >= length:
+        fstate[0], fstate[2], istate[0], istate[1] = _mean_remove(
+            buf[seen % length], fstate[0], fstate[2], istate[0], istate[1]
+        )
+
+    fstate[0], fstate[1], istate[0], istate[1], istate[2], fstate[3] = _mean_add(
+        cur, fstate[0], fstate[1], istate[0], istate[1], istate[2], fstate[3]
+    )
+
+    buf[seen % length] = cur
+    istate[3] = seen + 1
+    return _mean_result(fstate[0], istate[0], istate[1], istate[2], fstate[3], min_periods)
+
+
+@njit
+def _rolling_mean_kernel(values, buf, fstate, istate, min_periods):
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        out[i] = _rolling_mean_update(buf, fstate, istate, values[i], min_periods)
+    return out
+
+
+class _RollingMean:
+    """Resumable state of a pandas fixed-window rolling mean."""
+
+    __slots__ = ("min_periods", "buf", "fstate", "istate")
+
+    def __init__(self, length: int, min_periods: int):
+        self.min_periods = int(min_periods)
+        self.buf = np.full(int(length), np.nan, dtype=np.float64)
+        self.fstate = np.zeros(4, dtype=np.float64)
+        self.istate = np.zeros(4, dtype=np.int64)
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        return _rolling_mean_kernel(values, self.buf, self.fstate, self.istate, self.min_periods)
+
+    def update(self, value: float) -> float:
+        return float(self.update_many(np.array([value], dtype=np.float64))[0])
+
+
+@njit(inline="always")
+def _var_add(cur, mean, ssqdm, comp, nobs, same_ct, prev_value):
+    """pandas' ``add_var``; returns the new ``(mean, ssqdm, comp, nobs, same_ct, prev_value)``."""
+    if not np.isnan(cur):
+        nobs += 1
+        if cur == prev_value:
+            same_ct += 1
+        else:
+            same_ct = 1
+        prev_value = cur
+        prev_mean = mean - comp
+        y = cur - comp
+        t = y - mean
+        comp = t + mean - y
+        mean = mean + t / nobs
+        ssqdm = ssqdm + (cur - prev_mean) * (cur - mean)
+    return mean, ssqdm, comp, nobs, same_ct, prev_value
+
+
+@njit(inline="always")
+def _var_remove(old, mean, ssqdm, comp, nobs, same_ct):
+    """pandas' ``remove_var``; returns the new ``(mean, ssqdm, comp, nobs, same_ct)``."""
+    if not np.isnan(old):
+        nobs -= 1
+        same_ct = 0
+        if nobs:
+            prev_mean = mean - comp
+            y = old - comp
+            t = y - mean
+            comp = t + mean - y
+            mean = mean - t / nobs
+            ssqdm = ssqdm - (old - prev_mean) * (old - mean)
+        else:
+            mean = 0.0
+            ssqdm = 0.0
+    return mean, ssqdm, comp, nobs, same_ct
+
+
+@njit(inline="always")
+def _var_result(ssqdm, nobs, same_ct, min_periods, ddof):
+    if nobs >= min_periods and nobs > ddof:
+        if same_ct >= nobs:
+            return 0.0
+        return ssqdm / (nobs - ddof)
+    return np.nan
+
+
+@njit(inline="always")
+def _var_rebuild(values, start, stop):
+    """``_var_add`` state of ``values[start:stop]`` added to a fresh window."""
+    mean, ssqdm, comp, nobs, same_ct, prev_value = 0.0, 0.0, 0.0, 0, 0, values[start]
+    for j in range(start, stop):
+        mean, ssqdm, comp, nobs, same_ct, prev_value = _var_add(values[j], mean, ssqdm, comp, nobs, same_ct, prev_value)
+    return mean, ssqdm, comp, nobs, same_ct, prev_value
+
+
+@njit
+def _rolling_mean_sweep_kernel(values, lengths):
+    """
+    ``rolling(n).mean()`` of ``values`` for every ``n`` in ``lengths`` in one
+    pass, as the columns of a ``(bars, len(lengths))`` block.
+
+    Each length keeps pandas' compensated add/remove state in flat arrays and
+    reads the value leaving its window straight from ``values``, so results are
+    bit-identical.
+    """
+    n = values.shape[0]
+    width = lengths.shape[0]
+    sum_x = np.zeros(width)
+    comp_add = np.zeros(width)
+    comp_remove = np.zeros(width)
+    nobs = np.zeros(width, dtype=np.int64)
+    neg_ct = np.zeros(width, dtype=np.int64)
+    same_ct = np.zeros(width, dtype=np.int64)
+    prev_value = np.zeros(width)
+
+    out = np.empty((n, width), dtype=np.float64)
+    for i in range(n):
+        cur = values[i]
+        for k in range(width):
+            length = lengths[k]
+            if i == 0 or length == 1:
+                sum_x[k], comp_add[k], comp_remove[k] = 0.0, 0.0, 0.0
+                nobs[k], neg_ct[k], same_ct[k] = 0, 0, 0
+                prev_value[k] = cur
+            elif i >= length:
+                sum_x[k], comp_remove[k], nobs[k], neg_ct[k] = _mean_remove(
+                    values[i - length], sum_x[k], comp_remove[k], nobs[k], neg_ct[k]
+                )
+            sum_x[k], comp_add[k], nobs[k], neg_ct[k], same_ct[k], prev_value[k] = _mean_add(
+                cur, sum_x[k], comp_add[k], nobs[k], neg_ct[k], same_ct[k], prev_value[k]
+            )
+            out[i, k] = _mean_result(sum_x[k], nobs[k], neg_ct[k], same_ct[k], prev_value[k], length)
+    return out
+
+
+@njit
+def _rolling_sum_of_squares_kernel(values, length):
+    n = values.shape[0]
+    out = np.full(n, np.nan, dtype=np.float64)
+    squares = values * values
+
+    last_missing = -1
+    for i in range(n):
+        if not np.isfinite(values[i]):
+            last_missing = i
+        if i < length - 1 or last_missing > i - length:
+            continue
+        out[i] = _pairwise_sum(squares, i - length + 1, length)
+    return out
+
+
+def _rolling_sum_of_squares(values: np.ndarray, length: int) -> np.ndarray:
+    """
+    ``rolling(length).apply(lambda x: (x * x).sum())`` without callbacks.
+
+    Windows holding a missing or infinite value are NaN, and each sum uses
+    NumPy's pairwise order, so results are bit-identical to the callback form.
+    """
+    return _rolling_sum_of_squares_kernel(np.ascontiguousarray(values, dtype=np.float64), int(length))
+
@@ -1,7 +1,17 @@
 import numpy as np
 import pandas as pd
 
-from .._utils import check_series
+from .._utils import check_series, to_series
+from ._fir import _cached_weights, _fir_filter
+
+
+@_cached_weights
+def _alma_weights(length: int, sigma: float, offset: float) -> np.ndarray:
+    m = offset * (length - 1)
+    s = length / sigma
+    i = np.arange(length, dtype=np.float64)
+    w = np.exp(-((i - m) ** 2) / (2.0 * s * s))
+    return w / w.sum()
 
 
 def alma(close: pd.Series, length: int = 9, sigma: float = 6.0, offset: float = 0.85) -> pd.Series:
@@ -14,13 +24,5 @@ def alma(close: pd.Series, length: int = 9, sigma: float = 6.0, offset: float =
         raise ValueError("offset must be between 0 and 1")
 
     close_s = check_series(close, "close")
-
-    m = offset * (length - 1)
-    s = length / sigma
-    i = np.arange(length, dtype=np.float64)
-    w = np.exp(-((i - m) ** 2) / (2.0 * s * s))
-    w /= w.sum()
-
-    out = close_s.rolling(length).apply(lambda x: np.dot(x, w), raw=True)
-    out.name = f"ALMA_{length}_{sigma}_{offset}"
-    return out
+    out = _fir_filter(close_s.to_numpy(dtype=np.float64), _alma_weights(length, sigma, offset))
+    return to_series(out, close_s.index, name=f"ALMA_{length}_{sigma}_{offset}")
@@ -1,5 +1,18 @@
+import numpy as np
 import pandas as pd
-from .._utils import check_series
+from numba import njit
+from .._utils import check_series, validate_lengths
+from ._ewm import _ewm_input
+from ._rolling import (
+    _VAR_REBUILD,
+    _mean_add,
+    _mean_remove,
+    _mean_result,
+    _var_add,
+    _var_rebuild,
+    _var_remove,
+    _var_result,
+)
 
 def bbands(
     close: pd.Series,
@@ -28,4 +41,103 @@ def bbands(
         "BB_LOWER": lower,
         "BB_MID": mid,
         "BB_UPPER": upper,
-    })
\ No newline at end of file
+    })
+
+
+@njit
+def _bbands_sweep_kernel(values, lengths, mult):
+    """
+    Lower, mid and upper band for every length in one pass; column ``3k + j``
+    holds band ``j`` of ``lengths[k]``.
+
+    Each length carries pandas' rolling mean and rolling variance state and
+    reads the value leaving its window straight from ``values``, so the bands
+    are bit-identical to ``bbands``.
+    """
+    n = values.shape[0]
+    width = lengths.shape[0]
+    sum_x = np.zeros(width)
+    sum_add = np.zeros(width)
+    sum_remove = np.zeros(width)
+    sum_obs = np.zeros(width, dtype=np.int64)
+    neg_ct = np.zeros(width, dtype=np.int64)
+    sum_same = np.zeros(width, dtype=np.int64)
+    sum_prev = np.zeros(width)
+    mean = np.zeros(width)
+    ssqdm = np.zeros(width)
+    var_add = np.zeros(width)
+    var_remove = np.zeros(width)
+    var_obs = np.zeros(width, dtype=np.int64)
+    var_same = np.zeros(width, dtype=np.int64)
+    var_prev = np.zeros(width)
+
+    out = np.empty((n, 3 * width), dtype=np.float64)
+    for i in range(n):
+        cur = values[i]
+        for k in range(width):
+            length = lengths[k]
+            if i == 0 or length == 1:
+                sum_x[k], sum_add[k], sum_remove[k] = 0.0, 0.0, 0.0
+                sum_obs[k], neg_ct[k], sum_same[k] = 0, 0, 0
+                sum_prev[k] = cur
+                mean[k], ssqdm[k], var_add[k], var_remove[k] = 0.0, 0.0, 0.0, 0.0
+                var_obs[k], var_same[k] = 0, 0
+                var_prev[k] = cur
+            else:
+                before = ssqdm[k]
+                if i >= length:
+                    old = values[i - length]
+                    sum_x[k], sum_remove[k], sum_obs[k], neg_ct[k] = _mean_remove(
+                        old, sum_x[k], sum_remove[k], sum_obs[k], neg_ct[k]
+                    )
+                    mean[k], ssqdm[k], var_remove[k], var_obs[k], var_same[k] = _var_remove(
+                        old, mean[k], ssqdm[k], var_remove[k], var_obs[k], var_same[k]
+                    )
+                if ssqdm[k] < before * _VAR_REBUILD:
+                    # Cancellation left only rounding noise; rebuild from the window.
+                    mean[k], ssqdm[k], var_add[k], var_obs[k], var_same[k], var_prev[k] = _var_rebuild(
+                        values, max(i - length + 1, 0), i
+                    )
+                    var_remove[k] = 0.0
+
+            sum_x[k], sum_add[k], sum_obs[k], neg_ct[k], sum_same[k], sum_prev[k] = _mean_add(
+                cur, sum_x[k], sum_add[k], sum_obs[k], neg_ct[k], sum_same[k], sum_prev[k]
+            )
+            mean[k], ssqdm[k], var_add[k], var_obs[k], var_same[k], var_prev[k] = _var_add(
+                cur, mean[k], ssqdm[k], var_add[k], var_obs[k], var_same[k], var_prev[k]
+            )
+
+            mid = _mean_result(sum_x[k], sum_obs[k], neg_ct[k], sum_same[k], sum_prev[k], length)
+            var = _var_result(ssqdm[k], var_obs[k], var_same[k], length, 1)
+            std = 0.0 if var < 0.0 else np.sqrt(var)
+            out[i, 3 * k] = mid - std * mult
+            out[i, 3 * k + 1] = mid
+            out[i, 3 * k + 2] = mid + std * mult
+    return out
+
+
+def bbands_sweep(close: pd.Series, lengths, mult: float = 2.0) -> pd.DataFrame:
+    """
+    Bollinger Bands of one series for many lengths in a single pass.
+
+    The rolling mean and deviation of every length advance together inside
+    one compiled loop that fills the output block; ``result[n]`` equals
+    ``bbands(close, n, mult)``.
+
+    Args:
+        close: Pandas Series of prices.
+        lengths: Sequence of positive integer window lengths.
+        mult: Standard deviation multiplier (default 2.0).
+
+    Returns:
+        Pandas DataFrame with ('length', band) MultiIndex columns, bands
+        'BB_LOWER', 'BB_MID' and 'BB_UPPER' for each length.
+    """
+    lengths = validate_lengths(lengths)
+    close = check_series(close, "close")
+
+    block = _bbands_sweep_kernel(_ewm_input(close.to_numpy()), lengths, float(mult))
+    columns = pd.MultiIndex.from_product(
+        [lengths.tolist(), ["BB_LOWER", "BB_MID", "BB_UPPER"]], names=["length", None]
+    )
+    return pd.DataFrame(block, index=close.index, columns=columns, copy=False)
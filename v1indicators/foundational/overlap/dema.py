@@ -1,6 +1,7 @@
 import pandas as pd
 
 from .._utils import check_series
+from ._ewm import _ewm_cascade
 
 
 def dema(close: pd.Series, length: int = 20) -> pd.Series:
@@ -13,9 +14,5 @@ def dema(close: pd.Series, length: int = 20) -> pd.Series:
         raise ValueError("length must be > 0")
 
     close_s = check_series(close, "close")
-    ema1 = close_s.ewm(span=length, adjust=False).mean()
-    ema2 = ema1.ewm(span=length, adjust=False).mean()
-
-    result = 2.0 * ema1 - ema2
-    result.name = f"DEMA_{length}"
-    return result
+    result = _ewm_cascade(close_s.to_numpy(dtype=float), (length, length), ((0, 2.0), (1, -1.0)))
+    return pd.Series(result, index=close_s.index, name=f"DEMA_{length}")
@@ -1,5 +1,8 @@
+from typing import Optional
+
 import pandas as pd
-from .._utils import check_series
+from .._utils import check_series, panel_output, validate_lengths, validate_panel
+from ._ewm import _EWMStream, _ewm_panel_kernel, _ewm_sweep, _span_com
 
 def ema(close: pd.Series, length: int, adjust: bool = False) -> pd.Series:
     """
@@ -28,3 +31,71 @@ def ema(close: pd.Series, length: int, adjust: bool = False) -> pd.Series:
     result.name = f"EMA_{length}"
     return result
 
+
+def ema_sweep(close: pd.Series, lengths, adjust: bool = False) -> pd.DataFrame:
+    """
+    EMA of one series for many lengths in a single pass.
+
+    Every smoothing state advances bar by bar inside one compiled loop that
+    writes straight into the (bars x lengths) output block. Column ``EMA_{n}``
+    equals ``ema(close, n, adjust)``.
+
+    Args:
+        close: Pandas Series of prices.
+        lengths: Sequence of positive integer periods.
+        adjust: Same meaning as in ``ema``.
+
+    Returns:
+        Pandas DataFrame with one 'EMA_{length}' column per length.
+    """
+    lengths = validate_lengths(lengths)
+    series = check_series(close, "close")
+
+    block = _ewm_sweep(series.to_numpy(), [_span_com(n) for n in lengths.tolist()], adjust, 0)
+    return pd.DataFrame(block, index=series.index, columns=[f"EMA_{n}" for n in lengths.tolist()], copy=False)
+
+
+def ema_panel(close, length: int, adjust: bool = False):
+    """
+    EMA of every symbol of a (bars x symbols) panel.
+
+    Columns are smoothed independently, in parallel, by one compiled kernel,
+    each with its own NaN warmup. Column ``j`` equals ``ema(close[:, j],
+    length, adjust)``.
+
+    Args:
+        close: 2D NumPy array or wide Pandas DataFrame of prices.
+        length: Number of periods.
+        adjust: Same meaning as in ``ema``.
+
+    Returns:
+        Panel of the same shape and container as ``close``.
+    """
+    if length <= 0:
+        raise ValueError("length must be > 0")
+
+    values = validate_panel(close, "close")
+    return panel_output(close, _ewm_panel_kernel(values, _span_com(length), bool(adjust), 1))
+
+
+class EMAStream(_EWMStream):
+    """
+    Streaming Exponential Moving Average.
+
+    Seeded from a history, then advanced one bar (``update``) or a small batch
+    (``update_many``) at a time in O(1) per bar. Every emitted value equals the
+    last row of ``ema(close, length, adjust)`` on the extended series, including
+    the ``adjust`` weighting and NaN handling.
+
+    Args:
+        close: Optional Pandas Series of past prices to seed the state.
+        length: Number of periods.
+        adjust: Same meaning as in ``ema``.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, close: Optional[pd.Series], length: int, adjust: bool = False):
+        if length <= 0:
+            raise ValueError("length must be > 0")
+        super().__init__(close, length, _span_com(length), adjust, f"EMA_{length}")
@@ -1,7 +1,17 @@
 import numpy as np
 import pandas as pd
 
-from .._utils import check_series
+from .._utils import check_series, to_series
+from ._fir import _cached_weights, _fir_filter
+
+
+@_cached_weights
+def _fwma_weights(length: int) -> np.ndarray:
+    fib = [1.0, 1.0]
+    while len(fib) < length:
+        fib.append(fib[-1] + fib[-2])
+    w = np.array(fib[-length:], dtype=np.float64)
+    return w / w.sum()
 
 
 def fwma(close: pd.Series, length: int = 10) -> pd.Series:
@@ -10,12 +20,5 @@ def fwma(close: pd.Series, length: int = 10) -> pd.Series:
         raise ValueError("length must be > 0")
 
     close_s = check_series(close, "close")
-    fib = [1.0, 1.0]
-    while len(fib) < length:
-        fib.append(fib[-1] + fib[-2])
-    w = np.array(fib[-length:], dtype=np.float64)
-    w /= w.sum()
-
-    out = close_s.rolling(length).apply(lambda x: np.dot(x, w), raw=True)
-    out.name = f"FWMA_{length}"
-    return out
+    out = _fir_filter(close_s.to_numpy(dtype=np.float64), _fwma_weights(length))
+    return to_series(out, close_s.index, name=f"FWMA_{length}")
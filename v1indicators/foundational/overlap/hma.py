@@ -2,19 +2,7 @@ import numpy as np
 import pandas as pd
 
 from .._utils import check_series
-
-
-def _wma_values(values: np.ndarray, length: int) -> np.ndarray:
-    """Vectorized WMA values aligned to the original input length."""
-    out = np.full(values.shape[0], np.nan, dtype=np.float64)
-
-    if values.shape[0] < length:
-        return out
-
-    weights = np.arange(1, length + 1, dtype=np.float64)
-    weighted = np.convolve(values, weights[::-1], mode="valid") / weights.sum()
-    out[length - 1 :] = weighted
-    return out
+from .wma import _wma_values
 
 
 def hma(close: pd.Series, length: int = 20) -> pd.Series:
@@ -3,6 +3,7 @@ import pandas as pd
 from numba import njit
 
 from .._utils import check_series
+from ..volatility.true_range import _true_range_value
 
 
 @njit
@@ -36,10 +37,7 @@ def _kalman_filter_kernel(
             out[i] = np.nan
             continue
 
-        tr = max(
-            high_v[i] - low_v[i],
-            max(abs(high_v[i] - close_v[i - 1]), abs(low_v[i] - close_v[i - 1])),
-        )
+        tr = _true_range_value(high_v[i], low_v[i], close_v[i - 1])
 
         value1 = velocity_alpha * (src_v[i] - src_v[i - 1]) + memory_alpha * value1
         value2 = range_alpha * tr + memory_alpha * value2
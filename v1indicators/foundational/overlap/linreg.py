@@ -1,7 +1,118 @@
 import numpy as np
 import pandas as pd
+from numba import njit
 
-from .._utils import check_series
+from .._utils import check_series, to_series
+
+
+@njit
+def _window_sums(values, end, length, with_stats, anchor):
+    """Sums of ``y - anchor`` over the window ending at ``end``."""
+    s_y = 0.0
+    s_xy = 0.0
+    s_yy = 0.0
+    start = end - length + 1
+    for k in range(length):
+        y = values[start + k] - anchor
+        s_y += y
+        s_xy += k * y
+        if with_stats:
+            s_yy += y * y
+    return s_y, s_xy, s_yy
+
+
+@njit
+def _rolling_linreg_kernel(values, length, offset, with_stats):
+    """
+    Least-squares line over each ``length`` window, x = 0 .. length - 1.
+
+    The window sums are slid in O(1) per bar and rebuilt every ``length`` bars
+    to bound rounding drift. They are taken relative to the first value of the
+    window at each rebuild, so the sum of squares does not cancel against the
+    price level. As in pandas rolling windows, a window holding a NaN or an
+    infinite value is NaN.
+    """
+    n = values.shape[0]
+    intercept = np.full(n, np.nan, dtype=np.float64)
+    slope = np.full(n, np.nan, dtype=np.float64)
+    forecast = np.full(n, np.nan, dtype=np.float64)
+    m = n if with_stats else 0
+    r2 = np.full(m, np.nan, dtype=np.float64)
+    stderr = np.full(m, np.nan, dtype=np.float64)
+
+    x_mean = (length - 1) / 2.0
+    var_x = length * (length * length - 1.0) / 12.0
+    x_forecast = length - 1.0 + offset
+
+    last_missing = -1
+    last_rebuild = -1
+    valid_prev = False
+    s_y = 0.0
+    s_xy = 0.0
+    s_yy = 0.0
+    anchor = 0.0
+
+    for i in range(n):
+        y_new = values[i]
+        if not np.isfinite(y_new):
+            last_missing = i
+
+        if i < length - 1:
+            continue
+        if last_missing > i - length:
+            valid_prev = False
+            continue
+
+        if not valid_prev or i - last_rebuild >= length:
+            anchor = values[i - length + 1]
+            s_y, s_xy, s_yy = _window_sums(values, i, length, with_stats, anchor)
+            last_rebuild = i
+        else:
+            y_new = y_new - anchor
+            y_old = values[i - length] - anchor
+            s_xy = s_xy - (s_y - y_old) + (length - 1) * y_new
+            s_y = s_y - y_old + y_new
+            if with_stats:
+                s_yy = s_yy - y_old * y_old + y_new * y_new
+        valid_prev = True
+
+        cov = s_xy - x_mean * s_y
+        b = cov / var_x
+        a = anchor + (s_y / length - b * x_mean)
+        slope[i] = b
+        intercept[i] = a
+        forecast[i] = a + b * x_forecast
+
+        if with_stats:
+            ss_y = s_yy - s_y * s_y / length
+            if ss_y < 0.0:
+                ss_y = 0.0
+            sse = ss_y - b * cov
+            if sse < 0.0:
+                sse = 0.0
+            if ss_y > 0.0:
+                r2[i] = (cov * cov) / (var_x * ss_y)
+            if length > 2:
+                stderr[i] = np.sqrt(sse / (length - 2))
+
+    return intercept, slope, forecast, r2, stderr
+
+
+def _rolling_linreg(values: np.ndarray, length: int, offset: float = 0.0, with_stats: bool = False):
+    """
+    Rolling regression of ``values`` on the bar position inside each window.
+
+    Returns ``(intercept, slope, forecast)`` aligned to ``values``, where the
+    forecast is evaluated at ``x = length - 1 + offset``; with ``with_stats``
+    the coefficient of determination and the residual standard error are
+    appended.
+    """
+    intercept, slope, forecast, r2, stderr = _rolling_linreg_kernel(
+        np.ascontiguousarray(values, dtype=np.float64), int(length), float(offset), bool(with_stats)
+    )
+    if with_stats:
+        return intercept, slope, forecast, r2, stderr
+    return intercept, slope, forecast
 
 
 def linreg(close: pd.Series, length: int = 14, offset: int = 0) -> pd.Series:
@@ -10,16 +121,5 @@ def linreg(close: pd.Series, length: int = 14, offset: int = 0) -> pd.Series:
         raise ValueError("length must be > 1")
 
     close_s = check_series(close, "close")
-    x = np.arange(length, dtype=np.float64)
-    x_mean = x.mean()
-    var_x = ((x - x_mean) ** 2).sum()
-
-    def _fit(y: np.ndarray) -> float:
-        y_mean = y.mean()
-        slope = ((x - x_mean) * (y - y_mean)).sum() / var_x
-        intercept = y_mean - slope * x_mean
-        return intercept + slope * (length - 1 + offset)
-
-    out = close_s.rolling(length).apply(_fit, raw=True)
-    out.name = f"LINREG_{length}"
-    return out
+    _, _, forecast = _rolling_linreg(close_s.to_numpy(dtype=np.float64), length, offset)
+    return to_series(forecast, close_s.index, name=f"LINREG_{length}")
@@ -2,7 +2,14 @@ import math
 import numpy as np
 import pandas as pd
 
-from .._utils import check_series
+from .._utils import check_series, to_series
+from ._fir import _cached_weights, _fir_filter
+
+
+@_cached_weights
+def _pwma_weights(length: int) -> np.ndarray:
+    w = np.array([math.comb(length - 1, i) for i in range(length)], dtype=np.float64)
+    return w / w.sum()
 
 
 def pwma(close: pd.Series, length: int = 10) -> pd.Series:
@@ -11,8 +18,5 @@ def pwma(close: pd.Series, length: int = 10) -> pd.Series:
         raise ValueError("length must be > 0")
 
     close_s = check_series(close, "close")
-    w = np.array([math.comb(length - 1, i) for i in range(length)], dtype=np.float64)
-    w /= w.sum()
-    out = close_s.rolling(length).apply(lambda x: np.dot(x, w), raw=True)
-    out.name = f"PWMA_{length}"
-    return out
+    out = _fir_filter(close_s.to_numpy(dtype=np.float64), _pwma_weights(length))
+    return to_series(out, close_s.index, name=f"PWMA_{length}")
@@ -1,5 +1,8 @@
+from typing import Optional
+
 import pandas as pd
 from .._utils import check_series
+from ._ewm import _EWMStream, _alpha_com
 
 def rma(close: pd.Series, length: int) -> pd.Series:
     """
@@ -18,3 +21,20 @@ def rma(close: pd.Series, length: int) -> pd.Series:
     result = series.ewm(alpha=1.0/length, adjust=False).mean()
     result.name = f"RMA_{length}"
     return result
+
+
+class RMAStream(_EWMStream):
+    """
+    Streaming counterpart of ``rma``.
+
+    Seeded from an optional history and advanced with ``update`` /
+    ``update_many`` in O(1) per bar; each value equals the last row of
+    ``rma(close, length)`` on the extended series.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, close: Optional[pd.Series], length: int):
+        if length <= 0:
+            raise ValueError("length must be > 0")
+        super().__init__(close, length, _alpha_com(1.0 / length), False, f"RMA_{length}")
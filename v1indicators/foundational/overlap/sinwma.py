@@ -1,7 +1,15 @@
 import numpy as np
 import pandas as pd
 
-from .._utils import check_series
+from .._utils import check_series, to_series
+from ._fir import _cached_weights, _fir_filter
+
+
+@_cached_weights
+def _sinwma_weights(length: int) -> np.ndarray:
+    i = np.arange(1, length + 1, dtype=np.float64)
+    w = np.sin(i * np.pi / (length + 1.0))
+    return w / w.sum()
 
 
 def sinwma(close: pd.Series, length: int = 14) -> pd.Series:
@@ -10,10 +18,5 @@ def sinwma(close: pd.Series, length: int = 14) -> pd.Series:
         raise ValueError("length must be > 0")
 
     close_s = check_series(close, "close")
-    i = np.arange(1, length + 1, dtype=np.float64)
-    w = np.sin(i * np.pi / (length + 1.0))
-    w /= w.sum()
-
-    out = close_s.rolling(length).apply(lambda x: np.dot(x, w), raw=True)
-    out.name = f"SINWMA_{length}"
-    return out
+    out = _fir_filter(close_s.to_numpy(dtype=np.float64), _sinwma_weights(length))
+    return to_series(out, close_s.index, name=f"SINWMA_{length}")
@@ -1,6 +1,9 @@
+from typing import Optional
+
 import pandas as pd
 import numpy as np
-from .._utils import validate_series, to_series
+from numba import njit, prange
+from .._utils import panel_output, stream_output, validate_series, to_series, validate_lengths, validate_panel, validate_values
 
 def sma(close: pd.Series, length: int) -> pd.Series:
     """
@@ -42,3 +45,155 @@ def sma(close: pd.Series, length: int) -> pd.Series:
 
     # 3. Wrap result
     return to_series(result, close.index, name=f"SMA_{length}")
+
+
+@njit
+def _sma_sweep_kernel(values, lengths):
+    """
+    Moving averages for every length off one set of prefix sums.
+
+    The prefix sums are kept as compensated (sum, error) pairs, so a window
+    sum taken as a difference of two prefixes is accurate to rounding however
+    far into the series it lies. Windows holding a missing or infinite value
+    are summed directly, which propagates them as the convolution does.
+    """
+    n = values.shape[0]
+    width = lengths.shape[0]
+
+    prefix = np.zeros(n + 1)
+    error = np.zeros(n + 1)
+    missing = np.zeros(n + 1, dtype=np.int64)
+    total = 0.0
+    comp = 0.0
+    for i in range(n):
+        v = values[i]
+        if np.isfinite(v):
+            t = total + v
+            part = t - total
+            comp += (total - (t - part)) + (v - part)
+            total = t
+            missing[i + 1] = missing[i]
+        else:
+            missing[i + 1] = missing[i] + 1
+        prefix[i + 1] = total
+        error[i + 1] = comp
+
+    out = np.empty((n, width), dtype=np.float64)
+    for i in range(n):
+        for k in range(width):
+            length = lengths[k]
+            start = i + 1 - length
+            if start < 0:
+                out[i, k] = np.nan
+            elif missing[i + 1] == missing[start]:
+                out[i, k] = ((prefix[i + 1] - prefix[start]) + (error[i + 1] - error[start])) / length
+            else:
+                acc = 0.0
+                for j in range(start, i + 1):
+                    acc += values[j]
+                out[i, k] = acc / length
+    return out
+
+
+def sma_sweep(close: pd.Series, lengths) -> pd.DataFrame:
+    """
+    SMA of one series for many lengths in a single pass.
+
+    All lengths share one set of compensated prefix sums, so each value costs
+    O(1) whatever the window. Column ``SMA_{n}`` matches ``sma(close, n)`` to
+    within floating-point rounding, with the same missing values.
+
+    Args:
+        close: Pandas Series of prices.
+        lengths: Sequence of positive integer window lengths.
+
+    Returns:
+        Pandas DataFrame with one 'SMA_{length}' column per length.
+    """
+    lengths = validate_lengths(lengths)
+    values = validate_series(close, "close")
+
+    block = _sma_sweep_kernel(values, lengths)
+    return pd.DataFrame(block, index=close.index, columns=[f"SMA_{n}" for n in lengths.tolist()], copy=False)
+
+
+@njit(parallel=True)
+def _sma_panel_kernel(values, length):
+    """``_sma_sweep_kernel`` of every column of a panel, columns in parallel."""
+    n, width = values.shape
+    lengths = np.full(1, length, dtype=np.int64)
+    out = np.empty((width, n), dtype=np.float64)
+    for k in prange(width):
+        out[k] = _sma_sweep_kernel(values[:, k], lengths)[:, 0]
+    return out.T
+
+
+def sma_panel(close, length: int):
+    """
+    SMA of every symbol of a (bars x symbols) panel.
+
+    Each column is averaged off its own compensated prefix sums, as in
+    ``sma_sweep``, with columns spread over the numba thread pool. Column
+    ``j`` matches ``sma(close[:, j], length)`` to within floating-point
+    rounding, with the same missing values.
+
+    Args:
+        close: 2D NumPy array or wide Pandas DataFrame of prices.
+        length: Number of periods for the window.
+
+    Returns:
+        Panel of the same shape and container as ``close``.
+    """
+    if length <= 0:
+        raise ValueError("length must be > 0")
+
+    values = validate_panel(close, "close")
+    return panel_output(close, _sma_panel_kernel(values, int(length)))
+
+
+class SMAStream:
+    """
+    Streaming Simple Moving Average.
+
+    Keeps the last ``length - 1`` inputs and convolves them with each pushed
+    batch, so every value is bit-for-bit the last row of ``sma(close, length)``
+    on the extended series at O(length) cost per bar.
+
+    Args:
+        close: Optional Pandas Series of past prices to seed the state.
+        length: Number of periods for the window.
+    """
+
+    __slots__ = ("length", "name", "value", "_tail", "_weights")
+
+    def __init__(self, close: Optional[pd.Series], length: int):
+        if length <= 0:
+            raise ValueError("length must be > 0")
+
+        self.length = length
+        self.name = f"SMA_{length}"
+        self.value = np.nan
+        self._tail = np.empty(0, dtype=np.float64)
+        self._weights = np.ones(length) / length
+
+        if close is not None:
+            self.update_many(validate_values(close, "close"))
+
+    def update(self, value: float) -> float:
+        """Push one bar and return its SMA."""
+        return float(self.update_many(np.array([value], dtype=np.float64))[0])
+
+    def update_many(self, values):
+        """Push a batch of bars and return their SMA values (Series in, Series out)."""
+        new = validate_values(values, "values")
+        data = np.concatenate((self._tail, new))
+        out = np.full(new.shape[0], np.nan)
+
+        if data.shape[0] >= self.length:
+            valid = np.convolve(data, self._weights, mode="valid")
+            out[out.shape[0] - valid.shape[0] :] = valid
+
+        self._tail = data[-(self.length - 1) :].copy() if self.length > 1 else data[:0]
+        if out.shape[0]:
+            self.value = float(out[-1])
+        return stream_output(values, out, self.name)
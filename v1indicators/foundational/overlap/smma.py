@@ -1,6 +1,9 @@
+from typing import Optional
+
 import pandas as pd
 
 from .._utils import check_series
+from ._ewm import _EWMStream, _alpha_com
 
 
 def smma(close: pd.Series, length: int = 14) -> pd.Series:
@@ -17,3 +20,20 @@ def smma(close: pd.Series, length: int = 14) -> pd.Series:
     out = close_s.ewm(alpha=1.0 / length, adjust=False).mean()
     out.name = f"SMMA_{length}"
     return out
+
+
+class SMMAStream(_EWMStream):
+    """
+    Streaming counterpart of ``smma``.
+
+    Seeded from an optional history and advanced with ``update`` /
+    ``update_many`` in O(1) per bar; each value equals the last row of
+    ``smma(close, length)`` on the extended series.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, close: Optional[pd.Series], length: int = 14):
+        if length <= 0:
+            raise ValueError("length must be > 0")
+        super().__init__(close, length, _alpha_com(1.0 / length), False, f"SMMA_{length}")
@@ -1,7 +1,15 @@
 import numpy as np
 import pandas as pd
 
-from .._utils import check_series
+from .._utils import check_series, to_series
+from ._fir import _cached_weights, _fir_filter
+
+
+@_cached_weights
+def _swma_weights(length: int) -> np.ndarray:
+    i = np.arange(1, length + 1, dtype=np.float64)
+    w = np.minimum(i, i[::-1])
+    return w / w.sum()
 
 
 def swma(close: pd.Series, length: int = 4) -> pd.Series:
@@ -10,10 +18,5 @@ def swma(close: pd.Series, length: int = 4) -> pd.Series:
         raise ValueError("length must be > 0")
 
     close_s = check_series(close, "close")
-    i = np.arange(1, length + 1, dtype=np.float64)
-    w = np.minimum(i, i[::-1])
-    w /= w.sum()
-
-    out = close_s.rolling(length).apply(lambda x: np.dot(x, w), raw=True)
-    out.name = f"SWMA_{length}"
-    return out
+    out = _fir_filter(close_s.to_numpy(dtype=np.float64), _swma_weights(length))
+    return to_series(out, close_s.index, name=f"SWMA_{length}")
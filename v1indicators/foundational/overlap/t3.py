@@ -1,6 +1,7 @@
 import pandas as pd
 
 from .._utils import check_series
+from ._ewm import _ewm_cascade
 
 
 def t3(close: pd.Series, length: int = 10, factor: float = 0.7) -> pd.Series:
@@ -17,19 +18,16 @@ def t3(close: pd.Series, length: int = 10, factor: float = 0.7) -> pd.Series:
 
     close_s = check_series(close, "close")
 
-    e1 = close_s.ewm(span=length, adjust=False).mean()
-    e2 = e1.ewm(span=length, adjust=False).mean()
-    e3 = e2.ewm(span=length, adjust=False).mean()
-    e4 = e3.ewm(span=length, adjust=False).mean()
-    e5 = e4.ewm(span=length, adjust=False).mean()
-    e6 = e5.ewm(span=length, adjust=False).mean()
-
     a = float(factor)
     c1 = -a**3
     c2 = 3 * a**2 + 3 * a**3
     c3 = -6 * a**2 - 3 * a - 3 * a**3
     c4 = 1 + 3 * a + a**3 + 3 * a**2
 
-    out = c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
-    out.name = f"T3_{length}_{factor}"
-    return out
+    # c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3 over six chained EMAs, in one pass.
+    out = _ewm_cascade(
+        close_s.to_numpy(dtype=float),
+        (length,) * 6,
+        ((5, c1), (4, c2), (3, c3), (2, c4)),
+    )
+    return pd.Series(out, index=close_s.index, name=f"T3_{length}_{factor}")
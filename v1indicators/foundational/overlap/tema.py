@@ -1,6 +1,7 @@
 import pandas as pd
 
 from .._utils import check_series
+from ._ewm import _ewm_cascade
 
 
 def tema(close: pd.Series, length: int = 20) -> pd.Series:
@@ -14,10 +15,9 @@ def tema(close: pd.Series, length: int = 20) -> pd.Series:
         raise ValueError("length must be > 0")
 
     close_s = check_series(close, "close")
-    ema1 = close_s.ewm(span=length, adjust=False).mean()
-    ema2 = ema1.ewm(span=length, adjust=False).mean()
-    ema3 = ema2.ewm(span=length, adjust=False).mean()
-
-    result = 3.0 * ema1 - 3.0 * ema2 + ema3
-    result.name = f"TEMA_{length}"
-    return result
+    result = _ewm_cascade(
+        close_s.to_numpy(dtype=float),
+        (length,) * 3,
+        ((0, 3.0), (1, -3.0), (2, 1.0)),
+    )
+    return pd.Series(result, index=close_s.index, name=f"TEMA_{length}")
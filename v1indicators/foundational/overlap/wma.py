@@ -1,6 +1,21 @@
 import pandas as pd
 import numpy as np
 
+from .._utils import to_series
+from ._fir import _cached_weights, _fir_filter
+
+
+@_cached_weights
+def _wma_weights(length: int) -> np.ndarray:
+    return np.arange(1, length + 1, dtype=np.float64)
+
+
+def _wma_values(values: np.ndarray, length: int) -> np.ndarray:
+    """Linear WMA values aligned to the original input length."""
+    weights = _wma_weights(length)
+    return _fir_filter(values, weights, weights.sum())
+
+
 def wma(close: pd.Series, length: int) -> pd.Series:
     """Weighted Moving Average."""
     if not isinstance(close, pd.Series):
@@ -9,11 +24,4 @@ def wma(close: pd.Series, length: int) -> pd.Series:
     if length <= 0:
         raise ValueError("length must be > 0")
 
-    weights = np.arange(1, length + 1)
-    weights_sum = weights.sum()
-
-    def linear_wma(x):
-        return np.dot(x, weights) / weights_sum
-
-    return close.rolling(length).apply(linear_wma, raw=True)
-
+    return to_series(_wma_values(close.to_numpy(dtype=np.float64), length), close.index, name=close.name)
@@ -1,6 +1,7 @@
 from .entropy import entropy
 from .kurtosis import kurtosis
 from .mad import mad
+from .mean_deviation import mean_deviation
 from .median import median
 from .quantile import quantile
 from .skew import skew
@@ -18,4 +19,5 @@ __all__ = [
     "kurtosis",
     "skew",
     "entropy",
+    "mean_deviation",
 ]
@@ -1,7 +1,13 @@
 import numpy as np
 import pandas as pd
 
-from ..._utils import check_series
+from ..._utils import check_series, to_series
+
+
+def _bernoulli_entropy(p: float, base: float) -> float:
+    p = min(max(p, 1e-12), 1.0 - 1e-12)
+    q = 1.0 - p
+    return -(p * (np.log(p) / np.log(base)) + q * (np.log(q) / np.log(base)))
 
 
 def entropy(close: pd.Series, length: int = 10, base: float = 2.0) -> pd.Series:
@@ -12,14 +18,15 @@ def entropy(close: pd.Series, length: int = 10, base: float = 2.0) -> pd.Series:
         raise ValueError("base must be > 0")
 
     close_s = check_series(close, "close")
-    sign = (close_s.diff() > 0.0).astype(int)
-
-    def _ent(x: np.ndarray) -> float:
-        p = x.mean()
-        p = min(max(p, 1e-12), 1.0 - 1e-12)
-        q = 1.0 - p
-        return -(p * (np.log(p) / np.log(base)) + q * (np.log(q) / np.log(base)))
+    sign = (close_s.diff() > 0.0).to_numpy(dtype=np.int64)
 
-    out = sign.rolling(length).apply(_ent, raw=True)
-    out.name = f"ENTROPY_{length}"
-    return out
+    # The window probability is (up bars) / length, so there are only
+    # length + 1 possible entropies: tabulate them and index by the count.
+    table = np.array([_bernoulli_entropy(np.float64(k) / length, base) for k in range(length + 1)])
+    out = np.full(sign.shape[0], np.nan, dtype=np.float64)
+    if sign.shape[0] >= length:
+        counts = np.cumsum(sign)
+        ups = counts[length - 1 :].copy()
+        ups[1:] -= counts[: -length]
+        out[length - 1 :] = table[ups]
+    return to_series(out, close_s.index, name=f"ENTROPY_{length}")
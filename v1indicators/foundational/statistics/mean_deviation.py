@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from ..._utils import check_series, to_series
+from ._pairwise import _pairwise_sum
+
+
+@njit
+def _rolling_mean_deviation_kernel(values, length):
+    """
+    ``rolling(length).apply(lambda x: np.abs(x - x.mean()).mean())`` without callbacks.
+
+    One scratch buffer is reused for every window and both means use NumPy's
+    pairwise summation, so results are bit-identical to the callback form.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan, dtype=np.float64)
+    dev = np.empty(length, dtype=np.float64)
+
+    last_missing = -1
+    for i in range(n):
+        if not np.isfinite(values[i]):
+            last_missing = i
+        if i < length - 1 or last_missing > i - length:
+            continue
+
+        start = i - length + 1
+        mean = _pairwise_sum(values, start, length) / length
+        for k in range(length):
+            dev[k] = abs(values[start + k] - mean)
+        out[i] = _pairwise_sum(dev, 0, length) / length
+
+    return out
+
+
+def _rolling_mean_deviation(values: np.ndarray, length: int) -> np.ndarray:
+    return _rolling_mean_deviation_kernel(np.ascontiguousarray(values, dtype=np.float64), int(length))
+
+
+def mean_deviation(close: pd.Series, length: int = 20) -> pd.Series:
+    """Mean absolute deviation of each window from its own mean (the CCI denominator)."""
+    if length <= 0:
+        raise ValueError("length must be > 0")
+
+    close_s = check_series(close, "close")
+    out = _rolling_mean_deviation(close_s.to_numpy(dtype=np.float64), length)
+    return to_series(out, close_s.index, name=f"MEANDEV_{length}")
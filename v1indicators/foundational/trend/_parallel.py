@@ -0,0 +1,17 @@
+import numba
+import numpy as np
+from numba import njit
+
+
+def _parallel_blocks(n: int) -> int:
+    """Number of bar blocks a ``parallel=True`` kernel spreads over the thread pool."""
+    return max(1, min(int(n), numba.get_num_threads() * 4))
+
+
+@njit
+def _block_bounds(n, blocks):
+    """Edges of ``blocks`` contiguous, near-equal bar ranges covering ``0 .. n``."""
+    bounds = np.empty(blocks + 1, dtype=np.int64)
+    for b in range(blocks + 1):
+        bounds[b] = (n * b) // blocks
+    return bounds
@@ -1,30 +1,49 @@
 import numpy as np
 import pandas as pd
-from numpy.lib.stride_tricks import sliding_window_view
+from numba import njit
 
 from .._utils import check_series
 
 
+@njit
 def _aroon_component(values: np.ndarray, length: int, use_max: bool) -> np.ndarray:
-    out = np.full(values.shape[0], np.nan, dtype=np.float64)
-
-    if values.shape[0] < length:
-        return out
-
-    windows = sliding_window_view(values, window_shape=length)
-    valid = np.isfinite(windows).all(axis=1)
-
-    aroon_vals = np.full(windows.shape[0], np.nan, dtype=np.float64)
-    if np.any(valid):
-        rev_windows = windows[valid, ::-1]
-        if use_max:
-            periods_since = np.argmax(rev_windows, axis=1).astype(np.float64)
+    """
+    Aroon line over each trailing ``length`` window.
+
+    A monotonic deque tracks the most recent bar holding the window maximum
+    (minimum), so memory is O(length) and runtime O(n). Windows holding a
+    non-finite value are NaN.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan, dtype=np.float64)
+
+    dq = np.empty(length, dtype=np.int64)
+    head = 0
+    size = 0
+    last_missing = -1
+
+    for i in range(n):
+        if size > 0 and dq[head] <= i - length:
+            head = (head + 1) % length
+            size -= 1
+
+        v = values[i]
+        if np.isfinite(v):
+            while size > 0:
+                back = values[dq[(head + size - 1) % length]]
+                if (use_max and back <= v) or (not use_max and back >= v):
+                    size -= 1
+                else:
+                    break
+            dq[(head + size) % length] = i
+            size += 1
         else:
-            periods_since = np.argmin(rev_windows, axis=1).astype(np.float64)
+            last_missing = i
 
-        aroon_vals[valid] = 100.0 * (length - periods_since) / length
+        if i >= length - 1 and last_missing <= i - length:
+            periods_since = float(i - dq[head])
+            out[i] = 100.0 * (length - periods_since) / length
 
-    out[length - 1 :] = aroon_vals
     return out
 
 
@@ -15,8 +15,15 @@ def decay(signal: pd.Series, length: int = 5, mode: str = "linear") -> pd.Series
     trigger = (s > 0.0).astype(float)
 
     if mode == "linear":
+        # The window max of trigger * weight is the weight of the latest
+        # trigger, which decays linearly with its age in bars.
         w = np.linspace(1.0, 0.0, length, endpoint=False)
-        out = trigger.rolling(length).apply(lambda x: np.max(x * w[::-1]), raw=True)
+        bars = np.arange(trigger.shape[0])
+        latest = np.maximum.accumulate(np.where(trigger.to_numpy() > 0.0, bars, -length))
+        age = bars - latest
+        values = np.where(age < length, w[np.minimum(age, length - 1)], 0.0)
+        values[: length - 1] = np.nan
+        out = pd.Series(values, index=trigger.index)
     else:
         alpha = 2.0 / (length + 1.0)
         out = trigger.ewm(alpha=alpha, adjust=False).mean()
@@ -1,72 +1,209 @@
 import numpy as np
 import pandas as pd
-from numba import njit
+from numba import njit, prange
 
 from .._utils import check_series
+from ._parallel import _block_bounds, _parallel_blocks
 
 
 @njit
-def _lorentzian_knn_kernel(
-    f1: np.ndarray,
-    f2: np.ndarray,
-    close_v: np.ndarray,
-    neighbors_count: int,
-    max_bars_back: int,
-    horizon: int,
-    stride: int,
-):
+def _knn_scan(f1, f2, close_v, i, start, neighbors_count, horizon, stride):
+    """Brute-force neighbor vote of bar ``i`` over ``range(start, i, stride)``."""
     n = close_v.shape[0]
-    pred = np.full(n, np.nan, dtype=np.float64)
-    signal = np.zeros(n, dtype=np.int8)
 
-    for i in range(n):
-        if i < horizon or i >= n - horizon:
+    # Keep a small sorted list of nearest neighbors.
+    dists = np.full(neighbors_count, np.inf, dtype=np.float64)
+    labels = np.zeros(neighbors_count, dtype=np.int8)
+
+    for j in range(start, i, stride):
+        if np.isnan(f1[i]) or np.isnan(f2[i]) or np.isnan(f1[j]) or np.isnan(f2[j]):
+            continue
+
+        d = np.log(1.0 + abs(f1[i] - f1[j])) + np.log(1.0 + abs(f2[i] - f2[j]))
+
+        # Label from future move at j.
+        future_idx = j + horizon
+        if future_idx >= n or future_idx > i:
             continue
 
+        lbl = 0
+        if close_v[future_idx] > close_v[j]:
+            lbl = 1
+        elif close_v[future_idx] < close_v[j]:
+            lbl = -1
+
+        # Insert if better than worst neighbor.
+        worst_idx = 0
+        worst_dist = dists[0]
+        for k in range(1, neighbors_count):
+            if dists[k] > worst_dist:
+                worst_dist = dists[k]
+                worst_idx = k
+
+        if d < worst_dist:
+            dists[worst_idx] = d
+            labels[worst_idx] = lbl
+
+    score = 0.0
+    cnt = 0
+    for k in range(neighbors_count):
+        if dists[k] < np.inf:
+            score += labels[k]
+            cnt += 1
+    return score, cnt
+
+
+@njit
+def _knn_label(close_v, j, horizon):
+    future = close_v[j + horizon]
+    if future > close_v[j]:
+        return 1
+    if future < close_v[j]:
+        return -1
+    return 0
+
+
+@njit
+def _index_search(ids, m, f1, key):
+    """First position of the F1-sorted ``ids[:m]`` whose feature is >= ``key``."""
+    lo = 0
+    hi = m
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if f1[ids[mid]] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@njit
+def _knn_block(f1, f2, close_v, lbls, neighbors_count, max_bars_back, horizon, stride, lo, hi, pred, signal):
+    """
+    Nearest-neighbor vote of bars ``lo .. hi - 1``.
+
+    The candidates of bar ``i`` are ``range(start, i, stride)`` with a known
+    label, so each residue class modulo ``stride`` keeps its labelled bars in
+    an index sorted by F1. Bars enter once their horizon has elapsed and
+    leave with the window start. A query walks outward from F1[i] and stops
+    once the F1 term alone exceeds the current k-th distance. When the k-th
+    distance is tied between neighbors of different labels, the vote depends
+    on scan order, and the bar is re-scanned in order.
+    """
+    n = close_v.shape[0]
+    n_cls = min(stride, n)
+    cap = min(n, max_bars_back + 1) // stride + 2
+    ids = np.empty((n_cls, cap), dtype=np.int64)
+    size = np.zeros(n_cls, dtype=np.int64)
+
+    dists = np.empty(neighbors_count, dtype=np.float64)
+    labels = np.empty(neighbors_count, dtype=np.int8)
+    seen_d = np.empty(cap, dtype=np.float64)
+    seen_l = np.empty(cap, dtype=np.int8)
+
+    # Index as it stands after bar lo - 1.
+    prev_start = max(lo - 1 - max_bars_back, horizon)
+    for j in range(prev_start, lo - horizon):
+        if np.isfinite(f1[j]) and np.isfinite(f2[j]):
+            c = j % stride
+            ids[c, size[c]] = j
+            size[c] += 1
+    for c in range(n_cls):
+        m = size[c]
+        order = np.argsort(f1[ids[c, :m]], kind="mergesort")
+        ids[c, :m] = ids[c, :m][order]
+
+    for i in range(lo, hi):
         start = i - max_bars_back
         if start < horizon:
             start = horizon
 
-        # Keep a small sorted list of nearest neighbors.
-        dists = np.full(neighbors_count, np.inf, dtype=np.float64)
-        labels = np.zeros(neighbors_count, dtype=np.int8)
-
-        for j in range(start, i, stride):
-            if np.isnan(f1[i]) or np.isnan(f2[i]) or np.isnan(f1[j]) or np.isnan(f2[j]):
-                continue
-
-            d = np.log(1.0 + abs(f1[i] - f1[j])) + np.log(1.0 + abs(f2[i] - f2[j]))
+        j = i - horizon
+        if j >= horizon and np.isfinite(f1[j]) and np.isfinite(f2[j]):
+            c = j % stride
+            m = size[c]
+            pos = _index_search(ids[c], m, f1, f1[j])
+            for k in range(m, pos, -1):
+                ids[c, k] = ids[c, k - 1]
+            ids[c, pos] = j
+            size[c] = m + 1
+        for j in range(prev_start, start):
+            if j + horizon <= i and np.isfinite(f1[j]) and np.isfinite(f2[j]):
+                c = j % stride
+                m = size[c]
+                pos = _index_search(ids[c], m, f1, f1[j])
+                while ids[c, pos] != j:
+                    pos += 1
+                for k in range(pos, m - 1):
+                    ids[c, k] = ids[c, k + 1]
+                size[c] = m - 1
+        prev_start = start
+        if i < horizon or i >= n - horizon:
+            continue
+        q1 = f1[i]
+        q2 = f2[i]
+        if not (np.isfinite(q1) and np.isfinite(q2)):
+            continue
 
-            # Label from future move at j.
-            future_idx = j + horizon
-            if future_idx >= n or future_idx > i:
-                continue
+        c = start % stride
+        m = size[c]
+        dists[:] = np.inf
+        worst = np.inf
+        n_seen = 0
+        right = _index_search(ids[c], m, f1, q1)
+        left = right - 1
+        while left >= 0 or right < m:
+            if right >= m or (left >= 0 and q1 - f1[ids[c, left]] <= f1[ids[c, right]] - q1):
+                j = ids[c, left]
+                left -= 1
+            else:
+                j = ids[c, right]
+                right += 1
 
-            lbl = 0
-            if close_v[future_idx] > close_v[j]:
-                lbl = 1
-            elif close_v[future_idx] < close_v[j]:
-                lbl = -1
+            d1 = np.log(1.0 + abs(q1 - f1[j]))
+            if d1 > worst:
+                break
+            d = d1 + np.log(1.0 + abs(q2 - f2[j]))
+            seen_d[n_seen] = d
+            seen_l[n_seen] = lbls[j]
+            n_seen += 1
 
-            # Insert if better than worst neighbor.
             worst_idx = 0
-            worst_dist = dists[0]
-            for k in range(1, neighbors_count):
-                if dists[k] > worst_dist:
-                    worst_dist = dists[k]
-                    worst_idx = k
-
-            if d < worst_dist:
+            for t in range(1, neighbors_count):
+                if dists[t] > dists[worst_idx]:
+                    worst_idx = t
+            if d < dists[worst_idx]:
                 dists[worst_idx] = d
-                labels[worst_idx] = lbl
+                labels[worst_idx] = lbls[j]
+                worst = dists[0]
+                for t in range(1, neighbors_count):
+                    if dists[t] > worst:
+                        worst = dists[t]
 
         score = 0.0
         cnt = 0
-        for k in range(neighbors_count):
-            if dists[k] < np.inf:
-                score += labels[k]
+        for t in range(neighbors_count):
+            if dists[t] < np.inf:
+                score += labels[t]
                 cnt += 1
 
+        if cnt == neighbors_count:
+            kept = 0
+            for t in range(neighbors_count):
+                if dists[t] == worst:
+                    kept += 1
+            tied = 0
+            mixed = False
+            first = 0
+            for t in range(n_seen):
+                if seen_d[t] == worst:
+                    if tied > 0 and seen_l[t] != first:
+                        mixed = True
+                    first = seen_l[t]
+                    tied += 1
+            if mixed and tied > kept:
+                score, cnt = _knn_scan(f1, f2, close_v, i, start, neighbors_count, horizon, stride)
+
         if cnt > 0:
             pred[i] = score
             if score > 0:
@@ -74,6 +211,72 @@ def _lorentzian_knn_kernel(
             elif score < 0:
                 signal[i] = -1
 
+
+
+@njit
+def _knn_labels(close_v, horizon):
+    n = close_v.shape[0]
+    lbls = np.zeros(n, dtype=np.int8)
+    for j in range(n - horizon):
+        lbls[j] = _knn_label(close_v, j, horizon)
+    return lbls
+
+
+@njit
+def _lorentzian_knn_kernel(
+    f1: np.ndarray,
+    f2: np.ndarray,
+    close_v: np.ndarray,
+    neighbors_count: int,
+    max_bars_back: int,
+    horizon: int,
+    stride: int,
+):
+    n = close_v.shape[0]
+    pred = np.full(n, np.nan, dtype=np.float64)
+    signal = np.zeros(n, dtype=np.int8)
+    if n == 0:
+        return pred, signal
+
+    lbls = _knn_labels(close_v, horizon)
+    _knn_block(f1, f2, close_v, lbls, neighbors_count, max_bars_back, horizon, stride, 0, n, pred, signal)
+    return pred, signal
+
+
+@njit(parallel=True)
+def _lorentzian_knn_parallel_kernel(
+    f1: np.ndarray,
+    f2: np.ndarray,
+    close_v: np.ndarray,
+    neighbors_count: int,
+    max_bars_back: int,
+    horizon: int,
+    stride: int,
+    blocks: int,
+):
+    n = close_v.shape[0]
+    pred = np.full(n, np.nan, dtype=np.float64)
+    signal = np.zeros(n, dtype=np.int8)
+    if n == 0:
+        return pred, signal
+
+    lbls = _knn_labels(close_v, horizon)
+    bounds = _block_bounds(n, blocks)
+    for b in prange(blocks):
+        _knn_block(
+            f1,
+            f2,
+            close_v,
+            lbls,
+            neighbors_count,
+            max_bars_back,
+            horizon,
+            stride,
+            bounds[b],
+            bounds[b + 1],
+            pred,
+            signal,
+        )
     return pred, signal
 
 
@@ -85,6 +288,7 @@ def lorentzian_knn(
     stride: int = 4,
     feature_fast: int = 5,
     feature_slow: int = 14,
+    parallel: bool = False,
 ) -> pd.DataFrame:
     """
     Lorentzian-distance KNN directional classifier.
@@ -96,6 +300,9 @@ def lorentzian_knn(
     Only historical examples whose horizon label is already known at the
     current bar are allowed into the neighbor set. This avoids leaking
     future labels from bars beyond the current index.
+
+    With `parallel=True` blocks of bars are classified on all numba threads;
+    the output is identical to the serial run.
     """
     if neighbors_count <= 0:
         raise ValueError("neighbors_count must be > 0")
@@ -113,7 +320,7 @@ def lorentzian_knn(
     f1 = close_s.pct_change(feature_fast)
     f2 = close_s.pct_change().rolling(feature_slow).mean()
 
-    pred, sig = _lorentzian_knn_kernel(
+    args = (
         f1.to_numpy(dtype=np.float64),
         f2.to_numpy(dtype=np.float64),
         close_s.to_numpy(dtype=np.float64),
@@ -122,6 +329,10 @@ def lorentzian_knn(
         int(horizon),
         int(stride),
     )
+    if parallel:
+        pred, sig = _lorentzian_knn_parallel_kernel(*args, _parallel_blocks(len(close_s)))
+    else:
+        pred, sig = _lorentzian_knn_kernel(*args)
 
     return pd.DataFrame(
         {
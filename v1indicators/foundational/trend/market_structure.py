@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 from numba import njit
 
+from .._pivots import _swing_pivots
 from .._utils import check_series
 
 
@@ -74,12 +75,8 @@ def market_structure(
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
-    window = left + right + 1
-    roll_max = high_s.rolling(window).max().shift(-right)
-    roll_min = low_s.rolling(window).min().shift(-right)
-
-    pivot_high = high_s.where(high_s == roll_max)
-    pivot_low = low_s.where(low_s == roll_min)
+    pivot_high = _swing_pivots(high_s, left, right, find_high=True)
+    pivot_low = _swing_pivots(low_s, left, right, find_high=False)
 
     resistance = pivot_high.ffill()
     support = pivot_low.ffill()
@@ -1,92 +1,175 @@
+from typing import NamedTuple, Optional
+
 import pandas as pd
 import numpy as np
 from numba import njit
 from .._utils import check_series
 
+
+class PSARState(NamedTuple):
+    """Carry state returned by ``psar(..., return_state=True)``."""
+
+    acceleration: float
+    maximum: float
+    seen: int
+    bull: bool
+    ep: float
+    af: float
+    psar: float
+    high_1: float
+    high_2: float
+    low_1: float
+    low_2: float
+
+
 @njit
-def _psar_kernel(high_v, low_v, acceleration, maximum):
+def _psar_kernel(
+    high_v,
+    low_v,
+    acceleration,
+    maximum,
+    seen=0,
+    bull=True,
+    ep=np.nan,
+    af=np.nan,
+    prev_psar=np.nan,
+    high_1=np.nan,
+    high_2=np.nan,
+    low_1=np.nan,
+    low_2=np.nan,
+):
     length = len(high_v)
     psar_v = np.full(length, np.nan)
     psar_dir = np.zeros(length, dtype=np.int8)  # 1 for bull, -1 for bear
-    
-    if length < 2:
-        return psar_v, psar_dir
 
-    # Initial values
-    bull = True
-    
-    # Starting point
-    if high_v[1] > high_v[0] or low_v[1] > low_v[0]:
-        bull = True
-        psar_v[1] = low_v[0]
-        ep = high_v[1]
-    else:
-        bull = False
-        psar_v[1] = high_v[0]
-        ep = low_v[1]
-        
-    af = acceleration
-    psar_dir[1] = 1 if bull else -1
-    
-    for i in range(2, length):
-        # Calculate PSAR for current bar
-        prev_psar = psar_v[i-1]
-        psar_v[i] = prev_psar + af * (ep - prev_psar)
-        
-        # Ensure PSAR doesn't enter the previous two bars' range
-        if bull:
-            if psar_v[i] > low_v[i] or psar_v[i] > low_v[i-1]:
-                # Switch to Bear
-                bull = False
-                psar_v[i] = ep  # New PSAR is the previous EP
-                ep = low_v[i]
-                af = acceleration
-            else:
-                # Continue Bull
-                if high_v[i] > ep:
-                    ep = high_v[i]
-                    af = min(af + acceleration, maximum)
-                # Cap PSAR so it's not higher than previous lows
-                psar_v[i] = min(psar_v[i], low_v[i-1], low_v[i-2])
-        else:
-            if psar_v[i] < high_v[i] or psar_v[i] < high_v[i-1]:
-                # Switch to Bull
+    for j in range(length):
+        i = seen + j
+        high_i = high_v[j]
+        low_i = low_v[j]
+
+        if i == 1:
+            # Starting point
+            if high_i > high_1 or low_i > low_1:
                 bull = True
-                psar_v[i] = ep
-                ep = high_v[i]
-                af = acceleration
+                psar_v[j] = low_1
+                ep = high_i
+            else:
+                bull = False
+                psar_v[j] = high_1
+                ep = low_i
+
+            af = acceleration
+            psar_dir[j] = 1 if bull else -1
+
+        elif i >= 2:
+            # Calculate PSAR for current bar
+            psar_v[j] = prev_psar + af * (ep - prev_psar)
+
+            # Ensure PSAR doesn't enter the previous two bars' range
+            if bull:
+                if psar_v[j] > low_i or psar_v[j] > low_1:
+                    # Switch to Bear
+                    bull = False
+                    psar_v[j] = ep  # New PSAR is the previous EP
+                    ep = low_i
+                    af = acceleration
+                else:
+                    # Continue Bull
+                    if high_i > ep:
+                        ep = high_i
+                        af = min(af + acceleration, maximum)
+                    # Cap PSAR so it's not higher than previous lows
+                    psar_v[j] = min(psar_v[j], low_1, low_2)
             else:
-                # Continue Bear
-                if low_v[i] < ep:
-                    ep = low_v[i]
-                    af = min(af + acceleration, maximum)
-                # Cap PSAR so it's not lower than previous highs
-                psar_v[i] = max(psar_v[i], high_v[i-1], high_v[i-2])
-                
-        psar_dir[i] = 1 if bull else -1
-        
-    return psar_v, psar_dir
+                if psar_v[j] < high_i or psar_v[j] < high_1:
+                    # Switch to Bull
+                    bull = True
+                    psar_v[j] = ep
+                    ep = high_i
+                    af = acceleration
+                else:
+                    # Continue Bear
+                    if low_i < ep:
+                        ep = low_i
+                        af = min(af + acceleration, maximum)
+                    # Cap PSAR so it's not lower than previous highs
+                    psar_v[j] = max(psar_v[j], high_1, high_2)
+
+            psar_dir[j] = 1 if bull else -1
+
+        if i >= 1:
+            prev_psar = psar_v[j]
+        high_2 = high_1
+        high_1 = high_i
+        low_2 = low_1
+        low_1 = low_i
+
+    return (
+        psar_v,
+        psar_dir,
+        seen + length,
+        bull,
+        ep,
+        af,
+        prev_psar,
+        high_1,
+        high_2,
+        low_1,
+        low_2,
+    )
+
 
 def psar(
     high: pd.Series,
     low: pd.Series,
     acceleration: float = 0.02,
     maximum: float = 0.2,
-) -> pd.DataFrame:
+    state: Optional[PSARState] = None,
+    return_state: bool = False,
+):
     """
     Parabolic Stop and Reverse (PSAR). (Numba Optimized)
     
     A trend-following indicator that uses an accelerating factor to trail stops.
+
+    Pass the ``state`` returned by a previous call with ``return_state=True``
+    to continue on the bars that follow it without recomputing the history;
+    the call then returns a ``(DataFrame, PSARState)`` tuple.
     """
     high_s = check_series(high, "high")
     low_s = check_series(low, "low")
     
     high_v = high_s.to_numpy()
     low_v = low_s.to_numpy()
+
+    if state is None:
+        carry = ()
+    elif state.acceleration != acceleration or state.maximum != maximum:
+        raise ValueError("state was produced with a different acceleration/maximum")
+    else:
+        carry = tuple(state[2:])
     
-    psar_v, psar_dir = _psar_kernel(high_v, low_v, acceleration, maximum)
+    psar_v, psar_dir, *final = _psar_kernel(high_v, low_v, acceleration, maximum, *carry)
 
-    return pd.DataFrame({
+    result = pd.DataFrame({
         "PSAR": psar_v,
         "PSAR_DIR": psar_dir
     }, index=high_s.index)
+
+    if not return_state:
+        return result
+
+    seen, bull, ep, af, prev_psar, high_1, high_2, low_1, low_2 = final
+    return result, PSARState(
+        acceleration,
+        maximum,
+        int(seen),
+        bool(bull),
+        ep,
+        af,
+        prev_psar,
+        high_1,
+        high_2,
+        low_1,
+        low_2,
+    )
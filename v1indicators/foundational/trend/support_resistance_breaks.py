@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 
+from .._pivots import _swing_pivots
 from .._utils import check_series
 
 
@@ -36,9 +37,8 @@ def support_resistance_breaks(
     close_s = check_series(close, "close")
     volume_s = check_series(volume, "volume")
 
-    window = left + right + 1
-    pivot_high = high_s.where(high_s == high_s.rolling(window).max().shift(-right))
-    pivot_low = low_s.where(low_s == low_s.rolling(window).min().shift(-right))
+    pivot_high = _swing_pivots(high_s, left, right, find_high=True)
+    pivot_low = _swing_pivots(low_s, left, right, find_high=False)
 
     resistance = pivot_high.ffill()
     support = pivot_low.ffill()
@@ -1,59 +1,124 @@
 import numpy as np
 import pandas as pd
-from numba import njit
+from numba import njit, prange
 
+from .._pivots import _swing_pivots
 from .._utils import check_series
+from ._parallel import _block_bounds, _parallel_blocks
 
 
 @njit
-def _sr_channels_kernel(
-    close_v: np.ndarray,
-    pivot_v: np.ndarray,
-    width_v: np.ndarray,
-    loopback: int,
-    min_strength: int,
+def _sr_neighbor_count(sorted_v, m, p, w):
+    """Number of window pivots ``q`` with ``abs(q - p) <= w``.
+
+    ``abs(q - p)`` is monotone on each side of ``p``, so the neighbors form a
+    contiguous run of ``sorted_v[:m]`` whose ends are found by bisection.
+    """
+    if not np.isfinite(p):
+        cnt = 0
+        for k in range(m):
+            if abs(sorted_v[k] - p) <= w:
+                cnt += 1
+        return cnt
+
+    pos = np.searchsorted(sorted_v[:m], p)
+
+    lo = pos
+    hi = m - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if sorted_v[mid] - p <= w:
+            lo = mid
+        else:
+            hi = mid - 1
+    upper = lo
+
+    lo = 0
+    hi = pos
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if p - sorted_v[mid] <= w:
+            hi = mid
+        else:
+            lo = mid + 1
+    return upper - lo + 1
+
+
+@njit
+def _sr_pivots(pivot_v):
+    """Bar indices and values of the pivots, in time order."""
+    n = pivot_v.shape[0]
+    piv_idx = np.empty(n, dtype=np.int64)
+    piv_val = np.empty(n, dtype=np.float64)
+    n_piv = 0
+    for j in range(n):
+        if not np.isnan(pivot_v[j]):
+            piv_idx[n_piv] = j
+            piv_val[n_piv] = pivot_v[j]
+            n_piv += 1
+    return piv_idx[:n_piv], piv_val[:n_piv]
+
+
+@njit
+def _sr_levels_block(
+    close_v, piv_idx, piv_val, width_v, loopback, min_strength, lo, hi, resistance, support, strength_res, strength_sup
 ):
-    n = close_v.shape[0]
-    resistance = np.full(n, np.nan, dtype=np.float64)
-    support = np.full(n, np.nan, dtype=np.float64)
-    strength_res = np.zeros(n, dtype=np.int32)
-    strength_sup = np.zeros(n, dtype=np.int32)
-    break_res = np.zeros(n, dtype=np.bool_)
-    break_sup = np.zeros(n, dtype=np.bool_)
+    """
+    Channel levels of bars ``lo .. hi - 1``.
 
-    for i in range(n):
-        w = width_v[i]
-        if np.isnan(w) or w <= 0.0 or np.isnan(close_v[i]):
-            continue
+    Each bar only depends on the pivots of its own window, so blocks of bars
+    can be filled independently.
+    """
+    n_piv = piv_idx.shape[0]
+
+    # Pivots of the current window, in time order and kept sorted.
+    sorted_v = np.empty(max(min(n_piv, loopback + 1), 1), dtype=np.float64)
+    m = 0
+    head = np.searchsorted(piv_idx, max(lo - loopback, 0))
+    tail = head
 
+    for i in range(lo, hi):
         start = i - loopback
         if start < 0:
             start = 0
 
+        # Evict before inserting so the buffer never holds more than the
+        # ``loopback + 1`` bars of one window.
+        while head < tail and piv_idx[head] < start:
+            pos = np.searchsorted(sorted_v[:m], piv_val[head])
+            sorted_v[pos : m - 1] = sorted_v[pos + 1 : m].copy()
+            m -= 1
+            head += 1
+        while tail < n_piv and piv_idx[tail] <= i:
+            v = piv_val[tail]
+            pos = np.searchsorted(sorted_v[:m], v)
+            sorted_v[pos + 1 : m + 1] = sorted_v[pos:m].copy()
+            sorted_v[pos] = v
+            m += 1
+            tail += 1
+
+        w = width_v[i]
+        if np.isnan(w) or w <= 0.0 or np.isnan(close_v[i]):
+            continue
+
         best_res_level = np.nan
         best_sup_level = np.nan
         best_res_strength = 0
         best_sup_strength = 0
 
         # Candidate pivots are recent pivots only.
-        for j in range(start, i + 1):
-            p = pivot_v[j]
-            if np.isnan(p):
+        for j in range(head, tail):
+            p = piv_val[j]
+            cnt = _sr_neighbor_count(sorted_v, m, p, w)
+            if cnt < min_strength or cnt <= min(best_res_strength, best_sup_strength):
                 continue
 
-            cnt = 0
             acc = 0.0
-            for k in range(start, i + 1):
-                q = pivot_v[k]
-                if np.isnan(q):
-                    continue
+            for k in range(head, tail):
+                q = piv_val[k]
                 if abs(q - p) <= w:
-                    cnt += 1
                     acc += q
 
-            if cnt < min_strength:
-                continue
-
             level = acc / cnt
 
             if level >= close_v[i]:
@@ -70,14 +135,86 @@ def _sr_channels_kernel(
         strength_res[i] = best_res_strength
         strength_sup[i] = best_sup_strength
 
-        if i > 0 and not np.isnan(resistance[i - 1]) and not np.isnan(close_v[i - 1]):
+
+@njit
+def _sr_breaks(close_v, width_v, resistance, support):
+    """
+    Closes crossing the previous bar's levels. Bars without levels of their
+    own (missing or non-positive width, missing close) are not tested.
+    """
+    n = close_v.shape[0]
+    break_res = np.zeros(n, dtype=np.bool_)
+    break_sup = np.zeros(n, dtype=np.bool_)
+    for i in range(1, n):
+        w = width_v[i]
+        if np.isnan(w) or w <= 0.0 or np.isnan(close_v[i]):
+            continue
+
+        if not np.isnan(resistance[i - 1]) and not np.isnan(close_v[i - 1]):
             if close_v[i - 1] <= resistance[i - 1] and close_v[i] > resistance[i - 1]:
                 break_res[i] = True
 
-        if i > 0 and not np.isnan(support[i - 1]) and not np.isnan(close_v[i - 1]):
+        if not np.isnan(support[i - 1]) and not np.isnan(close_v[i - 1]):
             if close_v[i - 1] >= support[i - 1] and close_v[i] < support[i - 1]:
                 break_sup[i] = True
+    return break_res, break_sup
+
+
+@njit
+def _sr_channels_kernel(
+    close_v: np.ndarray,
+    pivot_v: np.ndarray,
+    width_v: np.ndarray,
+    loopback: int,
+    min_strength: int,
+):
+    n = close_v.shape[0]
+    resistance = np.full(n, np.nan, dtype=np.float64)
+    support = np.full(n, np.nan, dtype=np.float64)
+    strength_res = np.zeros(n, dtype=np.int32)
+    strength_sup = np.zeros(n, dtype=np.int32)
+
+    piv_idx, piv_val = _sr_pivots(pivot_v)
+    _sr_levels_block(
+        close_v, piv_idx, piv_val, width_v, loopback, min_strength, 0, n, resistance, support, strength_res, strength_sup
+    )
+    break_res, break_sup = _sr_breaks(close_v, width_v, resistance, support)
+    return resistance, support, strength_res, strength_sup, break_res, break_sup
+
+
+@njit(parallel=True)
+def _sr_channels_parallel_kernel(
+    close_v: np.ndarray,
+    pivot_v: np.ndarray,
+    width_v: np.ndarray,
+    loopback: int,
+    min_strength: int,
+    blocks: int,
+):
+    n = close_v.shape[0]
+    resistance = np.full(n, np.nan, dtype=np.float64)
+    support = np.full(n, np.nan, dtype=np.float64)
+    strength_res = np.zeros(n, dtype=np.int32)
+    strength_sup = np.zeros(n, dtype=np.int32)
 
+    piv_idx, piv_val = _sr_pivots(pivot_v)
+    bounds = _block_bounds(n, blocks)
+    for b in prange(blocks):
+        _sr_levels_block(
+            close_v,
+            piv_idx,
+            piv_val,
+            width_v,
+            loopback,
+            min_strength,
+            bounds[b],
+            bounds[b + 1],
+            resistance,
+            support,
+            strength_res,
+            strength_sup,
+        )
+    break_res, break_sup = _sr_breaks(close_v, width_v, resistance, support)
     return resistance, support, strength_res, strength_sup, break_res, break_sup
 
 
@@ -89,6 +226,7 @@ def support_resistance_channels(
     channel_width_pct: float = 5.0,
     min_strength: int = 2,
     loopback: int = 290,
+    parallel: bool = False,
 ) -> pd.DataFrame:
     """
     Support/Resistance channels from pivot clustering.
@@ -98,6 +236,9 @@ def support_resistance_channels(
 
     This is a retrospective pivot-based indicator: pivot anchors are only
     confirmed after `pivot_period` future bars.
+
+    With `parallel=True` blocks of bars are computed on all numba threads;
+    the output is identical to the serial run.
     """
     if pivot_period <= 0:
         raise ValueError("pivot_period must be > 0")
@@ -112,9 +253,8 @@ def support_resistance_channels(
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
-    window = 2 * pivot_period + 1
-    pivot_high = high_s.where(high_s == high_s.rolling(window).max().shift(-pivot_period))
-    pivot_low = low_s.where(low_s == low_s.rolling(window).min().shift(-pivot_period))
+    pivot_high = _swing_pivots(high_s, pivot_period, pivot_period, find_high=True)
+    pivot_low = _swing_pivots(low_s, pivot_period, pivot_period, find_high=False)
 
     pivot_values = pivot_high.copy()
     pivot_values = pivot_values.where(pivot_values.notna(), pivot_low)
@@ -122,13 +262,18 @@ def support_resistance_channels(
     range300 = (high_s.rolling(300).max() - low_s.rolling(300).min())
     width = range300 * (channel_width_pct / 100.0)
 
-    resistance, support, strength_res, strength_sup, break_res, break_sup = _sr_channels_kernel(
+    args = (
         close_s.to_numpy(dtype=np.float64),
         pivot_values.to_numpy(dtype=np.float64),
         width.to_numpy(dtype=np.float64),
         int(loopback),
         int(min_strength),
     )
+    if parallel:
+        kernel_out = _sr_channels_parallel_kernel(*args, _parallel_blocks(len(close_s)))
+    else:
+        kernel_out = _sr_channels_kernel(*args)
+    resistance, support, strength_res, strength_sup, break_res, break_sup = kernel_out
 
     return pd.DataFrame(
         {
@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 
 from .._utils import check_series
+from ..volatility.true_range import _true_range
 
 
 def vortex(high: pd.Series, low: pd.Series, close: pd.Series, length: int = 14) -> pd.DataFrame:
@@ -16,11 +17,7 @@ def vortex(high: pd.Series, low: pd.Series, close: pd.Series, length: int = 14)
     vm_plus = (high_s - low_s.shift(1)).abs()
     vm_minus = (low_s - high_s.shift(1)).abs()
 
-    prev_close = close_s.shift(1)
-    tr = pd.concat(
-        [high_s - low_s, (high_s - prev_close).abs(), (low_s - prev_close).abs()],
-        axis=1,
-    ).max(axis=1).replace(0.0, np.nan)
+    tr = _true_range(high_s, low_s, close_s).replace(0.0, np.nan)
 
     vi_plus = vm_plus.rolling(length).sum() / tr.rolling(length).sum()
     vi_minus = vm_minus.rolling(length).sum() / tr.rolling(length).sum()
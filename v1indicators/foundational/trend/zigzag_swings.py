@@ -1,45 +1,33 @@
 import numpy as np
 import pandas as pd
-from numba import njit
+from numba import njit, prange
 
+from .._pivots import _pivot_block
 from .._utils import check_series
+from ._parallel import _block_bounds, _parallel_blocks
 
 
 @njit
-def _zigzag_swings_kernel(high_v: np.ndarray, low_v: np.ndarray, length: int):
+def _zigzag_extrema_block(high_v, low_v, valid, length, lo, hi, is_max, is_min):
+    """Local-extremum flags of bars ``lo .. hi - 1``; bars that are not ``valid`` are ignored."""
+    _pivot_block(high_v, valid, length, length, True, False, lo, hi, is_max)
+    _pivot_block(low_v, valid, length, length, False, False, lo, hi, is_min)
+
+
+@njit
+def _zigzag_swings_from_extrema(high_v, low_v, length, is_max, is_min):
     n = high_v.shape[0]
     swing_high = np.full(n, np.nan, dtype=np.float64)
     swing_low = np.full(n, np.nan, dtype=np.float64)
     trend = np.zeros(n, dtype=np.int8)
 
-    if n == 0 or n < 2 * length + 1:
-        return swing_high, swing_low, trend
-
     cur_trend = 0
     for i in range(length, n - length):
-        h = high_v[i]
-        low_i = low_v[i]
-        if np.isnan(h) or np.isnan(low_i):
-            trend[i] = cur_trend
-            continue
-
-        local_max = True
-        local_min = True
-        for j in range(i - length, i + length + 1):
-            if np.isnan(high_v[j]) or np.isnan(low_v[j]):
-                continue
-            if high_v[j] > h:
-                local_max = False
-            if low_v[j] < low_i:
-                local_min = False
-            if not local_max and not local_min:
-                break
-
-        if local_max:
-            swing_high[i] = h
+        if is_max[i]:
+            swing_high[i] = high_v[i]
             cur_trend = -1
-        elif local_min:
-            swing_low[i] = low_i
+        elif is_min[i]:
+            swing_low[i] = low_v[i]
             cur_trend = 1
 
         trend[i] = cur_trend
@@ -52,17 +40,45 @@ def _zigzag_swings_kernel(high_v: np.ndarray, low_v: np.ndarray, length: int):
     return swing_high, swing_low, trend
 
 
+@njit
+def _zigzag_swings_kernel(high_v: np.ndarray, low_v: np.ndarray, length: int):
+    n = high_v.shape[0]
+    is_max = np.zeros(n, dtype=np.bool_)
+    is_min = np.zeros(n, dtype=np.bool_)
+    valid = ~(np.isnan(high_v) | np.isnan(low_v))
+    if n >= 2 * length + 1:
+        _zigzag_extrema_block(high_v, low_v, valid, length, length, n - length, is_max, is_min)
+    return _zigzag_swings_from_extrema(high_v, low_v, length, is_max, is_min)
+
+
+@njit(parallel=True)
+def _zigzag_swings_parallel_kernel(high_v: np.ndarray, low_v: np.ndarray, length: int, blocks: int):
+    n = high_v.shape[0]
+    is_max = np.zeros(n, dtype=np.bool_)
+    is_min = np.zeros(n, dtype=np.bool_)
+    valid = ~(np.isnan(high_v) | np.isnan(low_v))
+    if n >= 2 * length + 1:
+        bounds = _block_bounds(n - 2 * length, blocks)
+        for b in prange(blocks):
+            _zigzag_extrema_block(
+                high_v, low_v, valid, length, length + bounds[b], length + bounds[b + 1], is_max, is_min
+            )
+    return _zigzag_swings_from_extrema(high_v, low_v, length, is_max, is_min)
+
+
 def zigzag_swings(
     high: pd.Series,
     low: pd.Series,
     length: int = 9,
+    parallel: bool = False,
 ) -> pd.DataFrame:
     """
     ZigZag swing points and directional state.
 
     Uses local extrema over a symmetric lookback/lookforward window.
     Swing labels are therefore retrospective and only confirmed after `length`
-    future bars.
+    future bars. With `parallel=True` the extremum search runs on all numba
+    threads; the output is identical to the serial run.
     """
     if length <= 0:
         raise ValueError("length must be > 0")
@@ -70,11 +86,11 @@ def zigzag_swings(
     high_s = check_series(high, "high")
     low_s = check_series(low, "low")
 
-    swing_high, swing_low, trend = _zigzag_swings_kernel(
-        high_s.to_numpy(dtype=np.float64),
-        low_s.to_numpy(dtype=np.float64),
-        int(length),
-    )
+    args = (high_s.to_numpy(dtype=np.float64), low_s.to_numpy(dtype=np.float64), int(length))
+    if parallel:
+        swing_high, swing_low, trend = _zigzag_swings_parallel_kernel(*args, _parallel_blocks(len(high_s)))
+    else:
+        swing_high, swing_low, trend = _zigzag_swings_kernel(*args)
 
     return pd.DataFrame(
         {
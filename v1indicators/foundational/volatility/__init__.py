@@ -1,4 +1,4 @@
-from .atr import atr
+from .atr import ATRStream, atr, atr_panel, atr_sweep
 from .chop import chop
 from .massi import massi
 from .pdist import pdist
@@ -18,4 +18,7 @@ __all__ = [
     "pdist",
     "thermo",
     "chop",
+    "ATRStream",
+    "atr_sweep",
+    "atr_panel",
 ]
@@ -1,5 +1,12 @@
+from typing import Optional
+
+import numpy as np
 import pandas as pd
-from ..._utils import check_series
+from numba import njit, prange
+from ..._utils import check_series, panel_output, stream_output, validate_lengths, validate_panel, validate_values
+from ..overlap._ewm import _EWMMean, _ewm_input, _ewm_sweep, _ewm_sweep_kernel, _span_com
+from ..overlap._rolling import _RollingMean, _rolling_mean_sweep_kernel
+from .true_range import _true_range, _true_range_kernel, _true_range_value
 
 def atr(
     high: pd.Series,
@@ -38,15 +45,12 @@ def atr(
     low = check_series(low, "low")
     close = check_series(close, "close")
 
-    prev_close = close.shift(drift)
+    tr = _true_range(high, low, close, drift)
+    return _atr_from_tr(tr, length, mamode)
 
-    # Calculate True Range
-    tr1 = high - low
-    tr2 = (high - prev_close).abs()
-    tr3 = (low - prev_close).abs()
-    
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
 
+def _atr_from_tr(tr: pd.Series, length: int, mamode: str = "ema") -> pd.Series:
+    """ATR averaging of a precomputed true range (see ``_true_range``)."""
     min_periods = length
     mode = mamode.lower() if mamode else "ema"
     if mode == "sma":
@@ -56,3 +60,197 @@ def atr(
 
     result.name = f"ATR_{length}"
     return result
+
+
+def atr_sweep(
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
+    lengths,
+    mamode: str = "ema",
+    drift: int = 1,
+) -> pd.DataFrame:
+    """
+    ATR for many lengths in a single pass.
+
+    True range is computed once; every length's smoothing then advances inside
+    one compiled loop that fills the (bars x lengths) output block. Column
+    ``ATR_{n}`` equals ``atr(high, low, close, n, mamode, drift)``.
+
+    Args:
+        high: Pandas Series of high prices.
+        low: Pandas Series of low prices.
+        close: Pandas Series of close prices.
+        lengths: Sequence of positive integer smoothing periods.
+        mamode: "ema" (default) or "sma", as in ``atr``.
+        drift: Previous-close offset (default 1).
+
+    Returns:
+        Pandas DataFrame with one 'ATR_{length}' column per length.
+    """
+    lengths = validate_lengths(lengths)
+    if drift <= 0:
+        raise ValueError("drift must be > 0")
+
+    high = check_series(high, "high")
+    low = check_series(low, "low")
+    close = check_series(close, "close")
+
+    tr = _ewm_input(_true_range(high, low, close, drift).to_numpy())
+    mode = mamode.lower() if mamode else "ema"
+    if mode == "sma":
+        block = _rolling_mean_sweep_kernel(tr, lengths)
+    else:
+        block = _ewm_sweep(tr, [_span_com(n) for n in lengths.tolist()], True, lengths)
+
+    return pd.DataFrame(block, index=close.index, columns=[f"ATR_{n}" for n in lengths.tolist()], copy=False)
+
+
+@njit(parallel=True)
+def _atr_panel_kernel(high, low, close, length, drift, use_sma):
+    """
+    True range and its ATR smoothing for every column of a panel, columns in
+    parallel; each column runs the kernels of ``atr_sweep`` for one length.
+    """
+    n, width = close.shape
+    lengths = np.full(1, length, dtype=np.int64)
+    coms = np.full(1, (length - 1) / 2)
+    out = np.empty((width, n), dtype=np.float64)
+    for k in prange(width):
+        tr = _true_range_kernel(high[:, k], low[:, k], close[:, k], drift)
+        for i in range(n):
+            if np.isinf(tr[i]):
+                tr[i] = np.nan
+        if use_sma:
+            out[k] = _rolling_mean_sweep_kernel(tr, lengths)[:, 0]
+        else:
+            out[k] = _ewm_sweep_kernel(tr, coms, True, lengths)[:, 0]
+    return out.T
+
+
+def atr_panel(high, low, close, length: int = 14, mamode: str = "ema", drift: int = 1):
+    """
+    ATR of every symbol of a (bars x symbols) panel.
+
+    True range and its smoothing run per column, in parallel, in one compiled
+    kernel, each column with its own NaN warmup. Column ``j`` equals
+    ``atr(high[:, j], low[:, j], close[:, j], length, mamode, drift)``.
+
+    Args:
+        high: 2D NumPy array or wide Pandas DataFrame of high prices.
+        low: Same-shaped panel of low prices.
+        close: Same-shaped panel of close prices.
+        length: Smoothing period (default 14).
+        mamode: "ema" (default) or "sma", as in ``atr``.
+        drift: Previous-close offset (default 1).
+
+    Returns:
+        Panel of the same shape and container as ``close``.
+    """
+    if length <= 0:
+        raise ValueError("length must be > 0")
+    if drift <= 0:
+        raise ValueError("drift must be > 0")
+
+    high_v = validate_panel(high, "high")
+    low_v = validate_panel(low, "low")
+    close_v = validate_panel(close, "close")
+    if not high_v.shape == low_v.shape == close_v.shape:
+        raise ValueError("high, low and close must have the same shape")
+
+    mode = mamode.lower() if mamode else "ema"
+    block = _atr_panel_kernel(high_v, low_v, close_v, int(length), int(drift), mode == "sma")
+    return panel_output(close, block)
+
+
+@njit
+def _true_range_stream_kernel(high, low, close, prev_close, seen):
+    """True range with a ring buffer of the last ``drift`` closes carried between calls."""
+    n = close.shape[0]
+    drift = prev_close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+
+    for i in range(n):
+        slot = seen[0] % drift
+        pc = prev_close[slot]
+        prev_close[slot] = close[i]
+        seen[0] += 1
+        out[i] = _true_range_value(high[i], low[i], pc)
+
+    return out
+
+
+class ATRStream:
+    """
+    Streaming Average True Range.
+
+    Seeded from a history, then advanced with ``update`` / ``update_many`` in
+    O(1) per bar. Each value is bit-for-bit the last row of
+    ``atr(high, low, close, length, mamode, drift)`` on the extended series.
+
+    Args:
+        high: Optional Pandas Series of past high prices.
+        low: Optional Pandas Series of past low prices.
+        close: Optional Pandas Series of past close prices.
+        length: Smoothing period (default 14).
+        mamode: "ema" (default) or "sma", as in ``atr``.
+        drift: Previous-close offset (default 1).
+    """
+
+    __slots__ = ("length", "name", "value", "_prev_close", "_seen", "_ma")
+
+    def __init__(
+        self,
+        high: Optional[pd.Series] = None,
+        low: Optional[pd.Series] = None,
+        close: Optional[pd.Series] = None,
+        length: int = 14,
+        mamode: str = "ema",
+        drift: int = 1,
+    ):
+        if length <= 0:
+            raise ValueError("length must be > 0")
+        if drift <= 0:
+            raise ValueError("drift must be > 0")
+
+        self.length = length
+        self.name = f"ATR_{length}"
+        self.value = np.nan
+        self._prev_close = np.full(drift, np.nan, dtype=np.float64)
+        self._seen = np.zeros(1, dtype=np.int64)
+
+        mode = mamode.lower() if mamode else "ema"
+        if mode == "sma":
+            self._ma = _RollingMean(length, length)
+        else:
+            self._ma = _EWMMean(_span_com(length), True, length)
+
+        history = (high, low, close)
+        if any(part is not None for part in history):
+            if any(part is None for part in history):
+                raise ValueError("high, low and close must be given together")
+            self.update_many(high, low, close)
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """Push one bar and return its ATR."""
+        return float(
+            self.update_many(
+                np.array([high], dtype=np.float64),
+                np.array([low], dtype=np.float64),
+                np.array([close], dtype=np.float64),
+            )[0]
+        )
+
+    def update_many(self, high, low, close):
+        """Push a batch of bars and return their ATR values (Series in, Series out)."""
+        high_v = validate_values(high, "high")
+        low_v = validate_values(low, "low")
+        close_v = validate_values(close, "close")
+        if not (high_v.shape[0] == low_v.shape[0] == close_v.shape[0]):
+            raise ValueError("high, low and close must have the same length")
+
+        tr = _true_range_stream_kernel(high_v, low_v, close_v, self._prev_close, self._seen)
+        out = self._ma.update_many(tr)
+        if out.shape[0]:
+            self.value = float(out[-1])
+        return stream_output(close, out, self.name)
@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 
 from ..._utils import check_series
+from .true_range import _true_range
 
 
 def chop(high: pd.Series, low: pd.Series, close: pd.Series, length: int = 14) -> pd.Series:
@@ -13,12 +14,11 @@ def chop(high: pd.Series, low: pd.Series, close: pd.Series, length: int = 14) ->
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
-    prev_close = close_s.shift(1)
-    tr = pd.concat(
-        [high_s - low_s, (high_s - prev_close).abs(), (low_s - prev_close).abs()],
-        axis=1,
-    ).max(axis=1)
+    return _chop_from_tr(high_s, low_s, _true_range(high_s, low_s, close_s), length)
 
+
+def _chop_from_tr(high_s: pd.Series, low_s: pd.Series, tr: pd.Series, length: int) -> pd.Series:
+    """Choppiness Index of validated series given their precomputed true range."""
     atr_sum = tr.rolling(length).sum()
     hh = high_s.rolling(length).max()
     ll = low_s.rolling(length).min()
@@ -1,18 +1,52 @@
+import numpy as np
 import pandas as pd
+from numba import njit
 
 from ..._utils import check_series
 
 
+@njit
+def _true_range_value(high, low, prev_close):
+    """Row-wise NaN-skipping max of the three true-range candidates."""
+    tr = np.nan
+    for v in (high - low, abs(high - prev_close), abs(low - prev_close)):
+        if not np.isnan(v) and (np.isnan(tr) or v > tr):
+            tr = v
+    return tr
+
+
+@njit
+def _true_range_kernel(high, low, close, drift):
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        prev_close = close[i - drift] if i >= drift else np.nan
+        out[i] = _true_range_value(high[i], low[i], prev_close)
+    return out
+
+
+def _true_range(high_s: pd.Series, low_s: pd.Series, close_s: pd.Series, drift: int = 1) -> pd.Series:
+    """
+    Unnamed true range of validated series against the close ``drift`` bars back.
+
+    Shared by every indicator built on true range, so composites can compute it
+    once and hand it to each consumer.
+    """
+    tr = _true_range_kernel(
+        high_s.to_numpy(dtype=np.float64),
+        low_s.to_numpy(dtype=np.float64),
+        close_s.to_numpy(dtype=np.float64),
+        int(drift),
+    )
+    return pd.Series(tr, index=close_s.index)
+
+
 def true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
     """True Range using high, low, and previous close."""
     high_s = check_series(high, "high")
     low_s = check_series(low, "low")
     close_s = check_series(close, "close")
 
-    prev_close = close_s.shift(1)
-    tr = pd.concat(
-        [high_s - low_s, (high_s - prev_close).abs(), (low_s - prev_close).abs()],
-        axis=1,
-    ).max(axis=1)
+    tr = _true_range(high_s, low_s, close_s)
     tr.name = "TRUERANGE_1"
     return tr
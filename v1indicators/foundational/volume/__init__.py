@@ -6,7 +6,7 @@ from .delta_volume import delta_volume
 from .efi import efi
 from .eom import eom
 from .nvi import nvi
-from .obv import obv
+from .obv import obv, obv_panel
 from .pvi import pvi
 from .pvo import pvo
 from .pvol import pvol
@@ -15,7 +15,7 @@ from .pvt import pvt
 from .vfi import vfi
 from .vp import vp
 from .vpt import vpt
-from .vwap import vwap
+from .vwap import VWAPStream, vwap
 
 __all__ = [
     "obv",
@@ -36,4 +36,6 @@ __all__ = [
     "pvr",
     "pvt",
     "vp",
+    "VWAPStream",
+    "obv_panel",
 ]
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
-from .._utils import check_series
+from numba import njit, prange
+from .._utils import check_series, panel_output, validate_panel
 
 def obv(close: pd.Series, volume: pd.Series) -> pd.Series:
     """On-Balance Volume (OBV)."""
@@ -15,3 +16,47 @@ def obv(close: pd.Series, volume: pd.Series) -> pd.Series:
     obv_val.name = "OBV"
     return obv_val
 
+
+@njit(parallel=True)
+def _obv_panel_kernel(close, volume):
+    """OBV of every column of a panel, columns in parallel."""
+    n, width = close.shape
+    out = np.empty((width, n), dtype=np.float64)
+    for k in prange(width):
+        # Same running sum as pandas' cumsum: starts from the first term and
+        # adds 0.0 in place of a missing one.
+        total = -0.0
+        for i in range(n):
+            direction = np.sign(close[i, k] - close[i - 1, k]) if i > 0 else np.nan
+            if np.isnan(direction):
+                direction = 0.0
+            signed = volume[i, k] * direction
+            if np.isnan(signed):
+                total += 0.0
+                out[k, i] = np.nan
+            else:
+                total += signed
+                out[k, i] = total
+    return out.T
+
+
+def obv_panel(close, volume):
+    """
+    OBV of every symbol of a (bars x symbols) panel.
+
+    Column ``j`` equals ``obv(close[:, j], volume[:, j])``; columns are
+    accumulated in parallel by one compiled kernel.
+
+    Args:
+        close: 2D NumPy array or wide Pandas DataFrame of prices.
+        volume: Same-shaped panel of volumes.
+
+    Returns:
+        Panel of the same shape and container as ``close``.
+    """
+    close_v = validate_panel(close, "close")
+    volume_v = validate_panel(volume, "volume")
+    if close_v.shape != volume_v.shape:
+        raise ValueError("close and volume must have the same shape")
+
+    return panel_output(close, _obv_panel_kernel(close_v, volume_v))
@@ -1,6 +1,9 @@
+from typing import Optional
+
 import pandas as pd
 import numpy as np
-from .._utils import check_series
+from numba import njit
+from .._utils import check_series, stream_output, validate_values
 
 def vwap(
     high: pd.Series,
@@ -26,3 +29,78 @@ def vwap(
     
     return vwap_val
 
+
+@njit
+def _vwap_stream_kernel(high, low, close, volume, sums):
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+
+    for i in range(n):
+        vol = volume[i]
+        pv = (high[i] + low[i] + close[i]) / 3.0 * vol
+
+        # Cumulative sums skip NaN but still report NaN on that bar.
+        if not np.isnan(vol):
+            sums[0] += vol
+        if not np.isnan(pv):
+            sums[1] += pv
+
+        if np.isnan(vol) or np.isnan(pv) or sums[0] == 0.0:
+            out[i] = np.nan
+        else:
+            out[i] = sums[1] / sums[0]
+
+    return out
+
+
+class VWAPStream:
+    """
+    Streaming cumulative VWAP.
+
+    Carries the running volume and price-volume sums, so each pushed bar costs
+    O(1) and equals the last row of ``vwap`` on the extended series.
+    """
+
+    __slots__ = ("name", "value", "_sums")
+
+    def __init__(
+        self,
+        high: Optional[pd.Series] = None,
+        low: Optional[pd.Series] = None,
+        close: Optional[pd.Series] = None,
+        volume: Optional[pd.Series] = None,
+    ):
+        self.name = "VWAP"
+        self.value = np.nan
+        self._sums = np.zeros(2, dtype=np.float64)
+
+        history = (high, low, close, volume)
+        if any(part is not None for part in history):
+            if any(part is None for part in history):
+                raise ValueError("high, low, close and volume must be given together")
+            self.update_many(high, low, close, volume)
+
+    def update(self, high: float, low: float, close: float, volume: float) -> float:
+        """Push one bar and return its VWAP."""
+        return float(
+            self.update_many(
+                np.array([high], dtype=np.float64),
+                np.array([low], dtype=np.float64),
+                np.array([close], dtype=np.float64),
+                np.array([volume], dtype=np.float64),
+            )[0]
+        )
+
+    def update_many(self, high, low, close, volume):
+        """Push a batch of bars and return their VWAP values (Series in, Series out)."""
+        high_v = validate_values(high, "high")
+        low_v = validate_values(low, "low")
+        close_v = validate_values(close, "close")
+        volume_v = validate_values(volume, "volume")
+        if not (high_v.shape[0] == low_v.shape[0] == close_v.shape[0] == volume_v.shape[0]):
+            raise ValueError("high, low, close and volume must have the same length")
+
+        out = _vwap_stream_kernel(high_v, low_v, close_v, volume_v, self._sums)
+        if out.shape[0]:
+            self.value = float(out[-1])
+        return stream_output(close, out, self.name)
@@ -1,3 +1,3 @@
-from ..foundational.levels import equal_highs_lows, fibonacci, pivot_points, support_resistance
+from ..foundational.levels import equal_highs_lows, fibonacci, pivot_cache, pivot_points, support_resistance
 
-__all__ = ["fibonacci", "pivot_points", "support_resistance", "equal_highs_lows"]
+__all__ = ["fibonacci", "pivot_points", "support_resistance", "equal_highs_lows", "pivot_cache"]
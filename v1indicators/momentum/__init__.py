@@ -1,4 +1,5 @@
 from ..derived.momentum import (
+    MACDStream,
     directional_logistic_oscillator,
     inertia,
     macd,
@@ -12,6 +13,7 @@ from ..derived.momentum import (
     stochrsi,
 )
 from ..foundational.momentum import (
+    RSIStream,
     ao,
     apo,
     bias,
@@ -39,6 +41,8 @@ from ..foundational.momentum import (
     qstick,
     roc,
     rsi,
+    rsi_panel,
+    rsi_sweep,
     rvgi,
     slope,
     smi,
@@ -109,4 +113,8 @@ __all__ = [
     "qqe",
     "rsx",
     "directional_logistic_oscillator",
+    "RSIStream",
+    "MACDStream",
+    "rsi_sweep",
+    "rsi_panel",
 ]
@@ -1,11 +1,18 @@
 from ..derived.overlap import aberration, fibonacci_bbands, keltner, ma, multi_ma
 from ..foundational.overlap import (
+    EMAStream,
+    RMAStream,
+    SMAStream,
+    SMMAStream,
     accbands,
     alma,
     bbands,
+    bbands_sweep,
     dema,
     donchian,
     ema,
+    ema_panel,
+    ema_sweep,
     fwma,
     ha,
     hilo,
@@ -25,6 +32,8 @@ from ..foundational.overlap import (
     rma,
     sinwma,
     sma,
+    sma_panel,
+    sma_sweep,
     smma,
     ssf,
     swma,
@@ -87,4 +96,13 @@ __all__ = [
     "ma",
     "ssf",
     "fibonacci_bbands",
+    "EMAStream",
+    "RMAStream",
+    "SMMAStream",
+    "SMAStream",
+    "ema_sweep",
+    "sma_sweep",
+    "bbands_sweep",
+    "ema_panel",
+    "sma_panel",
 ]
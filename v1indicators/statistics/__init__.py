@@ -1,3 +1,3 @@
-from ..foundational.statistics import entropy, kurtosis, mad, median, quantile, skew, stdev, variance, zscore
+from ..foundational.statistics import entropy, kurtosis, mad, mean_deviation, median, quantile, skew, stdev, variance, zscore
 
-__all__ = ["stdev", "variance", "zscore", "median", "quantile", "mad", "kurtosis", "skew", "entropy"]
+__all__ = ["stdev", "variance", "zscore", "median", "quantile", "mad", "kurtosis", "skew", "entropy", "mean_deviation"]
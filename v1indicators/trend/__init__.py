@@ -1,6 +1,11 @@
 from ..derived.trend import (
+    ADXStream,
+    DualScoreSignalsStream,
+    PrecisionConfluenceStream,
+    SupertrendGrid,
     adx,
     cksp,
+    feature_cache,
     direction_regime,
     dual_score_signals,
     ema_rsi_signal,
@@ -9,6 +14,7 @@ from ..derived.trend import (
     precision_confluence,
     range_filter_confluence,
     supertrend,
+    supertrend_grid,
     swing_trend_entry,
     trendline_breaks,
     ut_bot,
@@ -43,6 +49,7 @@ from ..foundational.trend import (
 __all__ = [
     "adx",
     "supertrend",
+    "supertrend_grid",
     "psar",
     "aroon",
     "aroon_up",
@@ -78,4 +85,9 @@ __all__ = [
     "precision_confluence",
     "htf_reversal_divergence",
     "range_filter_confluence",
+    "ADXStream",
+    "PrecisionConfluenceStream",
+    "DualScoreSignalsStream",
+    "SupertrendGrid",
+    "feature_cache",
 ]
@@ -1,4 +1,4 @@
 from ..derived.volatility import hwc, natr
-from ..foundational.volatility import atr, chop, massi, pdist, rvi, thermo, true_range, ui, williams_vix_fix
+from ..foundational.volatility import ATRStream, atr, atr_panel, atr_sweep, chop, massi, pdist, rvi, thermo, true_range, ui, williams_vix_fix
 
-__all__ = ["atr", "williams_vix_fix", "natr", "true_range", "ui", "massi", "rvi", "pdist", "thermo", "chop", "hwc"]
+__all__ = ["atr", "williams_vix_fix", "natr", "true_range", "ui", "massi", "rvi", "pdist", "thermo", "chop", "hwc", "ATRStream", "atr_sweep", "atr_panel"]
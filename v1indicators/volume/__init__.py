@@ -1,5 +1,5 @@
 from ..derived.volume import aobv, swing_leg_profile
-from ..foundational.volume import ad, adl, adosc, cmf, delta_volume, efi, eom, nvi, obv, pvi, pvo, pvol, pvr, pvt, vfi, vp, vpt, vwap
+from ..foundational.volume import VWAPStream, ad, adl, adosc, cmf, delta_volume, efi, eom, nvi, obv, obv_panel, pvi, pvo, pvol, pvr, pvt, vfi, vp, vpt, vwap
 
 __all__ = [
     "obv",
@@ -22,4 +22,6 @@ __all__ = [
     "vp",
     "aobv",
     "swing_leg_profile",
+    "VWAPStream",
+    "obv_panel",
 ]